@@ -16,6 +16,7 @@ Options:
 """
 
 import click
+import itertools
 import json
 from ..client._collections import Collections
 
@@ -612,33 +613,17 @@ def _bulk_delete_collection_assets(search_client, entity_client, collection_name
 
 
 def _get_collection_asset_guids(search_client, collection_name, limit):
-    """Collect asset GUIDs for a collection using search paging."""
+    """Collect asset GUIDs for a collection using continuation-token paging."""
     guids = []
-    offset = 0
-    page_size = 100
-
-    while len(guids) < limit:
-        request_payload = {
-            "keywords": None,
-            "limit": min(page_size, limit - len(guids)),
-            "offset": offset,
-            "filter": {"collectionId": collection_name},
-        }
-
-        response = search_client.searchQuery({"--payload": json.dumps(request_payload)})
-        entities = response.get("value", []) if isinstance(response, dict) else []
-        if not entities:
-            break
-
-        for entity in entities:
-            guid = entity.get("id") or entity.get("guid")
-            if guid:
-                guids.append(str(guid))
-
-        if len(entities) < request_payload["limit"]:
-            break
-
-        offset += request_payload["limit"]
+    results = search_client.iter_search(
+        filter={"collectionId": collection_name},
+        page_size=min(1000, max(1, limit)),
+        keywords=None,
+    )
+    for entity in itertools.islice(results, limit):
+        guid = entity.get("id") or entity.get("guid")
+        if guid:
+            guids.append(str(guid))
 
     # Preserve order while removing duplicates
     unique_guids = list(dict.fromkeys(guids))
@@ -807,7 +792,7 @@ def _delete_entities_with_relationship_cleanup(entity_client, relationship_clien
     "--limit",
     type=int,
     default=1000,
-    help="Maximum number of assets to retrieve per collection (default: 1000)"
+    help="Maximum number of assets to retrieve per collection (default: 1000; larger values page with continuation tokens)"
 )
 def resources(collection_name, format, output_json, sort_by, asset_types, data_source, limit):
     """List assets in collections with filtering options"""
@@ -879,24 +864,31 @@ def resources(collection_name, format, output_json, sort_by, asset_types, data_s
                 else:
                     filter_dict = {"collectionId": coll_name}
 
-                # Fetch up to 1000 assets per collection (API limit)
-                search_args = {
-                    '--filter': json.dumps(filter_dict),
-                    '--limit': min(1000, limit)
-                }
-                
-                search_result = search_client.searchQuery(search_args)
-                
-                if isinstance(search_result, dict):
-                    entities = search_result.get('value', [])
-                elif isinstance(search_result, list):
-                    entities = search_result
+                if limit <= 1000:
+                    # A single page covers the requested limit
+                    search_args = {
+                        '--filter': json.dumps(filter_dict),
+                        '--limit': limit
+                    }
+                    
+                    search_result = search_client.searchQuery(search_args)
+                    
+                    if isinstance(search_result, dict):
+                        entities = search_result.get('value', [])
+                    elif isinstance(search_result, list):
+                        entities = search_result
+                    else:
+                        entities = []
+                    
+                    # Warn if we hit the limit
+                    if len(entities) == limit:
+                        click.echo(f"   [WARN] Retrieved {limit} assets (--limit). Collection may contain more; raise --limit to page through all of them.", err=True)
                 else:
-                    entities = []
-                
-                # Warn if we hit the limit
-                if len(entities) == 1000:
-                    click.echo(f"   [WARN] Retrieved 1000 assets (API limit). Collection may contain more.", err=True)
+                    # Beyond one page, follow continuation tokens instead of offsets
+                    entities = list(itertools.islice(
+                        search_client.iter_search(filter=filter_dict, page_size=1000),
+                        limit,
+                    ))
                 
                 # Apply client-side filter only for data source (assetType field)
                 # since it's not a standard API filter
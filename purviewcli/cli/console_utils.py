@@ -11,7 +11,7 @@ import sys
 from rich.console import Console
 
 
-def get_console() -> Console:
+def get_console(stderr: bool = False) -> Console:
     """
     Create a Rich Console with smart terminal detection.
     
@@ -22,9 +22,13 @@ def get_console() -> Console:
     - Disables colors when output is piped/redirected
     - Windows PowerShell compatible (no raw ANSI escape codes)
     
+    Args:
+        stderr: Write to stderr instead of stdout (keeps machine-readable stdout clean)
+    
     Returns:
         Console: Configured Rich Console instance
     """
     force_terminal = os.getenv("FORCE_COLOR") == "1"
-    no_color = os.getenv("NO_COLOR") == "1" or not sys.stdout.isatty()
-    return Console(force_terminal=force_terminal, no_color=no_color, legacy_windows=False)
+    stream = sys.stderr if stderr else sys.stdout
+    no_color = os.getenv("NO_COLOR") == "1" or not stream.isatty()
+    return Console(force_terminal=force_terminal, no_color=no_color, legacy_windows=False, stderr=stderr)
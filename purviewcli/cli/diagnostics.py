@@ -32,20 +32,28 @@ def cache_stats(ctx, json_output):
     Diagnostics include:
     - Active client instances by profile
     - Query cache hit rate and entries
+    - Access token cache state
+    - Persistent HTTP response cache (opt-in, PURVIEW_HTTP_CACHE=true)
     - Memory usage estimates
     """
     try:
         from purviewcli.client.client_cache import cache_stats as client_cache_stats
         from purviewcli.client.query_cache import get_read_query_cache
+        from purviewcli.client.token_cache import get_token_cache
+        from purviewcli.client.http_cache import get_http_cache
 
         client_stats = client_cache_stats()
         query_cache = get_read_query_cache()
         query_stats = query_cache.stats()
+        token_stats = get_token_cache().stats()
+        http_stats = get_http_cache().stats()
 
         if json_output:
             stats = {
                 "client_cache": client_stats,
                 "query_cache": query_stats,
+                "token_cache": token_stats,
+                "http_cache": http_stats,
             }
             print(json.dumps(stats, indent=2))
         else:
@@ -67,6 +75,22 @@ def cache_stats(ctx, json_output):
                 table2.add_row(key.replace("_", " ").title(), str(value))
             console.print(table2)
 
+            # Token cache stats
+            table3 = Table(title="Access Token Cache")
+            table3.add_column("Metric", style="cyan")
+            table3.add_column("Value", style="green")
+            for key, value in token_stats.items():
+                table3.add_row(key.replace("_", " ").title(), str(value))
+            console.print(table3)
+
+            # Persistent HTTP response cache stats
+            table4 = Table(title="Persistent HTTP Response Cache")
+            table4.add_column("Metric", style="cyan")
+            table4.add_column("Value", style="green")
+            for key, value in http_stats.items():
+                table4.add_row(key.replace("_", " ").title(), str(value))
+            console.print(table4)
+
             console.print("\n[dim]Cache helps reduce:[/dim]")
             console.print("  - Credential initialization overhead")
             console.print("  - API round-trip latency for repeated queries")
@@ -97,7 +121,8 @@ def profile_info(ctx):
 @click.pass_context
 def clear_cache(ctx, confirm):
     """
-    Clear all cached client instances and query results.
+    Clear all cached client instances, query results, access tokens,
+    discovered account IDs and persisted HTTP responses.
     
     Use this if you encounter stale data or want to reset optimizations.
     """
@@ -109,11 +134,17 @@ def clear_cache(ctx, confirm):
 
         from purviewcli.client.client_cache import clear_client_cache
         from purviewcli.client.query_cache import get_read_query_cache
+        from purviewcli.client.token_cache import get_token_cache
+        from purviewcli.client.account_cache import clear_account_cache
+        from purviewcli.client.http_cache import get_http_cache
 
         profile = ctx.obj.get("profile", "default")
         clear_client_cache(profile=profile)
         query_cache = get_read_query_cache()
         query_cache.clear()
+        get_token_cache().clear()
+        clear_account_cache()
+        get_http_cache().clear()
 
         console.print(f"[green][OK] Cache cleared for profile '{profile}'[/green]")
 
@@ -2640,12 +2640,16 @@ def read_sample(ctx, guid):
 @entity.command()
 @click.option("--csv-file", required=True, type=click.Path(exists=True), help="CSV file with GUID and classificationName columns")
 @click.option("--batch-size", default=100, help="Batch size for API calls")
+@click.option("--error-csv", type=click.Path(), help="CSV file to write failed rows (optional)")
 @click.pass_context
-def bulk_classify_csv(ctx, csv_file, batch_size):
-    """Bulk classify entities from a CSV file (guid, classificationName columns)"""
-    import pandas as pd
-    import tempfile
+def bulk_classify_csv(ctx, csv_file, batch_size, error_csv):
+    """Bulk classify entities from a CSV file (guid, classificationName columns)
+
+    The CSV is streamed in --batch-size chunks, so memory use does not grow
+    with the file size.
+    """
     from purviewcli.client._entity import Entity
+    from purviewcli.client.csv_stream import ErrorCsvWriter, iter_csv_batches, read_csv_preview
     try:
         if ctx.obj.get("mock"):
             console.print("[yellow][MOCK] entity bulk-classify-csv command[/yellow]")
@@ -2653,49 +2657,47 @@ def bulk_classify_csv(ctx, csv_file, batch_size):
             console.print("[green][OK] Mock entity bulk-classify-csv completed successfully[/green]")
             return
 
-        df = pd.read_csv(csv_file)
-        if "guid" not in df.columns or "classificationName" not in df.columns:
+        columns = read_csv_preview(csv_file, rows=0).columns
+        if "guid" not in columns or "classificationName" not in columns:
             console.print("[red][X] CSV must contain 'guid' and 'classificationName' columns[/red]")
             return
         entity_client = Entity()
-        total = len(df)
         success, failed = 0, 0
         errors = []
-        for i in range(0, total, batch_size):
-            batch = df.iloc[i:i+batch_size]
+        error_writer = ErrorCsvWriter(error_csv)
+        for batch_no, batch in enumerate(iter_csv_batches(csv_file, batch_size), 1):
             payload = {
                 "entities": [
                     {
-                        "guid": str(row["guid"]),
-                        "classifications": [{"typeName": str(row["classificationName"])}]
+                        "guid": str(guid),
+                        "classifications": [{"typeName": str(classification)}]
                     }
-                    for _, row in batch.iterrows()
+                    for guid, classification in zip(
+                        batch["guid"].tolist(), batch["classificationName"].tolist()
+                    )
                 ]
             }
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmpf:
-                import json
-                json.dump(payload, tmpf, indent=2)
-                tmpf.flush()
-                payload_file = tmpf.name
             try:
-                args = {"--payloadFile": payload_file}
+                # Hand the payload over in memory; it is serialized once on the wire
+                args = {"--payloadFile": payload}
                 result = entity_client.entityBulkClassification(args)
                 if result and (not isinstance(result, dict) or result.get("status") != "error"):
                     success += len(batch)
                 else:
                     failed += len(batch)
-                    errors.append(f"Batch {i//batch_size+1}: {result}")
+                    errors.append(f"Batch {batch_no}: {result}")
+                    error_writer.write(batch)
             except Exception as e:
                 failed += len(batch)
-                errors.append(f"Batch {i//batch_size+1}: {str(e)}")
-            finally:
-                import os
-                os.remove(payload_file)
+                errors.append(f"Batch {batch_no}: {str(e)}")
+                error_writer.write(batch)
         console.print(f"[green][OK] Bulk classification completed. Success: {success}, Failed: {failed}[/green]")
         if errors:
             console.print("[red]Errors:[/red]")
             for err in errors:
                 console.print(f"[red]- {err}[/red]")
+        if error_writer.rows_written:
+            console.print(f"[yellow]WARNING: Failed rows written to {error_csv}[/yellow]")
     except Exception as e:
         console.print(f"[red][X] Error executing entity bulk-classify-csv: {str(e)}[/red]")
 
@@ -2707,6 +2709,13 @@ def bulk_classify_csv(ctx, csv_file, batch_size):
 @click.option("--csv-file", required=True, type=click.Path(exists=True), help="CSV file with entity attributes (typeName, qualifiedName, ...)")
 @click.option("--batch-size", default=100, help="Batch size for API calls")
 @click.option("--throttle-ms", default=0, type=int, help="Delay between batches in milliseconds")
+@click.option(
+    "--max-parallel",
+    default=1,
+    type=click.IntRange(1, 20),
+    show_default=True,
+    help="Number of bulk requests kept in flight (pipelined mode when > 1)",
+)
 @click.option("--max-retries", default=3, type=int, help="Max retry attempts per batch on API failure")
 @click.option("--retry-backoff-ms", default=1000, type=int, help="Base retry backoff delay in milliseconds")
 @click.option(
@@ -2717,6 +2726,9 @@ def bulk_classify_csv(ctx, csv_file, batch_size):
 )
 @click.option("--dry-run", is_flag=True, help="Preview entities to be created without making changes")
 @click.option("--error-csv", type=click.Path(), help="CSV file to write failed rows (optional)")
+@click.option("--journal", type=click.Path(dir_okay=False), help="Write-ahead journal (JSONL) recording every batch so the job can be resumed")
+@click.option("--resume", "resume_journal", type=click.Path(exists=True, dir_okay=False), help="Resume the job recorded in this journal, skipping completed batches")
+@click.option("--retry-failed", is_flag=True, help="With --resume, also re-run batches that failed")
 @click.option("--debug", is_flag=True, help="Enable debug mode for detailed logging")
 @click.pass_context
 def bulk_create_csv(
@@ -2724,11 +2736,15 @@ def bulk_create_csv(
     csv_file,
     batch_size,
     throttle_ms,
+    max_parallel,
     max_retries,
     retry_backoff_ms,
     retry_mode,
     dry_run,
     error_csv,
+    journal,
+    resume_journal,
+    retry_failed,
     debug,
 ):
     """Bulk create entities from a CSV file with support for custom attributes and classifications.
@@ -2744,26 +2760,38 @@ def bulk_create_csv(
     azure_datalake_gen2_path,//myaccount/container/path,My Path,INTERNAL,Engineering
 
         \b
-    Preset configurations:
-            Fast:
-                --batch-size 100 --throttle-ms 50 --max-retries 3 --retry-backoff-ms 1000 --retry-mode fixed
-            Balanced:
-                --batch-size 50 --throttle-ms 200 --max-retries 4 --retry-backoff-ms 1500 --retry-mode exponential
-            Safe:
-                --batch-size 25 --throttle-ms 500 --max-retries 5 --retry-backoff-ms 2000 --retry-mode exponential
+    Throttling:
+            HTTP 429/503 responses are retried after their Retry-After delay by the
+            shared adaptive throttle, which lowers concurrency when the service pushes
+            back and ramps it up again on success. No preset tuning is needed;
+            --throttle-ms only adds a fixed pause between batches.
 
         \b
     Quick tuning:
-            Increase throughput: increase --batch-size or lower --throttle-ms
+            Increase throughput: increase --batch-size, lower --throttle-ms or raise --max-parallel
             Reduce throttling: lower --batch-size or increase --throttle-ms
+
+        \b
+    Pipelined mode:
+            --max-parallel N keeps N bulk requests in flight while the next batches
+            are being mapped. Retries, --error-csv and failure reports stay per batch
+            and in CSV order.
+
+        \b
+    Resumable jobs:
+            --journal job.jsonl records each batch's row range, status and returned
+            GUIDs as it runs. After an interruption, rerun the same command with
+            --resume job.jsonl to skip completed batches; add --retry-failed to
+            re-send batches that failed.
     """
-    import pandas as pd
-    import tempfile
-    import os
     import json
     import time
-    from purviewcli.client._entity import Entity, map_flat_entity_to_purview_entity
+    from purviewcli.client._entity import Entity, compile_entity_column_plan
+    from purviewcli.client.bulk_executor import run_batches
+    from purviewcli.client.bulk_journal import csv_job_params, extract_guids, open_journal, row_range_key, row_ranges
+    from purviewcli.client.csv_stream import ErrorCsvWriter, iter_csv_batches, read_csv_preview
     
+    job_journal = None
     try:
         if ctx.obj.get("mock"):
             console.print("[yellow][MOCK] entity bulk-create-csv command[/yellow]")
@@ -2779,38 +2807,44 @@ def bulk_create_csv(
             console.print(f"[cyan][DEBUG] Retry Backoff (ms): {retry_backoff_ms}[/cyan]")
             console.print(f"[cyan][DEBUG] Retry Mode: {retry_mode}[/cyan]")
 
-        df = pd.read_csv(csv_file)
+        # Only the header and first row are read up front; rows are streamed per batch
+        preview = read_csv_preview(csv_file)
         
         # Detect classification columns
         classification_columns = [
-            col for col in ["classification", "classificationName"] if col in df.columns
+            col for col in ["classification", "classificationName"] if col in preview.columns
         ]
         
         # Debug: Show CSV structure
         if debug:
             console.print("[cyan][DEBUG] CSV Structure:[/cyan]")
             try:
-                console.print(f"  Columns: {__builtins__['list'](df.columns)}")
-                console.print(f"  Total rows: {len(df)}")
+                console.print(f"  Columns: {__builtins__['list'](preview.columns)}")
                 if classification_columns:
                     console.print(
                         f"  Classification columns: {classification_columns}"
                     )
                 console.print("\n[cyan][DEBUG] First row data:[/cyan]")
-                if len(df) > 0:
-                    console.print(df.iloc[0].to_dict())
+                if len(preview) > 0:
+                    console.print(preview.iloc[0].to_dict())
             except Exception as e:
                 console.print(f"[red][DEBUG ERROR: {e}][/red]")
         
-        if "typeName" not in df.columns or "qualifiedName" not in df.columns:
+        if "typeName" not in preview.columns or "qualifiedName" not in preview.columns:
             console.print("[red][X] CSV must contain at least 'typeName' and 'qualifiedName' columns[/red]")
             return
         
         entity_client = Entity()
-        total = len(df)
-        success, failed = 0, 0
+        success, failed, skipped = 0, 0, 0
         errors = []
-        failed_rows = []
+        error_writer = ErrorCsvWriter(error_csv)
+        if not dry_run:
+            job_journal = open_journal(
+                journal, resume_journal, "entity bulk-create-csv", csv_job_params(csv_file, batch_size)
+            )
+        if resume_journal and job_journal is not None:
+            # Keep earlier failures only for batches this run does not replay
+            error_writer.restore(csv_file, job_journal.error_row_ranges(retry_failed))
 
         def _call_bulk_with_retry(args, batch_label):
             last_error = None
@@ -2843,88 +2877,120 @@ def bulk_create_csv(
                 raise last_error
             raise RuntimeError(f"{batch_label} failed without exception details")
         
-        for i in range(0, total, batch_size):
-            batch = df.iloc[i:i+batch_size]
-            
-            # Map each row to the correct Purview entity format (with custom attributes support)
-            entities = []
-            for _, row in batch.iterrows():
-                entity = map_flat_entity_to_purview_entity(row, debug=debug)
-                entities.append(entity)
-            
-            payload = {"entities": entities}
-            
-            if debug:
-                console.print(f"\n[cyan][DEBUG] Batch {i//batch_size+1} Payload:[/cyan]")
-                payload_str = json.dumps(payload, indent=2)
-                console.print(payload_str[:500] + "..." if len(payload_str) > 500 else payload_str)
-            
-            if dry_run:
-                console.print(f"[blue]DRY RUN: Would create batch {i//batch_size+1} with {len(batch)} entities[/blue]")
-                if debug:
-                    console.print(f"[dim]Payload size: {len(json.dumps(payload))} bytes[/dim]")
-                continue
-            
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmpf:
-                json.dump(payload, tmpf, indent=2)
-                tmpf.flush()
-                payload_file = tmpf.name
-            
-            try:
-                args = {"--payloadFile": payload_file}
-                result = _call_bulk_with_retry(args, f"Batch {i//batch_size+1}")
-                
+        # Parse the header (dotted/business metadata/classification columns) once
+        column_plan = compile_entity_column_plan(preview.columns)
+
+        def _prepare_batches():
+            nonlocal skipped
+            # Producer: read and map the next chunk while earlier batches are in flight
+            for batch_no, batch in enumerate(iter_csv_batches(csv_file, batch_size), 1):
+                key = row_range_key(int(batch.index[0]), int(batch.index[-1]) + 1)
+                if job_journal is not None and not job_journal.should_run(key, retry_failed):
+                    skipped += len(batch)
+                    continue
+
+                if throttle_ms > 0 and batch_no > 1 and not dry_run:
+                    if debug:
+                        console.print(
+                            f"[cyan][DEBUG] Throttling {throttle_ms} ms before next batch[/cyan]"
+                        )
+                    time.sleep(throttle_ms / 1000.0)
+
+                # Map each row to the correct Purview entity format (with custom attributes support)
+                entities = column_plan.map_frame(batch, debug=debug)
+
+                payload = {"entities": entities}
+
                 if debug:
-                    console.print(f"[cyan][DEBUG] API Response (batch {i//batch_size+1}):[/cyan]")
-                    result_str = json.dumps(result, indent=2)
-                    console.print(result_str[:500] + "..." if len(result_str) > 500 else result_str)
-                
-                if result and (not isinstance(result, dict) or result.get("status") != "error"):
-                    success += len(batch)
-                    console.print(f"[green]✓ Batch {i//batch_size+1} created successfully[/green]")
-                else:
-                    failed += len(batch)
-                    errors.append(f"Batch {i//batch_size+1}: {result}")
-                    failed_rows.extend(batch.to_dict(orient="records"))
-            except Exception as e:
+                    console.print(f"\n[cyan][DEBUG] Batch {batch_no} Payload:[/cyan]")
+                    payload_str = json.dumps(payload, indent=2)
+                    console.print(payload_str[:500] + "..." if len(payload_str) > 500 else payload_str)
+
+                if dry_run:
+                    console.print(f"[blue]DRY RUN: Would create batch {batch_no} with {len(batch)} entities[/blue]")
+                    if debug:
+                        console.print(f"[dim]Payload size: {len(json.dumps(payload))} bytes[/dim]")
+                    continue
+
+                yield batch_no, key, batch, payload
+
+        def _send_batch(prepared):
+            batch_no, key, _, payload = prepared
+            if job_journal is not None:
+                job_journal.start(key, batch=batch_no)
+            # Hand the payload over in memory; it is serialized once on the wire
+            return _call_bulk_with_retry({"--payloadFile": payload}, f"Batch {batch_no}")
+
+        if debug and max_parallel > 1:
+            console.print(f"[cyan][DEBUG] Pipelined mode: {max_parallel} batches in flight[/cyan]")
+
+        # Outcomes arrive in batch order regardless of --max-parallel
+        for (batch_no, key, batch, _), result, exc in run_batches(
+            _send_batch, _prepare_batches(), max_parallel
+        ):
+            if exc is not None:
                 failed += len(batch)
-                error_msg = str(e)
-                errors.append(f"Batch {i//batch_size+1}: {error_msg}")
-                failed_rows.extend(batch.to_dict(orient="records"))
-                
+                error_msg = str(exc)
+                errors.append(f"Batch {batch_no}: {error_msg}")
+                error_writer.write(batch)
+                if job_journal is not None:
+                    job_journal.fail(key, error_msg, batch=batch_no, error_rows=row_ranges(batch.index))
+
                 if debug:
-                    console.print(f"[red][DEBUG] Exception (batch {i//batch_size+1}):[/red]")
+                    console.print(f"[red][DEBUG] Exception (batch {batch_no}):[/red]")
                     import traceback
-                    console.print(traceback.format_exc())
-            finally:
-                os.remove(payload_file)
+                    console.print("".join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
+                continue
 
-            if throttle_ms > 0 and (i + batch_size) < total:
-                if debug:
-                    console.print(
-                        f"[cyan][DEBUG] Throttling {throttle_ms} ms before next batch[/cyan]"
-                    )
-                time.sleep(throttle_ms / 1000.0)
+            if debug:
+                console.print(f"[cyan][DEBUG] API Response (batch {batch_no}):[/cyan]")
+                result_str = json.dumps(result, indent=2)
+                console.print(result_str[:500] + "..." if len(result_str) > 500 else result_str)
+
+            if result and (not isinstance(result, dict) or result.get("status") != "error"):
+                success += len(batch)
+                console.print(f"[green]✓ Batch {batch_no} created successfully[/green]")
+                if job_journal is not None:
+                    job_journal.complete(key, extract_guids(result), batch=batch_no)
+            else:
+                failed += len(batch)
+                errors.append(f"Batch {batch_no}: {result}")
+                error_writer.write(batch)
+                if job_journal is not None:
+                    job_journal.fail(key, result, batch=batch_no, error_rows=row_ranges(batch.index))
         
         console.print(f"\n[green]SUCCESS: Bulk create completed. Success: {success}, Failed: {failed}[/green]")
+        if skipped:
+            console.print(f"[dim]Skipped {skipped} row(s) already handled in journal {resume_journal}[/dim]")
+        if job_journal is not None:
+            console.print(f"[dim]Journal: {job_journal.path}[/dim]")
         if errors:
             console.print("[red]Errors:[/red]")
             for err in errors:
                 console.print(f"[red]- {err}[/red]")
-        if error_csv and failed_rows:
-            pd.DataFrame(failed_rows).to_csv(error_csv, index=False)
+        if error_writer.rows_written:
             console.print(f"[yellow]WARNING: Failed rows written to {error_csv}[/yellow]")
     except Exception as e:
         console.print(f"[red]ERROR: Error executing entity bulk-create-csv: {str(e)}[/red]")
         import traceback
         if debug:
             console.print(f"[dim]{traceback.format_exc()}[/dim]")
+    finally:
+        if job_journal is not None:
+            job_journal.close()
 
 
 @entity.command()
 @click.option("--csv-file", required=True, type=click.Path(exists=True), help="CSV file with GUID and attributes to update")
 @click.option("--batch-size", default=100, help="Batch size for API calls")
 @click.option("--throttle-ms", default=0, type=int, help="Delay between batches in milliseconds")
+@click.option(
+    "--max-parallel",
+    default=1,
+    type=click.IntRange(1, 20),
+    show_default=True,
+    help="Number of bulk requests kept in flight (pipelined mode when > 1)",
+)
 @click.option("--max-retries", default=3, type=int, help="Max retry attempts per batch on API failure")
 @click.option("--retry-backoff-ms", default=1000, type=int, help="Base retry backoff delay in milliseconds")
 @click.option(
@@ -2935,6 +3001,9 @@ def bulk_create_csv(
 )
 @click.option("--dry-run", is_flag=True, help="Preview entities to be updated without making changes")
 @click.option("--error-csv", type=click.Path(), help="CSV file to write failed rows (optional)")
+@click.option("--journal", type=click.Path(dir_okay=False), help="Write-ahead journal (JSONL) recording every batch so the job can be resumed")
+@click.option("--resume", "resume_journal", type=click.Path(exists=True, dir_okay=False), help="Resume the job recorded in this journal, skipping completed batches")
+@click.option("--retry-failed", is_flag=True, help="With --resume, also re-run batches that failed")
 @click.option("--debug", is_flag=True, help="Enable debug mode for detailed logging")
 @click.pass_context
 def bulk_update_csv(
@@ -2942,11 +3011,15 @@ def bulk_update_csv(
     csv_file,
     batch_size,
     throttle_ms,
+    max_parallel,
     max_retries,
     retry_backoff_ms,
     retry_mode,
     dry_run,
     error_csv,
+    journal,
+    resume_journal,
+    retry_failed,
     debug,
 ):
     """Bulk update entities from a CSV file (guid, typeName, and attributes...)
@@ -2970,30 +3043,44 @@ def bulk_update_csv(
           Not providing typeName will result in "Type ENTITY with name null does not exist" error.
 
         \b
-    Preset configurations:
-            Fast:
-                --batch-size 100 --throttle-ms 50 --max-retries 3 --retry-backoff-ms 1000 --retry-mode fixed
-            Balanced:
-                --batch-size 50 --throttle-ms 200 --max-retries 4 --retry-backoff-ms 1500 --retry-mode exponential
-            Safe:
-                --batch-size 25 --throttle-ms 500 --max-retries 5 --retry-backoff-ms 2000 --retry-mode exponential
+    Throttling:
+            HTTP 429/503 responses are retried after their Retry-After delay by the
+            shared adaptive throttle, which lowers concurrency when the service pushes
+            back and ramps it up again on success. No preset tuning is needed;
+            --throttle-ms only adds a fixed pause between batches.
 
         \b
     Quick tuning:
-            Increase throughput: increase --batch-size or lower --throttle-ms
+            Increase throughput: increase --batch-size, lower --throttle-ms or raise --max-parallel
             Reduce throttling: lower --batch-size or increase --throttle-ms
+
+        \b
+    Pipelined mode:
+            --max-parallel N keeps N bulk requests in flight while the next batches
+            are being mapped. Retries, --error-csv and failure reports stay per batch
+            and in CSV order.
+
+        \b
+    Resumable jobs:
+            --journal job.jsonl records each batch's row range, status and returned
+            GUIDs as it runs. After an interruption, rerun the same command with
+            --resume job.jsonl to skip completed batches; add --retry-failed to
+            re-send batches that failed.
     """
     import pandas as pd
-    import tempfile
-    import os
     import json
     import time
-    from purviewcli.client._entity import Entity
+    from purviewcli.client._entity import Entity, compile_entity_column_plan
+    from purviewcli.client.bulk_executor import run_batches
+    from purviewcli.client.bulk_journal import csv_job_params, extract_guids, open_journal, row_range_key, row_ranges
+    from purviewcli.client.csv_stream import ErrorCsvWriter, iter_csv_batches, read_csv_preview
+    job_journal = None
     try:
         if debug:
             console.print(f"[cyan][DEBUG] CSV File: {csv_file}[/cyan]")
             console.print(f"[cyan][DEBUG] Batch Size: {batch_size}[/cyan]")
             console.print(f"[cyan][DEBUG] Throttle (ms): {throttle_ms}[/cyan]")
+            console.print(f"[cyan][DEBUG] Max Parallel: {max_parallel}[/cyan]")
             console.print(f"[cyan][DEBUG] Max Retries: {max_retries}[/cyan]")
             console.print(f"[cyan][DEBUG] Retry Backoff (ms): {retry_backoff_ms}[/cyan]")
             console.print(f"[cyan][DEBUG] Retry Mode: {retry_mode}[/cyan]")
@@ -3006,25 +3093,26 @@ def bulk_update_csv(
             console.print("[green][OK] Mock entity bulk-update-csv completed successfully[/green]")
             return
 
-        df = pd.read_csv(csv_file)
+        # Only the header and first row are read up front; rows are streamed per batch
+        preview = read_csv_preview(csv_file)
 
         # Normalize CSV headers to avoid failures from BOM/quotes/spaces/case mismatches.
-        df.columns = [
-            str(c).replace("\ufeff", "").strip().strip('"').strip("'") for c in df.columns
+        normalized_columns = [
+            str(c).replace("\ufeff", "").strip().strip('"').strip("'") for c in preview.columns
         ]
 
-        lower_to_actual = {str(c).lower(): c for c in df.columns}
+        lower_to_actual = {str(c).lower(): c for c in normalized_columns}
         rename_map = {}
 
         # Common GUID aliases.
-        if "guid" not in df.columns:
+        if "guid" not in normalized_columns:
             for alias in ["id", "entityid"]:
                 if alias in lower_to_actual:
                     rename_map[lower_to_actual[alias]] = "guid"
                     break
 
         # Common type aliases from search/export results.
-        if "typename" not in lower_to_actual and "typeName" not in df.columns:
+        if "typename" not in lower_to_actual and "typeName" not in normalized_columns:
             for alias in [
                 "entitytype",
                 "entityfulltypename",
@@ -3038,45 +3126,45 @@ def bulk_update_csv(
         # Normalize description/displayName aliases while preserving canonical output fields.
         if "description" not in lower_to_actual:
             for alias in ["Description", "desc"]:
-                if alias in df.columns:
+                if alias in normalized_columns:
                     rename_map[alias] = "description"
                     break
         if "displayname" not in lower_to_actual:
             for alias in ["DisplayName", "display_text", "displayText"]:
-                if alias in df.columns:
+                if alias in normalized_columns:
                     rename_map[alias] = "displayName"
                     break
 
-        if rename_map:
-            df = df.rename(columns=rename_map)
-
-        # Normalize typeName values (trim and strip namespace prefixes like MICROSOFT.mssql_table).
-        if "typeName" in df.columns:
-            def _normalize_type_name(value):
-                if pd.isna(value):
-                    return value
-                normalized = str(value).strip().strip('"').strip("'")
-                if "." in normalized:
-                    normalized = normalized.split(".")[-1]
-                return normalized
-
-            df["typeName"] = df["typeName"].apply(_normalize_type_name)
-
-        if df.empty:
+        columns = [rename_map.get(c, c) for c in normalized_columns]
+
+        def _normalize_type_name(value):
+            if pd.isna(value):
+                return value
+            normalized = str(value).strip().strip('"').strip("'")
+            if "." in normalized:
+                normalized = normalized.split(".")[-1]
+            return normalized
+
+        def _normalize_frame(frame):
+            # Applied to every streamed chunk so batches match the normalized header
+            frame.columns = columns
+            # Normalize typeName values (trim and strip namespace prefixes like MICROSOFT.mssql_table).
+            if "typeName" in frame.columns:
+                frame["typeName"] = frame["typeName"].apply(_normalize_type_name)
+            return frame
+
+        if preview.empty:
             console.print("[yellow]No rows found in CSV. Exiting.[/yellow]")
             return
         
         if debug:
-            # Use __builtins__['list'] to avoid conflict with entity list command below
-            console.print(f"[cyan][DEBUG] CSV columns (normalized): {__builtins__['list'](df.columns)}[/cyan]")
-            console.print(f"[cyan][DEBUG] Total rows: {len(df)}[/cyan]")
-            console.print(f"[cyan][DEBUG] First row:\n{df.iloc[0].to_dict()}[/cyan]")
+            console.print(f"[cyan][DEBUG] CSV columns (normalized): {columns}[/cyan]")
+            console.print(f"[cyan][DEBUG] First row:\n{_normalize_frame(preview).iloc[0].to_dict()}[/cyan]")
 
         entity_client = Entity()
-        total = len(df)
-        success, failed = 0, 0
+        success, failed, skipped = 0, 0, 0
         errors = []
-        failed_rows = []
+        error_writer = ErrorCsvWriter(error_csv)
 
         retry_mode = (retry_mode or "exponential").lower()
 
@@ -3114,11 +3202,12 @@ def bulk_update_csv(
         # Determine mode:
         # - If CSV has both 'typeName' and 'qualifiedName' -> map rows to Purview entities and call bulk create-or-update
         # - Else if CSV has 'guid' and 'typeName' -> build guid-based payloads (preferred for partial attribute updates)
-        has_type_qn = ("typeName" in df.columns and "qualifiedName" in df.columns)
-        has_guid = "guid" in df.columns
-        has_type_name = "typeName" in df.columns
+        has_type_qn = ("typeName" in columns and "qualifiedName" in columns)
+        column_plan = compile_entity_column_plan(columns) if has_type_qn else None
+        has_guid = "guid" in columns
+        has_type_name = "typeName" in columns
         classification_columns = [
-            col for col in ["classification", "classificationName"] if col in df.columns
+            col for col in ["classification", "classificationName"] if col in columns
         ]
         
         if debug:
@@ -3141,232 +3230,249 @@ def bulk_update_csv(
             console.print("[yellow]    This keeps bulk operations efficient (no per-item API calls)[/yellow]")
             return
 
-        for i in range(0, total, batch_size):
-            batch = df.iloc[i : i + batch_size]
+        if not has_type_qn and not has_guid:
+            console.print(f"[red][X] CSV must contain either (typeName and qualifiedName) or guid column[/red]")
+            return
 
-            if has_type_qn:
-                # Map flat rows to Purview entity objects using helper
-                from purviewcli.client._entity import map_flat_entity_to_purview_entity
+        if not dry_run:
+            job_journal = open_journal(
+                journal, resume_journal, "entity bulk-update-csv", csv_job_params(csv_file, batch_size)
+            )
+            if resume_journal:
+                # Keep earlier failures only for batches this run does not replay
+                error_writer.restore(
+                    csv_file, job_journal.error_row_ranges(retry_failed), transform=_normalize_frame
+                )
 
-                entities = [map_flat_entity_to_purview_entity(row, debug=debug) for _, row in batch.iterrows()]
-                
-                if debug:
-                    console.print(f"[cyan][DEBUG] Batch {i//batch_size+1} entities: {json.dumps(entities, indent=2, default=str)}[/cyan]")
-                payload = {"entities": entities}
+        def _build_guid_entities(batch, row_failures):
+            # Build guid-based updates in a bulk payload to avoid per-attribute API calls.
+            rows = [(index, row.to_dict()) for index, row in batch.iterrows()]
+            entities = []
 
-                if dry_run:
-                    console.print(f"[blue]DRY RUN: Would bulk-create/update batch {i//batch_size+1} with {len(batch)} entities[/blue]")
+            has_attr_name_value = set(["guid", "attrName", "attrValue"]).issubset(
+                set(batch.columns)
+            )
+
+            for index, r in rows:
+                guid_value = r.get("guid")
+                if pd.isna(guid_value):
+                    row_failures.append((index, r, "Row missing required guid"))
                     continue
 
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False, encoding="utf-8") as tmpf:
-                    json.dump(payload, tmpf, indent=2)
-                    tmpf.flush()
-                    payload_file = tmpf.name
-                
-                if debug:
-                    console.print(f"[cyan][DEBUG] Payload file: {payload_file}[/cyan]")
-                    console.print(f"[cyan][DEBUG] Payload:\n{json.dumps(payload, indent=2, default=str)}[/cyan]")
+                guid = str(guid_value).strip()
+                if not guid:
+                    row_failures.append((index, r, "Row has empty guid"))
+                    continue
 
-                try:
-                    args = {"--payloadFile": payload_file}
-                    result = _call_bulk_with_retry(args, f"Batch {i//batch_size+1}")
-                    if debug:
-                        console.print(f"[cyan][DEBUG] API Result: {result}[/cyan]")
-                    if result and (not isinstance(result, dict) or result.get("status") != "error"):
-                        success += len(batch)
-                    else:
-                        failed += len(batch)
-                        errors.append(f"Batch {i//batch_size+1}: {result}")
-                        failed_rows.extend(batch.to_dict(orient="records"))
-                except Exception as e:
-                    failed += len(batch)
-                    errors.append(f"Batch {i//batch_size+1}: {str(e)}")
-                    failed_rows.extend(batch.to_dict(orient="records"))
-                    if debug:
-                        console.print(f"[cyan][DEBUG] Exception: {str(e)}[/cyan]")
-                finally:
-                    try:
-                        os.remove(payload_file)
-                    except Exception:
-                        pass
+                # Build entity with guid + typeName (both required by Purview bulk API)
+                entity: dict[str, object] = {"guid": guid}
+                
+                # Get typeName from CSV (required)
+                if "typeName" not in r or pd.isna(r.get("typeName")):
+                    row_failures.append((index, r, f"Row missing typeName for GUID {guid}"))
+                    continue
 
-                if throttle_ms > 0 and (i + batch_size) < total:
-                    if debug:
-                        console.print(
-                            f"[cyan][DEBUG] Throttling {throttle_ms} ms before next batch[/cyan]"
-                        )
-                    time.sleep(throttle_ms / 1000.0)
+                type_name = str(r.get("typeName")).strip()
+                if not type_name:
+                    row_failures.append((index, r, f"Row has empty typeName for GUID {guid}"))
+                    continue
 
-            elif has_guid:
-                # Build guid-based updates in a bulk payload to avoid per-attribute API calls.
-                rows = [row.to_dict() for _, row in batch.iterrows()]
-                entities = []
+                entity["typeName"] = type_name
+                attributes: dict[str, str] = {}
 
-                has_attr_name_value = set(["guid", "attrName", "attrValue"]).issubset(
-                    set(batch.columns)
-                )
+                if has_attr_name_value:
+                    attr_name = r.get("attrName")
+                    attr_value = r.get("attrValue")
+                    if pd.notna(attr_name) and str(attr_name).strip() and pd.notna(attr_value):
+                        attributes[str(attr_name).strip()] = str(attr_value)
+                else:
+                    column_mapping = {
+                        "DisplayName": "displayName",
+                        "Description": "description",
+                    }
 
-                for r in rows:
-                    guid_value = r.get("guid")
-                    if pd.isna(guid_value):
-                        failed += 1
-                        failed_rows.append(r)
-                        errors.append("Row missing required guid")
-                        continue
+                    skip_columns = {"guid", "attrName", "attrValue"} | set(
+                        classification_columns
+                    )
 
-                    guid = str(guid_value).strip()
-                    if not guid:
-                        failed += 1
-                        failed_rows.append(r)
-                        errors.append("Row has empty guid")
-                        continue
+                    for csv_col, purview_attr in column_mapping.items():
+                        if csv_col in r and pd.notnull(r.get(csv_col)):
+                            attributes[purview_attr] = str(r.get(csv_col))
 
-                    # Build entity with guid + typeName (both required by Purview bulk API)
-                    entity: dict[str, object] = {"guid": guid}
-                    
-                    # Get typeName from CSV (required)
-                    if "typeName" not in r or pd.isna(r.get("typeName")):
-                        failed += 1
-                        failed_rows.append(r)
-                        errors.append(f"Row missing typeName for GUID {guid}")
-                        continue
+                    for k, v in r.items():
+                        if k in skip_columns or k in column_mapping:
+                            continue
+                        if pd.notnull(v):
+                            attributes[str(k)] = str(v)
 
-                    type_name = str(r.get("typeName")).strip()
-                    if not type_name:
-                        failed += 1
-                        failed_rows.append(r)
-                        errors.append(f"Row has empty typeName for GUID {guid}")
-                        continue
+                if attributes:
+                    entity["attributes"] = attributes
 
-                    entity["typeName"] = type_name
-                    attributes: dict[str, str] = {}
+                classification_value = None
+                for col in classification_columns:
+                    if col in r and pd.notnull(r.get(col)):
+                        classification_value = r.get(col)
+                        break
 
-                    if has_attr_name_value:
-                        attr_name = r.get("attrName")
-                        attr_value = r.get("attrValue")
-                        if pd.notna(attr_name) and str(attr_name).strip() and pd.notna(attr_value):
-                            attributes[str(attr_name).strip()] = str(attr_value)
+                if classification_value is not None:
+                    if isinstance(classification_value, str):
+                        raw_items = [
+                            v.strip() for v in classification_value.replace(",", ";").split(";")
+                        ]
+                        classification_names = [v for v in raw_items if v]
                     else:
-                        column_mapping = {
-                            "DisplayName": "displayName",
-                            "Description": "description",
-                        }
+                        classification_names = [str(classification_value).strip()]
 
-                        skip_columns = {"guid", "attrName", "attrValue"} | set(
-                            classification_columns
-                        )
-
-                        for csv_col, purview_attr in column_mapping.items():
-                            if csv_col in r and pd.notnull(r.get(csv_col)):
-                                attributes[purview_attr] = str(r.get(csv_col))
-
-                        for k, v in r.items():
-                            if k in skip_columns or k in column_mapping:
-                                continue
-                            if pd.notnull(v):
-                                attributes[str(k)] = str(v)
-
-                    if attributes:
-                        entity["attributes"] = attributes
-
-                    classification_value = None
-                    for col in classification_columns:
-                        if col in r and pd.notnull(r.get(col)):
-                            classification_value = r.get(col)
-                            break
-
-                    if classification_value is not None:
-                        if isinstance(classification_value, str):
-                            raw_items = [
-                                v.strip() for v in classification_value.replace(",", ";").split(";")
-                            ]
-                            classification_names = [v for v in raw_items if v]
-                        else:
-                            classification_names = [str(classification_value).strip()]
-
-                        if classification_names:
-                            entity["classifications"] = [
-                                {"typeName": name} for name in classification_names
-                            ]
-
-                    if "attributes" not in entity and "classifications" not in entity:
-                        failed += 1
-                        failed_rows.append(r)
-                        errors.append(f"GUID {guid}: no updatable fields found")
-                        continue
+                    if classification_names:
+                        entity["classifications"] = [
+                            {"typeName": name} for name in classification_names
+                        ]
 
-                    entities.append(entity)
-
-                if not entities:
+                if "attributes" not in entity and "classifications" not in entity:
+                    row_failures.append((index, r, f"GUID {guid}: no updatable fields found"))
                     continue
 
-                payload = {"entities": entities}
+                entities.append(entity)
 
-                if dry_run:
-                    console.print(
-                        f"[blue]DRY RUN: Would bulk-update (by guid) batch {i//batch_size+1} with {len(entities)} entities[/blue]"
-                    )
-                    success += len(entities)
+            return entities
+
+        def _prepare_batches():
+            # Producer: map rows to entities while earlier batches are in flight.
+            # Every batch is yielded (even when nothing is sent) so row-level
+            # failures are reported in CSV order alongside API failures.
+            throttle_next = False
+            nonlocal skipped
+            for batch_no, batch in enumerate(
+                iter_csv_batches(csv_file, batch_size, transform=_normalize_frame), 1
+            ):
+                key = row_range_key(int(batch.index[0]), int(batch.index[-1]) + 1)
+                if job_journal is not None and not job_journal.should_run(key, retry_failed):
+                    skipped += len(batch)
                     continue
+                if throttle_next:
+                    if debug:
+                        console.print(
+                            f"[cyan][DEBUG] Throttling {throttle_ms} ms before next batch[/cyan]"
+                        )
+                    time.sleep(throttle_ms / 1000.0)
+                row_failures = []
+                payload = None
+                dry_run_count = 0
 
-                with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False, encoding="utf-8"
-                ) as tmpf:
-                    json.dump(payload, tmpf, indent=2)
-                    tmpf.flush()
-                    payload_file = tmpf.name
-
-                if debug:
-                    console.print(f"[cyan][DEBUG] GUID bulk payload file: {payload_file}[/cyan]")
-                    console.print(
-                        f"[cyan][DEBUG] GUID bulk payload:\n{json.dumps(payload, indent=2, default=str)}[/cyan]"
-                    )
-
-                try:
-                    args = {"--payloadFile": payload_file}
-                    result = _call_bulk_with_retry(args, f"Batch {i//batch_size+1}")
+                if has_type_qn:
+                    # Map flat rows to Purview entity objects with the compiled column plan
+                    entities = column_plan.map_frame(batch, debug=debug)
+                    
                     if debug:
-                        console.print(f"[cyan][DEBUG] API Result: {result}[/cyan]")
+                        console.print(f"[cyan][DEBUG] Batch {batch_no} entities: {json.dumps(entities, indent=2, default=str)}[/cyan]")
 
-                    if result and (
-                        not isinstance(result, dict) or result.get("status") != "error"
-                    ):
-                        success += len(entities)
+                    if dry_run:
+                        console.print(f"[blue]DRY RUN: Would bulk-create/update batch {batch_no} with {len(batch)} entities[/blue]")
                     else:
-                        failed += len(entities)
-                        errors.append(f"Batch {i//batch_size+1}: {result}")
-                        failed_rows.extend(batch.to_dict(orient="records"))
-                except Exception as e:
-                    failed += len(entities)
-                    errors.append(f"Batch {i//batch_size+1}: {str(e)}")
-                    failed_rows.extend(batch.to_dict(orient="records"))
-                finally:
-                    try:
-                        os.remove(payload_file)
-                    except Exception:
-                        pass
-
-                if throttle_ms > 0 and (i + batch_size) < total:
-                    if debug:
+                        payload = {"entities": entities}
+                else:
+                    entities = _build_guid_entities(batch, row_failures)
+                    if entities and dry_run:
                         console.print(
-                            f"[cyan][DEBUG] Throttling {throttle_ms} ms before next batch[/cyan]"
+                            f"[blue]DRY RUN: Would bulk-update (by guid) batch {batch_no} with {len(entities)} entities[/blue]"
                         )
-                    time.sleep(throttle_ms / 1000.0)
+                        dry_run_count = len(entities)
+                    elif entities:
+                        payload = {"entities": entities}
+
+                yield {
+                    "batch_no": batch_no,
+                    "key": key,
+                    "batch": batch,
+                    "count": len(batch) if has_type_qn else len(entities),
+                    "payload": payload,
+                    "row_failures": row_failures,
+                    "dry_run_count": dry_run_count,
+                }
+
+                throttle_next = payload is not None and throttle_ms > 0
+
+        def _send_batch(prepared):
+            payload = prepared["payload"]
+            if payload is None:
+                return None
 
+            if debug:
+                console.print(f"[cyan][DEBUG] Payload:\n{json.dumps(payload, indent=2, default=str)}[/cyan]")
+
+            if job_journal is not None:
+                job_journal.start(prepared["key"], batch=prepared["batch_no"])
+            # Hand the payload over in memory; it is serialized once on the wire
+            return _call_bulk_with_retry({"--payloadFile": payload}, f"Batch {prepared['batch_no']}")
+
+        # Outcomes arrive in batch order regardless of --max-parallel
+        for prepared, result, exc in run_batches(_send_batch, _prepare_batches(), max_parallel):
+            batch_no = prepared["batch_no"]
+            key = prepared["key"]
+            batch = prepared["batch"]
+            count = prepared["count"]
+            row_failure_count = len(prepared["row_failures"])
+            failed_rows = row_ranges(index for index, _, _ in prepared["row_failures"])
+
+            for _, row, message in prepared["row_failures"]:
+                failed += 1
+                errors.append(message)
+            error_writer.write(row for _, row, _ in prepared["row_failures"])
+
+            # Rows already written as row failures are not written again if the batch fails
+            unreported = batch.drop(index=[index for index, _, _ in prepared["row_failures"]])
+
+            if prepared["payload"] is None:
+                success += prepared["dry_run_count"]
+                if job_journal is not None:
+                    # Every row failed local validation; replaying the batch cannot help
+                    job_journal.complete(
+                        key, [], batch=batch_no, row_failures=row_failure_count, error_rows=failed_rows
+                    )
+                continue
+
+            if exc is not None:
+                failed += count
+                errors.append(f"Batch {batch_no}: {str(exc)}")
+                error_writer.write(unreported)
+                if job_journal is not None:
+                    job_journal.fail(key, exc, batch=batch_no, error_rows=row_ranges(batch.index))
+                if debug:
+                    console.print(f"[cyan][DEBUG] Exception: {str(exc)}[/cyan]")
+                continue
+
+            if debug:
+                console.print(f"[cyan][DEBUG] API Result: {result}[/cyan]")
+            if result and (not isinstance(result, dict) or result.get("status") != "error"):
+                success += count
+                if job_journal is not None:
+                    job_journal.complete(
+                        key, extract_guids(result), batch=batch_no,
+                        row_failures=row_failure_count, error_rows=failed_rows,
+                    )
             else:
-                console.print(f"[red][X] CSV must contain either (typeName and qualifiedName) or guid column[/red]")
-                return
+                failed += count
+                errors.append(f"Batch {batch_no}: {result}")
+                error_writer.write(unreported)
+                if job_journal is not None:
+                    job_journal.fail(key, result, batch=batch_no, error_rows=row_ranges(batch.index))
 
         console.print(f"[green][OK] Bulk update completed. Success: {success}, Failed: {failed}[/green]")
+        if skipped:
+            console.print(f"[dim]Skipped {skipped} row(s) already handled in journal {resume_journal}[/dim]")
+        if job_journal is not None:
+            console.print(f"[dim]Journal: {job_journal.path}[/dim]")
         if errors:
             console.print("[red]Errors:[/red]")
             for err in errors:
                 console.print(f"[red]- {err}[/red]")
-        if error_csv and failed_rows:
-            pd.DataFrame(failed_rows).to_csv(error_csv, index=False)
+        if error_writer.rows_written:
             console.print(f"[yellow]WARNING: Failed rows written to {error_csv}[/yellow]")
     except Exception as e:
         console.print(f"[red][X] Error executing entity bulk-update-csv: {str(e)}[/red]")
+    finally:
+        if job_journal is not None:
+            job_journal.close()
 
 
 @entity.command()
@@ -3376,10 +3482,13 @@ def bulk_update_csv(
 @click.option("--error-csv", type=click.Path(), help="CSV file to write failed rows (optional)")
 @click.pass_context
 def bulk_delete_csv(ctx, csv_file, batch_size, dry_run, error_csv):
-    """Bulk delete entities from a CSV file (guid column)"""
-    import pandas as pd
-    import os
+    """Bulk delete entities from a CSV file (guid column)
+
+    The CSV is streamed in --batch-size chunks, so memory use does not grow
+    with the file size.
+    """
     from purviewcli.client._entity import Entity
+    from purviewcli.client.csv_stream import ErrorCsvWriter, iter_csv_batches, read_csv_preview
     try:
         if ctx.obj.get("mock"):
             console.print("[yellow][MOCK] entity bulk-delete-csv command[/yellow]")
@@ -3387,20 +3496,17 @@ def bulk_delete_csv(ctx, csv_file, batch_size, dry_run, error_csv):
             console.print("[green][OK] Mock entity bulk-delete-csv completed successfully[/green]")
             return
 
-        df = pd.read_csv(csv_file)
-        if "guid" not in df.columns:
+        if "guid" not in read_csv_preview(csv_file, rows=0).columns:
             console.print("[red][X] CSV must contain 'guid' column[/red]")
             return
         entity_client = Entity()
-        total = len(df)
         success, failed = 0, 0
         errors = []
-        failed_rows = []
-        for i in range(0, total, batch_size):
-            batch = df.iloc[i:i+batch_size]
-            guids = [str(row["guid"]) for _, row in batch.iterrows() if pd.notnull(row["guid"])]
+        error_writer = ErrorCsvWriter(error_csv)
+        for batch_no, batch in enumerate(iter_csv_batches(csv_file, batch_size), 1):
+            guids = [str(guid) for guid in batch["guid"].dropna().tolist()]
             if dry_run:
-                console.print(f"[blue]DRY RUN: Would delete batch {i//batch_size+1} with {len(guids)} entities[/blue]")
+                console.print(f"[blue]DRY RUN: Would delete batch {batch_no} with {len(guids)} entities[/blue]")
                 continue
             try:
                 args = {"--guid": guids}
@@ -3409,19 +3515,18 @@ def bulk_delete_csv(ctx, csv_file, batch_size, dry_run, error_csv):
                     success += len(guids)
                 else:
                     failed += len(guids)
-                    errors.append(f"Batch {i//batch_size+1}: {result}")
-                    failed_rows.extend(batch.to_dict(orient="records"))
+                    errors.append(f"Batch {batch_no}: {result}")
+                    error_writer.write(batch)
             except Exception as e:
                 failed += len(guids)
-                errors.append(f"Batch {i//batch_size+1}: {str(e)}")
-                failed_rows.extend(batch.to_dict(orient="records"))
+                errors.append(f"Batch {batch_no}: {str(e)}")
+                error_writer.write(batch)
         console.print(f"[green][OK] Bulk delete completed. Success: {success}, Failed: {failed}[/green]")
         if errors:
             console.print("[red]Errors:[/red]")
             for err in errors:
                 console.print(f"[red]- {err}[/red]")
-        if error_csv and failed_rows:
-            pd.DataFrame(failed_rows).to_csv(error_csv, index=False)
+        if error_writer.rows_written:
             console.print(f"[yellow][X] Failed rows written to {error_csv}[/yellow]")
     except Exception as e:
         console.print(f"[red][X] Error executing entity bulk-delete-csv: {str(e)}[/red]")
@@ -3594,32 +3699,44 @@ def list(collection_id, type_name, limit, offset, output_format, show_qualified_
               help="Assets per bulk delete request (Microsoft recommended: 50)")
 @click.option("--max-parallel", type=int, default=10, 
               help="Maximum parallel deletion jobs")
-@click.option("--throttle-ms", type=int, default=200, 
-              help="Throttle delay between API calls (milliseconds)")
-@click.option("--batch-throttle-ms", type=int, default=800, 
-              help="Throttle delay between batches (milliseconds)")
+@click.option("--throttle-ms", type=int, default=0, 
+              help="Extra delay between API calls (milliseconds); 429/503 backoff is automatic")
+@click.option("--batch-throttle-ms", type=int, default=0, 
+              help="Extra delay between batches (milliseconds); 429/503 backoff is automatic")
 @click.option("--dry-run", is_flag=True, 
               help="Show what would be deleted without actually deleting")
 @click.option("--continuous", is_flag=True, 
               help="Continue until all assets in collection are deleted")
 @click.option("--collection-name", 
               help="Collection name for continuous deletion mode")
+@click.option("--journal", type=click.Path(dir_okay=False),
+              help="Write-ahead journal (JSONL) recording every bulk request so the job can be resumed")
+@click.option("--resume", "resume_journal", type=click.Path(exists=True, dir_okay=False),
+              help="Resume the job recorded in this journal, skipping completed requests")
+@click.option("--retry-failed", is_flag=True,
+              help="With --resume, also re-run bulk requests that failed")
 @click.pass_context
 def bulk_delete_optimized(ctx, guids, bulk_size, max_parallel, throttle_ms, 
-                         batch_throttle_ms, dry_run, continuous, collection_name):
+                         batch_throttle_ms, dry_run, continuous, collection_name,
+                         journal, resume_journal, retry_failed):
     """
     Optimized bulk delete with mathematical precision (equivalent to Remove-PurviewAsset-Batch.ps1)
     
     Features:
     - Mathematical optimization for perfect efficiency
-    - Parallel processing with controlled throttling
+    - Parallel processing with adaptive throttling (429/503 + Retry-After)
     - Continuous deletion mode for large collections
     - Reliable counting and progress tracking
     - Microsoft's recommended 50 assets per bulk request
+    - Resumable jobs: --journal records every bulk request; rerun with the same
+      GUIDs and --resume <journal> to skip completed ones (--retry-failed re-sends failures)
     """
+    job_journal = None
     try:
         from rich.console import Console
+        import hashlib
         import math
+        from purviewcli.client.bulk_journal import open_journal
         
         console = Console()
 
@@ -3646,22 +3763,44 @@ def bulk_delete_optimized(ctx, guids, bulk_size, max_parallel, throttle_ms,
                 console.print(f"[yellow][!] Mathematical waste: {waste_assets} empty slots in final requests[/yellow]")
 
         if continuous and collection_name:
+            if journal or resume_journal:
+                console.print("[red][X] --journal/--resume are not supported in --continuous mode[/red]")
+                return
             deleted_count = _continuous_collection_deletion(
                 ctx, collection_name, bulk_size, max_parallel, 
                 throttle_ms, batch_throttle_ms, dry_run
             )
         else:
+            if not dry_run:
+                # Request boundaries depend on the GUID list, bulk size and job split
+                job_journal = open_journal(
+                    journal,
+                    resume_journal,
+                    "entity bulk-delete-optimized",
+                    {
+                        "guids_sha256": hashlib.sha256("\n".join(guids).encode("utf-8")).hexdigest(),
+                        "guid_count": len(guids),
+                        "bulk_size": bulk_size,
+                        "max_parallel": max_parallel,
+                    },
+                )
             deleted_count = _execute_optimized_bulk_delete(
                 ctx, _builtin_list(guids), bulk_size, max_parallel, 
-                throttle_ms, batch_throttle_ms, dry_run
+                throttle_ms, batch_throttle_ms, dry_run,
+                journal=job_journal, retry_failed=retry_failed,
             )
         
         console.print(f"[green][OK] {'Would delete' if dry_run else 'Successfully deleted'} {deleted_count} assets[/green]")
+        if job_journal is not None:
+            console.print(f"[dim]Journal: {job_journal.path}[/dim]")
 
     except Exception as e:
         from rich.console import Console
         console = Console()
         console.print(f"[red][X] Error in bulk-delete-optimized: {str(e)}[/red]")
+    finally:
+        if job_journal is not None:
+            job_journal.close()
 
 
 @entity.command("bulk-delete-from-collection")
@@ -3672,8 +3811,8 @@ def bulk_delete_optimized(ctx, guids, bulk_size, max_parallel, throttle_ms,
               help="Maximum parallel deletion jobs")
 @click.option("--batch-size", type=int, default=1000, 
               help="Assets to process per batch cycle")
-@click.option("--throttle-ms", type=int, default=200, 
-              help="Throttle delay between API calls (milliseconds)")
+@click.option("--throttle-ms", type=int, default=0, 
+              help="Extra delay between API calls (milliseconds); 429/503 backoff is automatic")
 @click.option("--dry-run", is_flag=True, 
               help="Show what would be deleted without actually deleting")
 @click.confirmation_option(prompt="Are you sure you want to delete all assets in this collection?")
@@ -3696,7 +3835,7 @@ def bulk_delete_from_collection(ctx, collection_name, bulk_size, max_parallel,
         
         deleted_count = _continuous_collection_deletion(
             ctx, collection_name, bulk_size, max_parallel, 
-            throttle_ms, 800, dry_run, batch_size
+            throttle_ms, 0, dry_run, batch_size
         )
         
         console.print(f"[green][OK] Collection cleanup complete: {'Would delete' if dry_run else 'Deleted'} {deleted_count} total assets[/green]")
@@ -3815,10 +3954,14 @@ def analyze_performance(ctx, bulk_size, max_parallel, asset_count):
 
 # === ENHANCED BULK OPERATION FUNCTIONS ===
 
-def _execute_optimized_bulk_delete(ctx, guids, bulk_size, max_parallel, throttle_ms, batch_throttle_ms, dry_run):
+def _execute_optimized_bulk_delete(ctx, guids, bulk_size, max_parallel, throttle_ms, batch_throttle_ms, dry_run,
+                                   journal=None, retry_failed=False):
     """
     Execute optimized bulk delete with parallel processing
     (Core logic from PowerShell Remove-PurviewAsset-Batch.ps1)
+
+    When a BulkJournal is given, each bulk request is journaled by its GUID
+    index range and requests already completed in the journal are skipped.
     """
     from rich.console import Console
     from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -3849,7 +3992,7 @@ def _execute_optimized_bulk_delete(ctx, guids, bulk_size, max_parallel, throttle
         start_idx = i * assets_per_job
         end_idx = min(start_idx + assets_per_job, total_assets)
         if start_idx < total_assets:
-            job_batches.append(guids[start_idx:end_idx])
+            job_batches.append((start_idx, guids[start_idx:end_idx]))
 
     console.print(f"[blue][START] Starting {len(job_batches)} parallel deletion jobs...[/blue]")
 
@@ -3866,8 +4009,11 @@ def _execute_optimized_bulk_delete(ctx, guids, bulk_size, max_parallel, throttle
         # Execute parallel deletions
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel) as executor:
             future_to_batch = {
-                executor.submit(_delete_batch_job, entity_client, batch, bulk_size, throttle_ms, i): batch
-                for i, batch in enumerate(job_batches)
+                executor.submit(
+                    _delete_batch_job, entity_client, batch, bulk_size, throttle_ms, i,
+                    offset=start_idx, journal=journal, retry_failed=retry_failed,
+                ): batch
+                for i, (start_idx, batch) in enumerate(job_batches)
             }
             
             for future in concurrent.futures.as_completed(future_to_batch):
@@ -3887,19 +4033,30 @@ def _execute_optimized_bulk_delete(ctx, guids, bulk_size, max_parallel, throttle
     return deleted_count
 
 
-def _delete_batch_job(entity_client, guid_batch, bulk_size, throttle_ms, job_id):
+def _delete_batch_job(entity_client, guid_batch, bulk_size, throttle_ms, job_id,
+                      offset=0, journal=None, retry_failed=False):
     """
     Execute a single batch job (parallel worker function)
+
+    offset is the position of guid_batch in the full GUID list; it keys the
+    journal entries so they stay stable across resumed runs.
     """
     import time
+    from purviewcli.client.bulk_journal import row_range_key
     
     deleted_in_job = 0
     
     # Split batch into bulk delete chunks
     for i in range(0, len(guid_batch), bulk_size):
         bulk_guids = guid_batch[i:i + bulk_size]
+        key = row_range_key(offset + i, offset + i + len(bulk_guids))
+        if journal is not None and not journal.should_run(key, retry_failed):
+            continue
         
         try:
+            if journal is not None:
+                journal.start(key, job=job_id)
+
             # Execute bulk delete API call
             args = {"--guid": bulk_guids}
             result = entity_client.entityDeleteBulk(args)
@@ -3909,12 +4066,18 @@ def _delete_batch_job(entity_client, guid_batch, bulk_size, throttle_ms, job_id)
             )
             if result is not None and not is_error:
                 deleted_in_job += len(bulk_guids)
+                if journal is not None:
+                    journal.complete(key, bulk_guids, job=job_id)
+            elif journal is not None:
+                journal.fail(key, result, job=job_id)
             
             # Throttle between API calls
             if throttle_ms > 0 and i + bulk_size < len(guid_batch):
                 time.sleep(throttle_ms / 1000)
                 
         except Exception as e:
+            if journal is not None:
+                journal.fail(key, e, job=job_id)
             from rich.console import Console
             console = Console()
             console.print(f"[red][X] Job {job_id} bulk delete failed: {str(e)}[/red]")
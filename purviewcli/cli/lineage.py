@@ -560,9 +560,22 @@ def create_column_lineage(ctx, source_table_guid, target_table_guid, source_colu
 @click.argument("csv_file", type=click.Path(exists=True))
 @click.option("--validate-types", is_flag=True, default=False, help="Validate column type compatibility")
 @click.option("--dry-run", is_flag=True, default=False, help="Validate CSV without creating lineage")
-def import_column_csv(csv_file, validate_types, dry_run):
+@click.option("--batch-size", type=int, default=100, show_default=True, help="Column lineages per bulk create request")
+@click.option("--max-parallel", type=int, default=1, show_default=True, help="Bulk create requests in flight")
+@click.option("--journal", type=click.Path(dir_okay=False), help="Write-ahead journal (JSONL) recording every batch so the job can be resumed")
+@click.option("--resume", "resume_journal", type=click.Path(exists=True, dir_okay=False), help="Resume the job recorded in this journal, skipping completed batches")
+@click.option("--retry-failed", is_flag=True, help="With --resume, also re-run batches that failed")
+def import_column_csv(csv_file, validate_types, dry_run, batch_size, max_parallel, journal, resume_journal, retry_failed):
     """
     Import column-level lineage from CSV file in batch.
+
+    Each table is read once (bulk entity reads) and the lineages are created
+    with one bulk request per --batch-size rows.
+
+    Long imports can be made resumable: --journal job.jsonl records each
+    batch's row range and status; after an interruption, rerun with
+    --resume job.jsonl to skip completed batches (add --retry-failed to
+    replay failed ones).
     
     CSV Format:
     source_table_guid,source_column,target_table_guid,target_column,process_name,description,owner
@@ -573,7 +586,9 @@ def import_column_csv(csv_file, validate_types, dry_run):
     """
     import csv
     from rich.table import Table
+    from purviewcli.client.bulk_journal import csv_job_params, open_journal
     
+    job_journal = None
     try:
         console.print(f"\n[cyan]Reading CSV file: {csv_file}[/cyan]")
         
@@ -647,50 +662,47 @@ def import_column_csv(csv_file, validate_types, dry_run):
         # Creation phase
         console.print("\n[cyan]Creating column lineages...[/cyan]")
         client = Lineage()
-        
-        success_count = 0
-        error_count = 0
-        
-        for idx, row in enumerate(rows, 1):
-            try:
-                console.print(f"\n[{idx}/{len(rows)}] {row['source_column']} -> {row['target_column']}...")
-                
-                args = {
-                    "--source-table-guid": row['source_table_guid'].strip(),
-                    "--target-table-guids": [row['target_table_guid'].strip()],
-                    "--source-column": row['source_column'].strip(),
-                    "--target-columns": [row['target_column'].strip()],
-                    "--process-name": row.get('process_name', '').strip() or None,
-                    "--description": row.get('description', '').strip() or None,
-                    "--owner": row.get('owner', 'data-engineering').strip(),
-                    "--validate-types": validate_types
-                }
-                
-                result = client.lineageCreateColumnLevel(args)
-                
-                if result.get('status') == 'success':
-                    console.print("  [green]SUCCESS[/green]")
-                    success_count += 1
-                else:
-                    console.print(f"  [red]FAILED: {result.get('message', 'Unknown error')}[/red]")
-                    error_count += 1
-                
-                # Rate limiting: small delay between requests
-                import time
-                time.sleep(0.2)
-                
-            except Exception as e:
-                console.print(f"  [red]ERROR: {str(e)}[/red]")
-                error_count += 1
-        
+        job_journal = open_journal(
+            journal, resume_journal, "lineage import-column-csv",
+            csv_job_params(csv_file, batch_size, validate_types=validate_types),
+        )
+
+        result = client.lineageCreateColumnLevelBatch({
+            "--mappings": rows,
+            "--validate-types": validate_types,
+            "--batch-size": batch_size,
+            "--max-parallel": max_parallel,
+            "--progress": lambda done, total: console.print(f"  Submitted {done}/{total}"),
+            "--journal": job_journal,
+            "--retry-failed": retry_failed,
+        })
+
+        for item in result["results"]:
+            if item["status"] == "error":
+                row = rows[item["index"]]
+                console.print(
+                    f"  [red]FAILED row {item['index'] + 1}: {row['source_column']} -> "
+                    f"{row['target_column']}: {item.get('message', 'Unknown error')}[/red]"
+                )
+        success_count = result["created_count"]
+        error_count = result["failed_count"]
+        console.print(f"Resolved {result['tables_read']} table(s)")
+
         # Summary
         console.print(f"\n[bold]Summary:[/bold]")
         console.print(f"  [green]SUCCESS: {success_count}[/green]")
         console.print(f"  [red]FAILED: {error_count}[/red]")
         console.print(f"  Total: {len(rows)}")
+        if result["skipped_count"]:
+            console.print(f"[dim]Skipped {result['skipped_count']} row(s) already handled in journal {resume_journal}[/dim]")
+        if job_journal is not None:
+            console.print(f"[dim]Journal: {job_journal.path}[/dim]")
         
     except Exception as e:
         console.print(f"[red]ERROR: {str(e)}[/red]")
+    finally:
+        if job_journal is not None:
+            job_journal.close()
 
 
 @lineage.command(name="list-column", help="List existing column-level lineage")
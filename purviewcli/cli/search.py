@@ -5,7 +5,9 @@ usage:
     pvw search autoComplete [--keywords=<val> --limit=<val> --filterFile=<val>]
     pvw search browse  (--entityType=<val> | --path=<val>) [--limit=<val> --offset=<val>]
     pvw search query [--keywords=<val> --limit=<val> --offset=<val> --filterFile=<val> --facets-file=<val>]
+    pvw search query --all [--stream --page-size=<val> --keywords=<val> --filterFile=<val>]
     pvw search suggest [--keywords=<val> --limit=<val> --filterFile=<val>]
+    pvw search export --output=<val> [--format=<val> --partition-by=<val> --max-parallel=<val> --resume]
 
 options:
   --purviewName=<val>     [string]  Microsoft Purview account name.
@@ -16,6 +18,9 @@ options:
   --offset=<val>          [integer] Offset for pagination purpose [default: 0].
   --filterFile=<val>      [string]  File path to a filter json file.
   --facets-file=<val>     [string]  File path to a facets json file.
+  --all                   [boolean] Retrieve every result using continuation tokens.
+  --stream                [boolean] Emit results as NDJSON while paging (implies --all).
+  --page-size=<val>       [integer] Results per page when using --all [default: 1000].
 
 """
 
@@ -231,6 +236,38 @@ def _invoke_search_method(method_name, **kwargs):
         console.print(f"[red]ERROR:[/red] {str(e)}")
 
 
+def _query_all(keywords, filterfile, page_size, stream, show_ids, output_json, output_json_detail):
+    """Enumerate every match with Search.iter_search, streaming NDJSON or collecting for display"""
+    # With --stream, stdout carries only NDJSON; diagnostics go to stderr
+    out_console = get_console(stderr=True) if stream else console
+    search_filter = None
+    if filterfile:
+        with open(filterfile, "r", encoding="utf-8") as f:
+            search_filter = json.load(f)
+
+    results = Search().iter_search(
+        filter=search_filter,
+        page_size=page_size,
+        keywords=keywords if keywords is not None else "*",
+    )
+    try:
+        if stream:
+            for item in results:
+                click.echo(json.dumps(item, separators=(",", ":"), ensure_ascii=False))
+            return
+
+        items = list(results)
+        data = {"@search.count": len(items), "value": items}
+        if output_json:
+            _format_json_output(data, pretty=False)
+        elif output_json_detail:
+            _format_json_output(data, pretty=True)
+        else:
+            _format_search_results(data, show_ids=show_ids)
+    except Exception as e:
+        out_console.print(f"[red]ERROR:[/red] {str(e)}")
+
+
 @search.command()
 @click.option("--keywords", required=False)
 @click.option("--limit", required=False, type=int, default=25)
@@ -275,8 +312,27 @@ def browse(entitytype, path, limit, offset, output_json):
 @click.option("--json", "output_json", is_flag=True, help="Show compact JSON (for scripts)")
 @click.option("--json-detail", "output_json_detail", is_flag=True, help="Show pretty JSON with Rich coloring")
 @click.option("--detailed", is_flag=True, help="Show detailed information in readable format")
-def query(keywords, limit, offset, filterfile, facets_file, show_ids, output_json, output_json_detail, detailed):
+@click.option("--all", "all_results", is_flag=True, help="Retrieve every result using continuation tokens (ignores --limit/--offset)")
+@click.option("--stream", is_flag=True, help="Emit results as NDJSON (one JSON object per line) while paging; implies --all")
+@click.option("--page-size", type=click.IntRange(1, 1000), default=1000, show_default=True, help="Results per page with --all")
+def query(
+    keywords,
+    limit,
+    offset,
+    filterfile,
+    facets_file,
+    show_ids,
+    output_json,
+    output_json_detail,
+    detailed,
+    all_results,
+    stream,
+    page_size,
+):
     """Run a search query"""
+    if all_results or stream:
+        _query_all(keywords, filterfile, page_size, stream, show_ids, output_json, output_json_detail)
+        return
     _invoke_search_method(
         "searchQuery",
         keywords=keywords,
@@ -380,6 +436,65 @@ def advanced(
     )
 
 
+@search.command("export")
+@click.option("--output", "output_path", required=True, type=click.Path(dir_okay=False), help="Merged output file")
+@click.option("--format", "fmt", type=click.Choice(["ndjson", "csv", "parquet"]), default="ndjson", show_default=True, help="Output format (parquet requires pyarrow)")
+@click.option("--partition-by", type=click.Choice(["entityType", "collectionId", "assetType"]), default="entityType", show_default=True, help="Facet used to split the catalog into partitions")
+@click.option("--keywords", required=False, help="Keywords applied to all searchable fields (default: *)")
+@click.option("--filterFile", required=False, type=click.Path(exists=True), help="JSON filter applied to the whole export")
+@click.option("--max-parallel", type=click.IntRange(1, 16), default=4, show_default=True, help="Partitions streamed concurrently")
+@click.option("--page-size", type=click.IntRange(1, 1000), default=1000, show_default=True, help="Results per search page")
+@click.option("--resume", is_flag=True, help="Continue an interrupted export from its manifest")
+def export(output_path, fmt, partition_by, keywords, filterfile, max_parallel, page_size, resume):
+    """Export every matching asset using facet-partitioned parallel streams
+
+    \b
+    The catalog is split with one facet query (one partition per facet value
+    plus a remainder), each partition is paged with continuation tokens into
+    <output>.parts/, and the parts are merged into a single file. Progress is
+    tracked in <output>.manifest.json; rerun with --resume after a failure to
+    skip partitions that already finished.
+    """
+    from purviewcli.client.search_export import SearchExporter
+
+    search_filter = None
+    if filterfile:
+        with open(filterfile, "r", encoding="utf-8") as f:
+            search_filter = json.load(f)
+
+    def _report(partition, error):
+        if error is None:
+            console.print(f"[green][OK][/green] {partition['key']}: {partition['records']} assets")
+        else:
+            console.print(f"[red][X][/red] {partition['key']}: {error}")
+
+    try:
+        exporter = SearchExporter(
+            Search(),
+            output_path,
+            fmt=fmt,
+            facet=partition_by,
+            base_filter=search_filter,
+            keywords=keywords if keywords is not None else "*",
+            max_parallel=max_parallel,
+            page_size=page_size,
+            progress=_report,
+        )
+        summary = exporter.run(resume=resume)
+    except Exception as e:
+        raise click.ClickException(str(e))
+
+    if summary["failed"]:
+        raise click.ClickException(
+            f"{len(summary['failed'])} of {summary['partitions']} partitions failed; "
+            "rerun with --resume to retry them"
+        )
+    console.print(
+        f"[green][OK] Exported {summary['records']} assets from {summary['partitions']} partitions "
+        f"to {summary['output']}[/green]"
+    )
+
+
 @search.command("find-table")
 @click.option("--name", required=False, help="Table name (exact or pattern with *)")
 @click.option("--schema", required=False, help="Schema name (e.g., SalesLT, dbo)")
@@ -7,6 +7,7 @@ Replaces data_product functionality with comprehensive Unified Catalog operation
 
 import click
 import csv
+import itertools
 import json
 import tempfile
 import os
@@ -118,6 +119,9 @@ DATA_PRODUCT_TYPES = [
     "SemanticModel",
 ]
 
+# Terms per dry-run preview table for `term import-csv`
+TERM_PREVIEW_PAGE_SIZE = 100
+
 
 def _format_json_output(data):
     """Format JSON output with syntax highlighting using Rich"""
@@ -640,6 +644,9 @@ def delete(product_id, yes):
 @click.option("--max-parallel", default=1, type=click.IntRange(1, 20), show_default=True, help="Number of parallel workers for bulk operations")
 @click.option("--max-retries", default=3, type=click.IntRange(0, 10), show_default=True, help="Retries on 429 rate-limit responses")
 @click.option("--failed-output", type=click.Path(), help="Write failed GUIDs to this file for re-run")
+@click.option("--journal", type=click.Path(dir_okay=False), help="Write-ahead journal (JSONL) recording every linked GUID so a bulk run can be resumed")
+@click.option("--resume", "resume_journal", type=click.Path(exists=True, dir_okay=False), help="Resume the bulk run recorded in this journal, skipping GUIDs already linked")
+@click.option("--retry-failed", is_flag=True, help="With --resume, also retry GUIDs that failed")
 @click.option("--asset-name", help="Override asset name when creating")
 @click.option("--asset-type", default=None, type=click.Choice(["General", "ADLSGen2Path", "AzureSqlTable"]), help="Override asset type when creating")
 @click.option("--type-properties", default="{}", help="JSON object for typeProperties when creating")
@@ -652,6 +659,7 @@ def add_relationship(
     product_id, entity_type, entity_id, asset_id,
     source_asset_id, guids_file, csv_file,
     create_if_missing, dry_run, max_parallel, max_retries, failed_output,
+    journal, resume_journal, retry_failed,
     asset_name, asset_type, type_properties, relationship_type, description, output,
 ):
     """Create a relationship for a data product.
@@ -664,10 +672,13 @@ def add_relationship(
     Use --create-if-missing to materialise assets not yet in Unified Catalog.
     Use --max-parallel for faster bulk runs (up to 20 concurrent workers).
     Use --failed-output failed.txt to save failed GUIDs for re-run.
+    Use --journal job.jsonl to record progress; --resume job.jsonl continues an
+    interrupted bulk run (add --retry-failed to retry failed GUIDs).
     """
     import time
     import concurrent.futures
     from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
+    from purviewcli.client.bulk_journal import open_journal
 
     profile = ctx.obj.get("profile", "default")
 
@@ -788,6 +799,23 @@ def add_relationship(
         console.print("[yellow]No GUIDs found.[/yellow]")
         return
 
+    try:
+        job_journal = None if dry_run else open_journal(
+            journal,
+            resume_journal,
+            "uc dataproduct add-relationship",
+            {"product_id": product_id, "entity_type": entity_type.upper(), "relationship_type": relationship_type},
+        )
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+
+    skipped_count = 0
+    if job_journal is not None:
+        # Each GUID is its own journal entry, keyed by the GUID itself
+        pending = [item for item in items if job_journal.should_run(f"guid:{item[0]}", retry_failed)]
+        skipped_count = len(items) - len(pending)
+        items = pending
+
     ok_count = fail_count = 0
     failed_guids: list[str] = []
     rows: list[tuple] = []
@@ -806,20 +834,36 @@ def add_relationship(
         )
 
         def _run(item):
-            return item[0], _process_one(*item)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel) as pool:
-            futures = {pool.submit(_run, item): item for item in items}
-            for future in concurrent.futures.as_completed(futures):
-                guid, (ok, detail) = future.result()
+            key = f"guid:{item[0]}"
+            if job_journal is not None:
+                job_journal.start(key)
+            try:
+                ok, detail = _process_one(*item)
+            except Exception as exc:
+                ok, detail = False, str(exc)
+            if job_journal is not None:
                 if ok:
-                    ok_count += 1
-                    rows.append((guid, "[green]OK[/green]", str(detail)))
+                    job_journal.complete(key, [detail])
                 else:
-                    fail_count += 1
-                    failed_guids.append(guid)
-                    rows.append((guid, "[red]FAILED[/red]", detail))
-                progress.advance(task)
+                    job_journal.fail(key, detail)
+            return item[0], (ok, detail)
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel) as pool:
+                futures = {pool.submit(_run, item): item for item in items}
+                for future in concurrent.futures.as_completed(futures):
+                    guid, (ok, detail) = future.result()
+                    if ok:
+                        ok_count += 1
+                        rows.append((guid, "[green]OK[/green]", str(detail)))
+                    else:
+                        fail_count += 1
+                        failed_guids.append(guid)
+                        rows.append((guid, "[red]FAILED[/red]", detail))
+                    progress.advance(task)
+        finally:
+            if job_journal is not None:
+                job_journal.close()
 
     # summary table
     summary = Table(title=f"Bulk add — {len(items)} assets{'  [dim](dry-run)[/dim]' if dry_run else ''}", show_header=True)
@@ -830,6 +874,10 @@ def add_relationship(
         summary.add_row(*row)
     console.print(summary)
     console.print(f"[green]OK[/green] {ok_count}   [red]FAILED[/red] {fail_count}")
+    if skipped_count:
+        console.print(f"[dim]Skipped {skipped_count} GUID(s) already handled in journal {resume_journal}[/dim]")
+    if job_journal is not None:
+        console.print(f"[dim]Journal: {job_journal.path}[/dim]")
 
     if failed_output and failed_guids:
         with open(failed_output, "w", encoding="utf-8") as fh:
@@ -1903,6 +1951,195 @@ def _find_existing_term_by_name(client, term_name, domain_id):
         return None
 
 
+def _parse_term_csv_row(row, domain_id, debug, unsupported_fields, quiet=False):
+    """Map one import-csv row to a term dict, or None for rows to skip.
+    
+    Unsupported UI fields found in the row are added to unsupported_fields.
+    With quiet, per-row warnings and debug output are suppressed.
+    """
+    # Skip instruction rows
+    if row.get('Name', '').startswith('(Please remove'):
+        return None
+    
+    # Try to get name from either "Name" or "name" column
+    name = row.get("Name") or row.get("name") or ""
+    if not name.strip():
+        return None
+    
+    # Check for term_id (for idempotent updates on re-import)
+    term_id = row.get("term_id") or row.get("id") or row.get("ID") or row.get("Term ID") or row.get("TermId") or ""
+    
+    term = {
+        "name": name.strip(),
+        "description": (row.get("Definition") or row.get("description") or "").strip(),
+        "status": (row.get("Status") or row.get("status") or "Draft").strip(),
+        "domain_id": domain_id,
+        "term_id": term_id.strip() if term_id else "",
+        "acronyms": [],
+        "owner_ids": [],
+        "expert_ids": [],
+        "synonyms": [],
+        "parent_term_name": "",
+        "parent_term_id": "",
+        "related_term_names": [],
+        "related_term_ids": [],
+        "resources": []
+    }
+    
+    # Parse acronyms from either column name
+    acronym_field = row.get("Acronym") or row.get("acronym") or row.get("acronyms") or ""
+    if acronym_field:
+        term["acronyms"] = [a.strip() for a in acronym_field.split(";") if a.strip()]
+    
+    # Parse resources
+    resources_field = row.get("Resources") or ""
+    resource_name_field = row.get("resource_name") or ""
+    resource_url_field = row.get("resource_url") or ""
+    
+    if resources_field:
+        # UI format: "name:url;name:url"
+        for item in resources_field.split(";"):
+            item = item.strip()
+            if ":" in item:
+                parts = item.split(":", 1)
+                if len(parts) == 2:
+                    name_part = parts[0].strip()
+                    url_part = parts[1].strip()
+                    if url_part.startswith("//") or "://" in item:
+                        # Handle URLs properly
+                        url_full = item.split(":", 1)[1].strip() if not url_part.startswith("//") else item[item.index("://")-4:]
+                        term["resources"].append({"name": name_part, "url": url_full})
+                    else:
+                        term["resources"].append({"name": name_part, "url": url_part})
+    elif resource_name_field and resource_url_field:
+        # CLI format: separate columns
+        names = [n.strip() for n in resource_name_field.split(";") if n.strip()]
+        urls = [u.strip() for u in resource_url_field.split(";") if u.strip()]
+        term["resources"] = [{"name": n, "url": u} for n, u in zip(names, urls)]
+    
+    # Parse custom attributes (nested support via dot notation)
+    term["custom_attributes"] = {}
+    for k, v in row.items():
+        if k and k.startswith('customAttributes.') and v and str(v).strip():
+            # Extract path after 'customAttributes.'
+            path = k.split('.', 1)[1]  # e.g., "Glossaire.Reference" or "Glossaire.Termes a favoriser"
+            # Split on dots, preserve intentional spaces (only strip leading/trailing whitespace from empty parts)
+            parts = [p for p in path.split('.')]  # Keep all parts as-is (preserve spaces)
+            parts = [p for p in parts if p.strip()]  # Remove parts that are empty or whitespace-only
+            
+            if not parts:
+                continue
+            
+            value_str = str(v).strip()
+            
+            # Try to parse JSON values (arrays, objects)
+            value = value_str
+            if value_str.startswith('[') or value_str.startswith('{'):
+                try:
+                    value = json.loads(value_str)
+                except json.JSONDecodeError:
+                    # If JSON parse fails, keep as string
+                    value = value_str
+            
+            # Build nested dictionary structure
+            current = term["custom_attributes"]
+            for i, part in enumerate(parts[:-1]):
+                if part not in current:
+                    current[part] = {}
+                current = current[part]
+            current[parts[-1]] = value
+            
+            if debug and not quiet:
+                console.print(f"[dim]Parsed custom attribute: {'.'.join(parts)} = {value_str}[/dim]")
+    
+    # Handle owners from various column names
+    owner_ids_field = row.get("owner_ids") or row.get("owner_id") or ""
+    experts_field = row.get("Experts") or row.get("experts") or ""
+    stewards_field = row.get("Stewards") or ""
+    
+    if owner_ids_field:
+        # CLI format: GUIDs separated by semicolon
+        term["owner_ids"] = [o.strip() for o in owner_ids_field.split(";") if o.strip()]
+    
+    # Handle experts separately (new field)
+    if experts_field:
+        # Semicolon separated: guid;guid;guid
+        # Also handle UI format: email:info;email:info
+        for item in experts_field.split(";"):
+            item = item.strip()
+            if item:
+                # Extract contact ID (before colon if UI format)
+                contact = item.split(":")[0].strip()
+                if contact:
+                    term["expert_ids"].append(contact)
+    
+    # Handle stewards (legacy - add to owners)
+    if stewards_field and not owner_ids_field:
+        # UI format: email:info;email:info
+        for item in stewards_field.split(";"):
+            item = item.strip()
+            if item:
+                contact = item.split(":")[0].strip()
+                term["owner_ids"].append(contact)
+    
+    # Validation warnings
+    if not quiet and any("@" in owner for owner in term["owner_ids"]):
+        console.print(f"[yellow]WARNING: Term '{term['name']}' has email addresses in owners[/yellow]")
+        console.print(f"[dim]UC API requires Entra Object IDs (GUIDs). Emails may fail.[/dim]")
+    
+    if not quiet and any("@" in expert for expert in term["expert_ids"]):
+        console.print(f"[yellow]WARNING: Term '{term['name']}' has email addresses in experts[/yellow]")
+        console.print(f"[dim]UC API requires Entra Object IDs (GUIDs). Emails may fail.[/dim]")
+    
+    # Parse synonyms
+    synonyms_field = row.get("Synonyms") or row.get("synonyms") or row.get("synonym") or ""
+    if synonyms_field:
+        # Semicolon separated only
+        term["synonyms"] = [s.strip() for s in synonyms_field.split(";") if s.strip()]
+    
+    # Parse parent term
+    parent_term_name = row.get("Parent Term Name") or row.get("parent_term_name") or ""
+    parent_term_id = row.get("parent_term_id") or row.get("parentId") or ""
+    if parent_term_name:
+        term["parent_term_name"] = parent_term_name.strip()
+    if parent_term_id:
+        term["parent_term_id"] = parent_term_id.strip()
+    
+    # Parse related terms
+    related_terms_field = row.get("Related Terms") or row.get("related_terms") or row.get("related_term_names") or ""
+    related_term_ids_field = row.get("related_term_ids") or ""
+    if related_terms_field:
+        # Semicolon separated only
+        term["related_term_names"] = [r.strip() for r in related_terms_field.split(";") if r.strip()]
+    if related_term_ids_field:
+        # Semicolon separated only
+        term["related_term_ids"] = [r.strip() for r in related_term_ids_field.split(";") if r.strip()]
+    
+    # Warn about unsupported fields (only once)
+    if row.get("Term Template Names"):
+        unsupported_fields.add("Term Templates")
+    
+    return term
+
+
+def _print_unsupported_term_fields(unsupported_fields):
+    """Print the UI-only fields that were found in an import-csv file."""
+    if unsupported_fields:
+        console.print("\n[yellow]NOTE: Following UI fields are not supported by UC API:[/yellow]")
+        for field in unsupported_fields:
+            console.print(f"  [dim]- {field} (will be ignored)[/dim]")
+        console.print()
+
+
+def _iter_csv_terms(csv_file, domain_id, debug, unsupported_fields, quiet=False):
+    """Lazily yield parsed terms from an import-csv file, one row at a time."""
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            term = _parse_term_csv_row(row, domain_id, debug, unsupported_fields, quiet)
+            if term is not None:
+                yield term
+
+
 @term.command(name="import-csv")
 @click.option("--csv-file", required=True, type=click.Path(exists=True), help="Path to CSV file with terms")
 @click.option("--domain-id", required=True, help="Governance domain ID for all terms")
@@ -1967,266 +2204,102 @@ def import_terms_from_csv(csv_file, domain_id, dry_run, debug, update_existing):
         
         console.print(f"[cyan]Importing terms from: {csv_file}[/cyan]")
         
-        # Read and parse CSV - adapt to whatever columns exist
-        terms = []
+        # Terms are parsed lazily so the CSV is never held in memory as a whole.
+        # A preview pass counts them and reports row warnings and ignored UI
+        # fields before anything is sent; the import then re-reads the file.
         unsupported_fields = set()
-        
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                # Skip instruction rows
-                if row.get('Name', '').startswith('(Please remove'):
-                    continue
-                
-                # Try to get name from either "Name" or "name" column
-                name = row.get("Name") or row.get("name") or ""
-                if not name.strip():
-                    continue
-                
-                # Check for term_id (for idempotent updates on re-import)
-                term_id = row.get("term_id") or row.get("id") or row.get("ID") or row.get("Term ID") or row.get("TermId") or ""
-                
-                term = {
-                    "name": name.strip(),
-                    "description": (row.get("Definition") or row.get("description") or "").strip(),
-                    "status": (row.get("Status") or row.get("status") or "Draft").strip(),
-                    "domain_id": domain_id,
-                    "term_id": term_id.strip() if term_id else "",
-                    "acronyms": [],
-                    "owner_ids": [],
-                    "expert_ids": [],
-                    "synonyms": [],
-                    "parent_term_name": "",
-                    "parent_term_id": "",
-                    "related_term_names": [],
-                    "related_term_ids": [],
-                    "resources": []
-                }
-                
-                # Parse acronyms from either column name
-                acronym_field = row.get("Acronym") or row.get("acronym") or row.get("acronyms") or ""
-                if acronym_field:
-                    term["acronyms"] = [a.strip() for a in acronym_field.split(";") if a.strip()]
-                
-                # Parse resources
-                resources_field = row.get("Resources") or ""
-                resource_name_field = row.get("resource_name") or ""
-                resource_url_field = row.get("resource_url") or ""
-                
-                if resources_field:
-                    # UI format: "name:url;name:url"
-                    for item in resources_field.split(";"):
-                        item = item.strip()
-                        if ":" in item:
-                            parts = item.split(":", 1)
-                            if len(parts) == 2:
-                                name_part = parts[0].strip()
-                                url_part = parts[1].strip()
-                                if url_part.startswith("//") or "://" in item:
-                                    # Handle URLs properly
-                                    url_full = item.split(":", 1)[1].strip() if not url_part.startswith("//") else item[item.index("://")-4:]
-                                    term["resources"].append({"name": name_part, "url": url_full})
-                                else:
-                                    term["resources"].append({"name": name_part, "url": url_part})
-                elif resource_name_field and resource_url_field:
-                    # CLI format: separate columns
-                    names = [n.strip() for n in resource_name_field.split(";") if n.strip()]
-                    urls = [u.strip() for u in resource_url_field.split(";") if u.strip()]
-                    term["resources"] = [{"name": n, "url": u} for n, u in zip(names, urls)]
-                
-                # Parse custom attributes (nested support via dot notation)
-                term["custom_attributes"] = {}
-                for k, v in row.items():
-                    if k and k.startswith('customAttributes.') and v and str(v).strip():
-                        # Extract path after 'customAttributes.'
-                        path = k.split('.', 1)[1]  # e.g., "Glossaire.Reference" or "Glossaire.Termes a favoriser"
-                        # Split on dots, preserve intentional spaces (only strip leading/trailing whitespace from empty parts)
-                        parts = [p for p in path.split('.')]  # Keep all parts as-is (preserve spaces)
-                        parts = [p for p in parts if p.strip()]  # Remove parts that are empty or whitespace-only
-                        
-                        if not parts:
-                            continue
-                        
-                        value_str = str(v).strip()
-                        
-                        # Try to parse JSON values (arrays, objects)
-                        value = value_str
-                        if value_str.startswith('[') or value_str.startswith('{'):
-                            try:
-                                value = json.loads(value_str)
-                            except json.JSONDecodeError:
-                                # If JSON parse fails, keep as string
-                                value = value_str
-                        
-                        # Build nested dictionary structure
-                        current = term["custom_attributes"]
-                        for i, part in enumerate(parts[:-1]):
-                            if part not in current:
-                                current[part] = {}
-                            current = current[part]
-                        current[parts[-1]] = value
-                        
-                        if debug:
-                            console.print(f"[dim]Parsed custom attribute: {'.'.join(parts)} = {value_str}[/dim]")
-                
-                # Handle owners from various column names
-                owner_ids_field = row.get("owner_ids") or row.get("owner_id") or ""
-                experts_field = row.get("Experts") or row.get("experts") or ""
-                stewards_field = row.get("Stewards") or ""
-                
-                if owner_ids_field:
-                    # CLI format: GUIDs separated by semicolon
-                    term["owner_ids"] = [o.strip() for o in owner_ids_field.split(";") if o.strip()]
-                
-                # Handle experts separately (new field)
-                if experts_field:
-                    # Semicolon separated: guid;guid;guid
-                    # Also handle UI format: email:info;email:info
-                    for item in experts_field.split(";"):
-                        item = item.strip()
-                        if item:
-                            # Extract contact ID (before colon if UI format)
-                            contact = item.split(":")[0].strip()
-                            if contact:
-                                term["expert_ids"].append(contact)
-                
-                # Handle stewards (legacy - add to owners)
-                if stewards_field and not owner_ids_field:
-                    # UI format: email:info;email:info
-                    for item in stewards_field.split(";"):
-                        item = item.strip()
-                        if item:
-                            contact = item.split(":")[0].strip()
-                            term["owner_ids"].append(contact)
-                
-                # Validation warnings
-                if any("@" in owner for owner in term["owner_ids"]):
-                    console.print(f"[yellow]WARNING: Term '{term['name']}' has email addresses in owners[/yellow]")
-                    console.print(f"[dim]UC API requires Entra Object IDs (GUIDs). Emails may fail.[/dim]")
-                
-                if any("@" in expert for expert in term["expert_ids"]):
-                    console.print(f"[yellow]WARNING: Term '{term['name']}' has email addresses in experts[/yellow]")
-                    console.print(f"[dim]UC API requires Entra Object IDs (GUIDs). Emails may fail.[/dim]")
-                
-                # Parse synonyms
-                synonyms_field = row.get("Synonyms") or row.get("synonyms") or row.get("synonym") or ""
-                if synonyms_field:
-                    # Semicolon separated only
-                    term["synonyms"] = [s.strip() for s in synonyms_field.split(";") if s.strip()]
-                
-                # Parse parent term
-                parent_term_name = row.get("Parent Term Name") or row.get("parent_term_name") or ""
-                parent_term_id = row.get("parent_term_id") or row.get("parentId") or ""
-                if parent_term_name:
-                    term["parent_term_name"] = parent_term_name.strip()
-                if parent_term_id:
-                    term["parent_term_id"] = parent_term_id.strip()
-                
-                # Parse related terms
-                related_terms_field = row.get("Related Terms") or row.get("related_terms") or row.get("related_term_names") or ""
-                related_term_ids_field = row.get("related_term_ids") or ""
-                if related_terms_field:
-                    # Semicolon separated only
-                    term["related_term_names"] = [r.strip() for r in related_terms_field.split(";") if r.strip()]
-                if related_term_ids_field:
-                    # Semicolon separated only
-                    term["related_term_ids"] = [r.strip() for r in related_term_ids_field.split(";") if r.strip()]
-                
-                # Warn about unsupported fields (only once)
-                if row.get("Term Template Names"):
-                    unsupported_fields.add("Term Templates")
-                
-                terms.append(term)
-        
-        if not terms:
+        term_count = sum(1 for _ in _iter_csv_terms(csv_file, domain_id, debug, unsupported_fields))
+        if not term_count:
             console.print("[yellow]No valid terms found in CSV file.[/yellow]")
             return
         
-        if unsupported_fields:
-            console.print("\n[yellow]NOTE: Following UI fields are not supported by UC API:[/yellow]")
-            for field in unsupported_fields:
-                console.print(f"  [dim]- {field} (will be ignored)[/dim]")
-            console.print()
-        
-        console.print(f"[cyan]Found {len(terms)} term(s) in CSV file[/cyan]")
+        _print_unsupported_term_fields(unsupported_fields)
+        console.print(f"[cyan]Found {term_count} term(s) in CSV file[/cyan]")
+        terms = _iter_csv_terms(csv_file, domain_id, debug, set(), quiet=True)
         
         if dry_run:
             console.print("\n[yellow]DRY RUN - Preview of terms to be created:[/yellow]\n")
-            table = Table(title="Terms to Import")
-            table.add_column("#", style="dim", width=4)
-            table.add_column("Name", style="cyan")
-            table.add_column("Status", style="yellow")
-            table.add_column("Parent", style="blue", width=15)
-            table.add_column("Synonyms", style="magenta", width=15)
-            table.add_column("Experts", style="green", width=15)
-            
-            for i, term in enumerate(terms, 1):
-                parent_info = term.get("parent_term_name") or (term.get("parent_term_id", "")[:12] + "..." if term.get("parent_term_id") else "-")
-                synonyms = ", ".join(term.get("synonyms", []))[:15] or "-"
-                experts = str(len(term.get("expert_ids", []))) + " expert(s)" if term.get("expert_ids") else "-"
-                table.add_row(
-                    str(i),
-                    term["name"],
-                    term["status"],
-                    parent_info,
-                    synonyms,
-                    experts
-                )
-            
-            console.print(table)
-            console.print(f"\n[dim]Domain ID: {domain_id}[/dim]")
+            console.print(f"[dim]Domain ID: {domain_id}[/dim]")
             console.print(f"[dim]Update existing: {update_existing}[/dim]")
             
-            # Show detailed information for each term
-            for i, term in enumerate(terms, 1):
-                details = []
+            # Preview one page of terms at a time so large files are never materialized
+            shown = 0
+            while True:
+                page = list(itertools.islice(terms, TERM_PREVIEW_PAGE_SIZE))
+                if not page:
+                    break
                 
-                # Show what will happen during import
-                console.print(f"\n[cyan]Term {i} - {term['name']}:[/cyan]")
+                table = Table(title="Terms to Import")
+                table.add_column("#", style="dim", width=4)
+                table.add_column("Name", style="cyan")
+                table.add_column("Status", style="yellow")
+                table.add_column("Parent", style="blue", width=15)
+                table.add_column("Synonyms", style="magenta", width=15)
+                table.add_column("Experts", style="green", width=15)
                 
-                # Basic fields
-                if term.get("acronyms"):
-                    console.print(f"  [dim]Acronyms: {', '.join(term['acronyms'])}[/dim]")
-                if term.get("owner_ids"):
-                    console.print(f"  [dim]Owners: {len(term['owner_ids'])} owner(s)[/dim]")
+                for i, term in enumerate(page, shown + 1):
+                    parent_info = term.get("parent_term_name") or (term.get("parent_term_id", "")[:12] + "..." if term.get("parent_term_id") else "-")
+                    synonyms = ", ".join(term.get("synonyms", []))[:15] or "-"
+                    experts = str(len(term.get("expert_ids", []))) + " expert(s)" if term.get("expert_ids") else "-"
+                    table.add_row(
+                        str(i),
+                        term["name"],
+                        term["status"],
+                        parent_info,
+                        synonyms,
+                        experts
+                    )
+
+                console.print(table)
                 
-                # POST-PROCESSING operations that will occur
-                if term.get("parent_term_name"):
-                    console.print(f"  [yellow]→ Will search for parent '{term['parent_term_name']}' and link after creation[/yellow]")
-                elif term.get("parent_term_id"):
-                    console.print(f"  [green]→ Will link to parent ID: {term['parent_term_id'][:20]}...[/green]")
+                # Show detailed information for each term
+                for i, term in enumerate(page, shown + 1):
+                    # Show what will happen during import
+                    console.print(f"\n[cyan]Term {i} - {term['name']}:[/cyan]")
                 
-                if term.get("expert_ids"):
-                    console.print(f"  [yellow]→ Will add {len(term['expert_ids'])} expert(s) after creation[/yellow]")
-                    if debug:
-                        for expert in term["expert_ids"]:
-                            console.print(f"    - {expert}")
+                    # Basic fields
+                    if term.get("acronyms"):
+                        console.print(f"  [dim]Acronyms: {', '.join(term['acronyms'])}[/dim]")
+                    if term.get("owner_ids"):
+                        console.print(f"  [dim]Owners: {len(term['owner_ids'])} owner(s)[/dim]")
                 
-                if term.get("synonyms"):
-                    console.print(f"  [yellow]→ Will create/link {len(term['synonyms'])} synonym(s) after creation[/yellow]")
-                    if debug:
-                        for syn in term["synonyms"]:
-                            console.print(f"    - {syn}")
+                    # POST-PROCESSING operations that will occur
+                    if term.get("parent_term_name"):
+                        console.print(f"  [yellow]→ Will search for parent '{term['parent_term_name']}' and link after creation[/yellow]")
+                    elif term.get("parent_term_id"):
+                        console.print(f"  [green]→ Will link to parent ID: {term['parent_term_id'][:20]}...[/green]")
                 
-                if term.get("related_term_names"):
-                    console.print(f"  [yellow]→ Will search and link {len(term['related_term_names'])} related term(s)[/yellow]")
-                    if debug:
-                        console.print(f"    {', '.join(term['related_term_names'])}")
+                    if term.get("expert_ids"):
+                        console.print(f"  [yellow]→ Will add {len(term['expert_ids'])} expert(s) after creation[/yellow]")
+                        if debug:
+                            for expert in term["expert_ids"]:
+                                console.print(f"    - {expert}")
                 
-                if term.get("related_term_ids"):
-                    console.print(f"  [yellow]→ Will link {len(term['related_term_ids'])} related term(s) by ID[/yellow]")
+                    if term.get("synonyms"):
+                        console.print(f"  [yellow]→ Will create/link {len(term['synonyms'])} synonym(s) after creation[/yellow]")
+                        if debug:
+                            for syn in term["synonyms"]:
+                                console.print(f"    - {syn}")
                 
-                if term.get("resources"):
-                    console.print(f"  [dim]Resources: {len(term['resources'])} resource(s)[/dim]")
-                    if debug:
-                        for res in term["resources"]:
-                            console.print(f"    - {res['name']}: {res['url']}")
+                    if term.get("related_term_names"):
+                        console.print(f"  [yellow]→ Will search and link {len(term['related_term_names'])} related term(s)[/yellow]")
+                        if debug:
+                            console.print(f"    {', '.join(term['related_term_names'])}")
                 
-                if term.get("custom_attributes"):
-                    console.print(f"  [dim]Custom Attributes:[/dim]")
-                    console.print(f"[dim]{json.dumps(term['custom_attributes'], indent=4)}[/dim]")
-            
+                    if term.get("related_term_ids"):
+                        console.print(f"  [yellow]→ Will link {len(term['related_term_ids'])} related term(s) by ID[/yellow]")
+                
+                    if term.get("resources"):
+                        console.print(f"  [dim]Resources: {len(term['resources'])} resource(s)[/dim]")
+                        if debug:
+                            for res in term["resources"]:
+                                console.print(f"    - {res['name']}: {res['url']}")
+                
+                    if term.get("custom_attributes"):
+                        console.print(f"  [dim]Custom Attributes:[/dim]")
+                        console.print(f"[dim]{json.dumps(term['custom_attributes'], indent=4)}[/dim]")
+
+                shown += len(page)
             return
         
         # Import terms (one by one using single POST)
@@ -2235,10 +2308,12 @@ def import_terms_from_csv(csv_file, domain_id, dry_run, debug, update_existing):
         failed_count = 0
         failed_terms = []
         skipped_count = 0
+        processed_count = 0
         
         with console.status("[bold green]Importing terms...") as status:
             for i, term in enumerate(terms, 1):
-                status.update(f"[bold green]Processing term {i}/{len(terms)}: {term['name']}")
+                processed_count = i
+                status.update(f"[bold green]Processing term {i}/{term_count}: {term['name']}")
                 
                 try:
                     # Check if term already exists
@@ -2455,7 +2530,7 @@ def import_terms_from_csv(csv_file, domain_id, dry_run, debug, update_existing):
         # Summary
         console.print("\n" + "="*60)
         console.print(f"[cyan]Import Summary:[/cyan]")
-        console.print(f"  Total terms processed: {len(terms)}")
+        console.print(f"  Total terms processed: {processed_count}")
         console.print(f"  [green]Successfully created: {success_count}[/green]")
         console.print(f"  [blue]Successfully updated: {updated_count}[/blue]")
         console.print(f"  [red]Failed: {failed_count}[/red]")
@@ -955,14 +955,12 @@ Use Cases:
         else:
             raise ValueError(f"Unsupported file format: {file_ext}. Supported formats: .csv, .json")
 
-    def _process_csv_direct_lineage(self, csv_file, df, args):
-        """Process CSV file for direct lineage relationships (UI-style)"""
-        import pandas as pd
-        
+    def _process_csv_direct_lineage(self, csv_file, frames, args):
+        """Process CSV chunks for direct lineage relationships (UI-style)"""
         # Create direct lineage relationships
         relationships = []
         
-        for idx, row in df.iterrows():
+        for idx, row in (item for df in frames for item in df.iterrows()):
             # Get relationship type
             relationship_type = str(row.get('relationship_type', 'direct_lineage_dataset_dataset')).strip()
             
@@ -1004,13 +1002,14 @@ Use Cases:
     def _process_csv_lineage(self, csv_file, args):
         """Process CSV file and convert to lineage API format"""
         import pandas as pd
+        from .csv_stream import DEFAULT_CHUNK_ROWS, iter_csv_batches, read_csv_preview
         
-        # Read CSV file
-        df = pd.read_csv(csv_file)
+        # Rows are streamed in chunks; only the header is read up front
+        columns = read_csv_preview(csv_file, rows=0).columns
         
         # Determine which format is being used (GUID-based or qualified name-based)
-        has_guid_columns = 'source_entity_guid' in df.columns and 'target_entity_guid' in df.columns
-        has_qn_columns = 'source_qualified_name' in df.columns and 'target_qualified_name' in df.columns
+        has_guid_columns = 'source_entity_guid' in columns and 'target_entity_guid' in columns
+        has_qn_columns = 'source_qualified_name' in columns and 'target_qualified_name' in columns
         
         if not has_guid_columns and not has_qn_columns:
             raise ValueError(
@@ -1021,7 +1020,7 @@ Use Cases:
         # Check if any row uses direct relationship types (not Process-based lineage)
         # If so, we'll create relationships instead of Process entities
         use_direct_lineage = False
-        if 'relationship_type' in df.columns:
+        if 'relationship_type' in columns:
             # List of official direct relationship types supported by Microsoft Purview
             # Reference: https://learn.microsoft.com/en-us/purview/data-gov-api-create-lineage-relationships#concepts
             direct_relationship_types = [
@@ -1029,18 +1028,23 @@ Use Cases:
                 'dataset_process_inputs',          # DataSet → Process (input)
                 'process_dataset_outputs'          # Process → DataSet (output)
             ]
+            # Scan only the relationship_type column before building the payload
             use_direct_lineage = any(
-                df['relationship_type'].str.contains('|'.join(direct_relationship_types), na=False, case=False)
+                chunk['relationship_type'].astype(str).str.contains(
+                    '|'.join(direct_relationship_types), na=False, case=False
+                ).any()
+                for chunk in iter_csv_batches(csv_file, DEFAULT_CHUNK_ROWS, usecols=['relationship_type'])
             )
         
+        frames = iter_csv_batches(csv_file, DEFAULT_CHUNK_ROWS)
         if use_direct_lineage:
             # Create direct relationships (UI-style lineage)
-            return self._process_csv_direct_lineage(csv_file, df, args)
+            return self._process_csv_direct_lineage(csv_file, frames, args)
         
         # Generate lineage entities (relationships are defined via inputs/outputs attributes)
         lineage_entities = []
         
-        for idx, row in df.iterrows():
+        for idx, row in (item for df in frames for item in df.iterrows()):
             # Create process entity for each lineage relationship
             # Use unique negative GUIDs (-1, -2, -3, ...) to let Atlas auto-generate the GUID for each Process
             process_guid = f"-{idx + 1}"
@@ -1221,19 +1225,17 @@ Use Cases:
         - [TODO: Include business context]
         - [TODO: Explain when to use this method]
     """
-        import pandas as pd
+        from .csv_stream import DEFAULT_CHUNK_ROWS, iter_csv_batches, read_csv_preview
         
         csv_file = args.get("csv_file") or args.get("--csv-file")
         if not csv_file:
             return {"success": False, "error": "CSV file path is required"}
         
         try:
-            # Read CSV
-            df = pd.read_csv(csv_file)
-            
-            # Check required columns
+            # Check required columns from the header, then stream the rows
+            columns = read_csv_preview(csv_file, rows=0).columns
             required_columns = ['source_entity_guid', 'target_entity_guid']
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            missing_columns = [col for col in required_columns if col not in columns]
             
             if missing_columns:
                 return {
@@ -1247,18 +1249,21 @@ Use Cases:
             guid_pattern = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
             
             invalid_guids = []
-            for idx, row in df.iterrows():
-                source_guid = str(row['source_entity_guid']).strip()
-                target_guid = str(row['target_entity_guid']).strip()
-                
-                # Remove guid= prefix if present
-                source_guid = source_guid.replace('guid=', '').strip('"')
-                target_guid = target_guid.replace('guid=', '').strip('"')
-                
-                if not guid_pattern.match(source_guid):
-                    invalid_guids.append(f"Row {int(idx) + 1}: Invalid source GUID '{source_guid}'")
-                if not guid_pattern.match(target_guid):
-                    invalid_guids.append(f"Row {int(idx) + 1}: Invalid target GUID '{target_guid}'")
+            row_count = 0
+            for df in iter_csv_batches(csv_file, DEFAULT_CHUNK_ROWS):
+                row_count += len(df)
+                for idx, row in df.iterrows():
+                    source_guid = str(row['source_entity_guid']).strip()
+                    target_guid = str(row['target_entity_guid']).strip()
+                    
+                    # Remove guid= prefix if present
+                    source_guid = source_guid.replace('guid=', '').strip('"')
+                    target_guid = target_guid.replace('guid=', '').strip('"')
+                    
+                    if not guid_pattern.match(source_guid):
+                        invalid_guids.append(f"Row {int(idx) + 1}: Invalid source GUID '{source_guid}'")
+                    if not guid_pattern.match(target_guid):
+                        invalid_guids.append(f"Row {int(idx) + 1}: Invalid target GUID '{target_guid}'")
             
             if invalid_guids:
                 return {
@@ -1269,8 +1274,8 @@ Use Cases:
             
             return {
                 "success": True,
-                "rows": len(df),
-                "columns": list(df.columns)
+                "rows": row_count,
+                "columns": list(columns)
             }
             
         except Exception as e:
@@ -1953,65 +1958,17 @@ Use Cases:
                     })
                     continue
             
-            # Generate unique qualified name and process name
+            # Create Process entity and relationships for this target
             process_guid = f"-{idx + 1}"  # -1, -2, -3, etc. for each process
-            qualified_name = f"ColumnMapping_{source_column_name}_{source_table_guid}_to_{target_column_name}_{target_table_guid}@default"
-            
-            default_process_name = f"{source_column_name}_to_{target_column_name}_Mapping"
-            final_process_name = process_name if process_name else default_process_name
-            
-            default_description = f"Column lineage: {source_column_name} -> {target_column_name}"
-            final_description = description if description else default_description
-            
-            # Create Process entity for this target
-            process_entity = {
-                "guid": process_guid,
-                "typeName": "Process",
-                "attributes": {
-                    "qualifiedName": qualified_name,
-                    "name": final_process_name,
-                    "description": final_description,
-                    "owner": owner,
-                    "inputs": [{"guid": source_column_guid, "typeName": "column"}],
-                    "outputs": [{"guid": target_column_guid, "typeName": "column"}]
-                },
-                "classifications": [],
-                "meanings": []
-            }
-            
-            all_entities.append(process_entity)
-            
-            # Create relationships for this process
-            input_relationship = {
-                "guid": str(relationship_guid_counter),
-                "typeName": "dataset_process_inputs",
-                "end1": {
-                    "guid": source_column_guid,
-                    "typeName": "column"
-                },
-                "end2": {
-                    "guid": process_guid,
-                    "typeName": "Process"
-                }
-            }
-            relationship_guid_counter -= 1
-            
-            output_relationship = {
-                "guid": str(relationship_guid_counter),
-                "typeName": "process_dataset_outputs",
-                "end1": {
-                    "guid": process_guid,
-                    "typeName": "Process"
-                },
-                "end2": {
-                    "guid": target_column_guid,
-                    "typeName": "column"
-                }
-            }
-            relationship_guid_counter -= 1
-            
-            all_relationships.append(input_relationship)
-            all_relationships.append(output_relationship)
+            all_entities.append(self._column_process_entity(
+                process_guid, source_table_guid, source_column_name, source_column_guid,
+                target_table_guid, target_column_name, target_column_guid,
+                process_name, description, owner,
+            ))
+            all_relationships.extend(self._column_process_relationships(
+                process_guid, source_column_guid, target_column_guid, relationship_guid_counter
+            ))
+            relationship_guid_counter -= 2
             
             results.append({
                 "target_index": idx,
@@ -2056,7 +2013,263 @@ Use Cases:
             "results": results,
             "api_response": api_result
         }
-    
+
+    @staticmethod
+    def _column_process_entity(process_guid, source_table_guid, source_column_name, source_column_guid,
+                               target_table_guid, target_column_name, target_column_guid,
+                               process_name=None, description=None, owner="data-engineering"):
+        """Build the Process entity that maps one source column to one target column."""
+        qualified_name = f"ColumnMapping_{source_column_name}_{source_table_guid}_to_{target_column_name}_{target_table_guid}@default"
+        return {
+            "guid": process_guid,
+            "typeName": "Process",
+            "attributes": {
+                "qualifiedName": qualified_name,
+                "name": process_name or f"{source_column_name}_to_{target_column_name}_Mapping",
+                "description": description or f"Column lineage: {source_column_name} -> {target_column_name}",
+                "owner": owner,
+                "inputs": [{"guid": source_column_guid, "typeName": "column"}],
+                "outputs": [{"guid": target_column_guid, "typeName": "column"}]
+            },
+            "classifications": [],
+            "meanings": []
+        }
+
+    @staticmethod
+    def _column_process_relationships(process_guid, source_column_guid, target_column_guid, first_guid):
+        """Build the input/output relationships of a column Process (temporary GUIDs first_guid, first_guid - 1)."""
+        return [
+            {
+                "guid": str(first_guid),
+                "typeName": "dataset_process_inputs",
+                "end1": {"guid": source_column_guid, "typeName": "column"},
+                "end2": {"guid": process_guid, "typeName": "Process"}
+            },
+            {
+                "guid": str(first_guid - 1),
+                "typeName": "process_dataset_outputs",
+                "end1": {"guid": process_guid, "typeName": "Process"},
+                "end2": {"guid": target_column_guid, "typeName": "column"}
+            },
+        ]
+
+    def _read_table_columns(self, table_guids, read_batch_size=50):
+        """
+        Resolve the columns of many tables with bulk entity reads.
+
+        Returns:
+            (columns, errors): columns maps table GUID -> {lower-case column name: column
+            header}; errors maps table GUIDs that could not be read to a message
+        """
+        from .endpoint import get_data
+
+        columns = {}
+        errors = {}
+        table_guids = list(dict.fromkeys(table_guids))
+        for start in range(0, len(table_guids), read_batch_size):
+            chunk = table_guids[start:start + read_batch_size]
+            response = get_data({
+                "app": "catalog",
+                "method": "GET",
+                "endpoint": ENDPOINTS["entity"]["list_by_guids"],
+                "params": {**get_api_version_params("datamap"), "guid": chunk, "minExtInfo": "false"},
+            })
+            if not isinstance(response, dict) or response.get("status") == "error":
+                for guid in chunk:
+                    errors[guid] = f"Failed to read table: {response}"
+                continue
+            for entity in response.get("entities", []) or []:
+                table_columns = entity.get("relationshipAttributes", {}).get("columns", []) or []
+                by_name = {}
+                for col in table_columns:
+                    # First match wins, like the linear scan in lineageCreateColumnLevel
+                    by_name.setdefault((col.get("displayText") or "").lower(), col)
+                columns[entity.get("guid")] = by_name
+            for guid in chunk:
+                if guid not in columns:
+                    errors[guid] = "Table not found"
+        return columns, errors
+
+    def lineageCreateColumnLevelBatch(self, args):
+        """
+Create many column-level lineages with bulk reads and bulk writes.
+
+Equivalent to calling lineageCreateColumnLevel once per mapping, but every table is
+read once (through bulk entity reads) and the Process entities are written in
+chunked /entity/bulk requests instead of one request per mapping.
+
+Args:
+        args: Dictionary containing:
+            --mappings: List of dicts with source_table_guid, source_column,
+                target_table_guid, target_column and optional process_name,
+                description, owner
+            --validate-types: Boolean to validate column type compatibility
+            --batch-size: Mappings per /entity/bulk request (default: 100)
+            --read-batch-size: Tables per bulk read (default: 50)
+            --max-parallel: Bulk write requests in flight (default: 1)
+            --progress: Optional callback(done, total) called after each write
+            --journal: Optional BulkJournal; every --batch-size row range is
+                journaled (key rows:start-stop) and ranges already done are skipped
+            --retry-failed: With --journal, also re-run ranges that failed
+
+Returns:
+        Dictionary with status, created_count, failed_count, skipped_count and
+        one result per mapping (index, status, message) in input order
+
+Example:
+        client = Lineage()
+        result = client.lineageCreateColumnLevelBatch({"--mappings": rows, "--batch-size": 200})
+    """
+        from .bulk_executor import run_batches
+        from .bulk_journal import extract_guids, row_range_key
+        from .endpoint import get_data
+
+        mappings = args.get("--mappings") or []
+        validate_types = args.get("--validate-types", False)
+        batch_size = max(1, int(args.get("--batch-size") or 100))
+        read_batch_size = max(1, int(args.get("--read-batch-size") or 50))
+        max_parallel = max(1, int(args.get("--max-parallel") or 1))
+        progress = args.get("--progress")
+        journal = args.get("--journal")
+        retry_failed = args.get("--retry-failed", False)
+
+        def _field(mapping, name, default=None):
+            value = mapping.get(name)
+            value = value.strip() if isinstance(value, str) else value
+            return value or default
+
+        # Rows are written in fixed row ranges so journal keys stay stable across runs
+        results = [None] * len(mappings)
+        ranges = []
+        for start in range(0, len(mappings), batch_size):
+            stop = min(start + batch_size, len(mappings))
+            key = row_range_key(start, stop)
+            if journal is not None and not journal.should_run(key, retry_failed):
+                for idx in range(start, stop):
+                    results[idx] = {"index": idx, "status": "skipped", "message": "Already handled in journal"}
+                continue
+            ranges.append((key, start, stop))
+        pending = [idx for _, start, stop in ranges for idx in range(start, stop)]
+
+        # Step 1: resolve every distinct table once
+        table_guids = []
+        for idx in pending:
+            table_guids.append(_field(mappings[idx], "source_table_guid"))
+            table_guids.append(_field(mappings[idx], "target_table_guid"))
+        columns, table_errors = self._read_table_columns([g for g in table_guids if g], read_batch_size)
+
+        # Step 2: map rows to Process entities without further reads
+        prepared = []
+        for idx in pending:
+            mapping = mappings[idx]
+            source_table_guid = _field(mapping, "source_table_guid")
+            target_table_guid = _field(mapping, "target_table_guid")
+            source_column_name = _field(mapping, "source_column", "")
+            target_column_name = _field(mapping, "target_column", "")
+            message = None
+            source_column = target_column = None
+            if not (source_table_guid and target_table_guid and source_column_name and target_column_name):
+                message = "Missing source/target table GUID or column"
+            elif source_table_guid in table_errors:
+                message = f"Source table {source_table_guid}: {table_errors[source_table_guid]}"
+            elif target_table_guid in table_errors:
+                message = f"Target table {target_table_guid}: {table_errors[target_table_guid]}"
+            else:
+                source_column = columns[source_table_guid].get(source_column_name.lower())
+                target_column = columns[target_table_guid].get(target_column_name.lower())
+                if not source_column:
+                    message = f"Source column '{source_column_name}' not found in {source_table_guid}"
+                elif not target_column:
+                    message = f"Target column '{target_column_name}' not found in {target_table_guid}"
+                elif validate_types:
+                    source_type = source_column.get("attributes", {}).get("dataType", "unknown")
+                    target_type = target_column.get("attributes", {}).get("dataType", "unknown")
+                    if not self._are_types_compatible(source_type, target_type):
+                        message = f"Type mismatch: source '{source_type}' not compatible with target '{target_type}'"
+            if message:
+                results[idx] = {"index": idx, "status": "error", "message": message}
+                continue
+            prepared.append((idx, mapping, source_column["guid"], target_column["guid"]))
+
+        # Step 3: one /entity/bulk request per row range
+        by_range = {key: [] for key, _, _ in ranges}
+        range_of = {idx: key for key, start, stop in ranges for idx in range(start, stop)}
+        for item in prepared:
+            by_range[range_of[item[0]]].append(item)
+
+        def _chunks():
+            for key, start, stop in ranges:
+                chunk = by_range[key]
+                row_failures = (stop - start) - len(chunk)
+                if not chunk:
+                    # Every row failed validation; replaying the range cannot help
+                    if journal is not None:
+                        journal.complete(key, [], row_failures=row_failures)
+                    continue
+                entities = []
+                relationships = []
+                for offset, (idx, mapping, source_column_guid, target_column_guid) in enumerate(chunk):
+                    process_guid = f"-{offset + 1}"
+                    entities.append(self._column_process_entity(
+                        process_guid,
+                        _field(mapping, "source_table_guid"), _field(mapping, "source_column"), source_column_guid,
+                        _field(mapping, "target_table_guid"), _field(mapping, "target_column"), target_column_guid,
+                        _field(mapping, "process_name"), _field(mapping, "description"),
+                        _field(mapping, "owner", "data-engineering"),
+                    ))
+                    relationships.extend(self._column_process_relationships(
+                        process_guid, source_column_guid, target_column_guid, -(len(chunk) + 1 + 2 * offset)
+                    ))
+                yield (
+                    key,
+                    row_failures,
+                    [idx for idx, _, _, _ in chunk],
+                    {"entities": entities, "relationships": relationships},
+                )
+
+        def _write(chunk):
+            if journal is not None:
+                journal.start(chunk[0])
+            response = get_data({
+                "app": "catalog",
+                "method": "POST",
+                "endpoint": ENDPOINTS["entity"]["bulk_create_or_update"],
+                "params": get_api_version_params("datamap"),
+                "payload": chunk[3],
+            })
+            if isinstance(response, dict) and response.get("status") == "error":
+                raise RuntimeError(response.get("message") or "Bulk create failed")
+            return response
+
+        done = 0
+        for (key, row_failures, indexes, _), response, error in run_batches(_write, _chunks(), max_parallel):
+            for idx in indexes:
+                if error is None:
+                    results[idx] = {"index": idx, "status": "success"}
+                else:
+                    results[idx] = {"index": idx, "status": "error", "message": str(error)}
+            if journal is not None:
+                if error is None:
+                    journal.complete(key, extract_guids(response), row_failures=row_failures)
+                else:
+                    journal.fail(key, error)
+            done += len(indexes)
+            if progress:
+                progress(done, len(prepared))
+
+        created = sum(1 for r in results if r["status"] == "success")
+        skipped = sum(1 for r in results if r["status"] == "skipped")
+        failed = len(results) - created - skipped
+        return {
+            "status": "success" if not failed else ("partial" if created else "error"),
+            "message": f"Created {created} column lineage(s), {failed} failed",
+            "created_count": created,
+            "failed_count": failed,
+            "skipped_count": skipped,
+            "tables_read": len(columns),
+            "results": results,
+        }
+
     def _are_types_compatible(self, source_type, target_type):
         """
         Check if source and target column types are compatible for lineage.
@@ -1175,6 +1175,53 @@ Use Cases:
         }
         self.payload = get_json(args, "--payloadFile")
 
+    # === STREAMING SEARCH ===
+
+    def iter_search(self, filter=None, page_size=1000, keywords="*", orderby=None):
+        """
+        Lazily iterate over every search result matching a filter.
+
+        Pages are fetched with the Data Map query ``continuationToken`` rather than
+        limit/offset, so enumeration is not capped by the offset window and only
+        one page is held in memory at a time.
+
+        Args:
+            filter: Search filter object (e.g. {"collectionId": "finance"}), or None
+            page_size: Results requested per page (the service caps this at 1000)
+            keywords: Keywords applied to all searchable fields
+            orderby: Optional sort specification
+
+        Yields:
+            Individual search result dictionaries
+
+        Raises:
+            RuntimeError: When a page request fails
+        """
+        request = {"keywords": keywords, "limit": max(1, min(int(page_size), 1000))}
+        if filter:
+            request["filter"] = filter
+        if orderby:
+            request["orderby"] = orderby
+
+        continuation_token = None
+        while True:
+            page_request = dict(request)
+            if continuation_token:
+                page_request["continuationToken"] = continuation_token
+            page = self.searchQuery({"--payloadFile": page_request})
+
+            if not isinstance(page, dict) or page.get("status") == "error":
+                message = page.get("message") if isinstance(page, dict) else page
+                raise RuntimeError(f"Search query failed: {message}")
+
+            results = page.get("value") or []
+            for result in results:
+                yield result
+
+            continuation_token = page.get("continuationToken")
+            if not continuation_token or not results:
+                return
+
     # === UTILITY METHODS ===
 
     def _parse_filter(self, filter_string):
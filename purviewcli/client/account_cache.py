@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Account Discovery Caching System
+Persists the Purview account ID and catalog endpoint resolved through ARM
+(`az purview account show/list`, `az resource show`) per account name and
+resource group, so cold CLI commands skip the az subprocess round trips.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from .config import get_config_dir
+
+logger = logging.getLogger(__name__)
+
+ACCOUNT_CACHE_FILE = "account_cache.json"
+
+# Account IDs practically never change; re-discover weekly by default
+DEFAULT_ACCOUNT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+_file_lock = Lock()
+
+
+def _cache_file(cache_dir: Optional[Path] = None) -> Path:
+    return Path(cache_dir or get_config_dir()) / ACCOUNT_CACHE_FILE
+
+
+def _ttl_seconds() -> int:
+    try:
+        return int(os.getenv("PURVIEW_ACCOUNT_CACHE_TTL", str(DEFAULT_ACCOUNT_CACHE_TTL_SECONDS)))
+    except ValueError:
+        return DEFAULT_ACCOUNT_CACHE_TTL_SECONDS
+
+
+def _entry_key(account_name: str, resource_group: Optional[str]) -> str:
+    return f"{account_name.lower()}|{(resource_group or '').lower()}"
+
+
+def _read_entries(cache_file: Path) -> Dict[str, Dict[str, Any]]:
+    if not cache_file.exists():
+        return {}
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable account cache: {e}")
+        return {}
+
+
+def get_cached_account(
+    account_name: str, resource_group: Optional[str] = None, cache_dir: Optional[Path] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Return the cached discovery result for an account, if present and not expired.
+
+    Args:
+        account_name: Purview account name
+        resource_group: Resource group used for discovery (None = discovered by name)
+        cache_dir: Directory holding the cache file (None = CLI config dir)
+
+    Returns:
+        Dict with 'account_id', 'catalog_endpoint' and 'resolved_at', or None
+    """
+    ttl = _ttl_seconds()
+    if ttl <= 0:
+        return None
+    entry = _read_entries(_cache_file(cache_dir)).get(_entry_key(account_name, resource_group))
+    if not entry or not entry.get("account_id"):
+        return None
+    if time.time() - float(entry.get("resolved_at", 0)) > ttl:
+        return None
+    return entry
+
+
+def store_account(
+    account_name: str,
+    account_id: str,
+    catalog_endpoint: Optional[str] = None,
+    resource_group: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
+) -> None:
+    """Persist a discovered account ID and catalog endpoint"""
+    cache_file = _cache_file(cache_dir)
+    with _file_lock:
+        entries = _read_entries(cache_file)
+        entries[_entry_key(account_name, resource_group)] = {
+            "account_id": account_id,
+            "catalog_endpoint": catalog_endpoint,
+            "resolved_at": time.time(),
+        }
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not persist account cache: {e}")
+
+
+def clear_account_cache(cache_dir: Optional[Path] = None) -> None:
+    """Remove all cached account discovery results"""
+    with _file_lock:
+        try:
+            _cache_file(cache_dir).unlink()
+        except FileNotFoundError:
+            pass
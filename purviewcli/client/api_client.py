@@ -7,20 +7,34 @@ Supports the latest Microsoft Purview REST API specifications with comprehensive
 
 import json
 import asyncio
+import random
+import time
 try:
     import aiohttp
 except Exception:
     aiohttp = None
 import pandas as pd
-from typing import Dict, List, Optional, Union, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from azure.identity.aio import DefaultAzureCredential
+from azure.core.credentials import AccessToken
 from azure.core.exceptions import ClientAuthenticationError
 import logging
 from datetime import datetime
 import os
 import sys
-from .endpoints import ENDPOINTS, DATAMAP_API_VERSION, format_endpoint, get_api_version_params
+from .endpoints import (
+    ENDPOINTS,
+    CATALOG_LIST_DEFAULT_API_VERSION,
+    DATAMAP_API_VERSION,
+    format_endpoint,
+    get_api_version_params,
+)
+from .account_cache import get_cached_account
+from .rate_limiter import parse_retry_after
+from .singleflight import AsyncSingleFlight, coalescing_enabled, request_key
+from .sync_client import IDEMPOTENT_METHODS
+from .token_cache import get_token_cache, identity_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +48,24 @@ class PurviewConfig:
     client_id: Optional[str] = None
     client_secret: Optional[str] = None
     azure_region: Optional[str] = None
+    account_id: Optional[str] = None  # Purview account ID for Unified Catalog endpoints
     max_retries: int = 3
     timeout: int = 30
     batch_size: int = 100
+    max_concurrency: int = 8
+    retry_backoff_seconds: float = 1.0
+    max_backoff_seconds: float = 60.0
+
+
+# Unified Catalog is served from a separate host with its own token audience
+UC_AUTH_SCOPE = "73c2949e-da2d-457a-9607-fcc665198967/.default"
+
+# Status codes retried with backoff; 429/503 honour Retry-After. Methods not in
+# IDEMPOTENT_METHODS (POST, PATCH) may already have been applied when a 5xx or
+# a transport error comes back, so they are only retried on 429.
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+THROTTLE_STATUS_CODES = {429, 503}
+NON_IDEMPOTENT_RETRYABLE_STATUS_CODES = {429}
 
 
 class PurviewClient:
@@ -47,6 +76,13 @@ class PurviewClient:
         self._token = None
         self._credential = None
         self._session = None
+        self._token_cache = get_token_cache()
+        self._token_lock = None
+        # Monotonic deadline shared by all in-flight requests after a 429/503
+        self._paused_until = 0.0
+        self._uc_endpoint = None
+        # Identical concurrent GETs share one in-flight request
+        self._inflight = AsyncSingleFlight()
         self._setup_endpoints()
 
     def _setup_endpoints(self):
@@ -63,6 +99,26 @@ class PurviewClient:
             self.purview_endpoint = f"https://{self.config.account_name}.purview.azure.com"
             self.management_endpoint = "https://management.azure.com"
             self.auth_scope = "https://purview.azure.net/.default"
+        self.uc_auth_scope = UC_AUTH_SCOPE
+
+    @property
+    def uc_endpoint(self) -> str:
+        """
+        Unified Catalog base URL, resolved from config.account_id,
+        PURVIEW_ACCOUNT_ID or the cached account discovery of the CLI.
+        """
+        if self._uc_endpoint is None:
+            account_id = self.config.account_id or os.getenv("PURVIEW_ACCOUNT_ID")
+            if not account_id:
+                cached = get_cached_account(self.config.account_name, os.getenv("PURVIEW_RESOURCE_GROUP") or None)
+                account_id = cached["account_id"] if cached else None
+            if not account_id:
+                raise ValueError(
+                    "Unified Catalog requests need the Purview account ID; "
+                    "set PurviewConfig.account_id or PURVIEW_ACCOUNT_ID"
+                )
+            self._uc_endpoint = f"https://{account_id}-api.purview-service.microsoft.com"
+        return self._uc_endpoint
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -84,10 +140,10 @@ class PurviewClient:
                 "Install it in your environment (e.g. '.venv\\Scripts\\pip.exe install aiohttp' or 'pip install aiohttp')."
             )
         self._credential = DefaultAzureCredential()
+        self._token_lock = asyncio.Lock()
 
         try:
-            token = await self._credential.get_token(self.auth_scope)
-            self._token = token.token
+            await self._get_token()
         except ClientAuthenticationError as e:
             logger.error(f"Authentication failed: {e}")
             raise
@@ -95,39 +151,175 @@ class PurviewClient:
         connector = aiohttp.TCPConnector(limit=100, limit_per_host=30)
         timeout = aiohttp.ClientTimeout(total=self.config.timeout)
 
+        # The Authorization header is set per request so refreshed tokens are picked up
         self._session = aiohttp.ClientSession(
             connector=connector,
             timeout=timeout,
             headers={
-                "Authorization": f"Bearer {self._token}",
                 "Content-Type": "application/json",
                 "User-Agent": f"pvw-cli/2.0",
             },
         )
 
+    def _token_key(self, scope: Optional[str] = None) -> Tuple[str, Callable[[AccessToken], bool]]:
+        # DefaultAzureCredential resolves the same ambient identity as the sync client
+        return identity_cache_key(scope or self.auth_scope)
+
+    async def _get_token(self, scope: Optional[str] = None, force_refresh: bool = False) -> str:
+        """
+        Return a bearer token for scope, refreshing it shortly before expiry.
+
+        Tokens come from the shared token cache (also used by the synchronous
+        client); concurrent callers wait for a single credential round trip.
+        """
+        scope = scope or self.auth_scope
+        key, persist_if = self._token_key(scope)
+        if force_refresh:
+            self._token_cache.invalidate(key)
+        else:
+            cached = self._token_cache.get(key)
+            if cached is not None:
+                return cached.token
+
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        async with self._token_lock:
+            cached = self._token_cache.get(key)
+            if cached is None:
+                cached = await self._credential.get_token(scope)
+                self._token_cache.put(key, cached, persist=persist_if(cached))
+            if scope == self.auth_scope:
+                self._token = cached.token
+            return cached.token
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.config.max_backoff_seconds)
+        delay = min(self.config.max_backoff_seconds, self.config.retry_backoff_seconds * (2 ** attempt))
+        return delay + random.uniform(0, 0.1) * delay
+
+    async def _wait_for_pause(self):
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
     async def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict:
-        """Make HTTP request with retry logic"""
-        url = f"{self.purview_endpoint}{endpoint}"
+        """
+        Make HTTP request with retry logic.
+
+        Retries 429/5xx responses and connection errors up to config.max_retries
+        times with exponential backoff. 429/503 honour Retry-After and pause every
+        request on this client until it has elapsed. A 401 triggers one token
+        refresh before the request is retried. Non-idempotent methods (POST,
+        PATCH) are only retried on 429, so creates are never sent twice.
+        """
         params = kwargs.get("params", {})
-        if "api-version" not in params:
+        if isinstance(params, list):
+            # Repeated query keys (guid=...&guid=...) are passed as (key, value) pairs
+            if not any(key == "api-version" for key, _ in params):
+                params = params + [("api-version", DATAMAP_API_VERSION)]
+        elif "api-version" not in params:
             params["api-version"] = DATAMAP_API_VERSION
         kwargs["params"] = params
+        return await self._send(method, f"{self.purview_endpoint}{endpoint}", self.auth_scope, **kwargs)
+
+    async def _make_uc_request(self, method: str, endpoint: str, **kwargs) -> Dict:
+        """
+        Make a Unified Catalog request.
 
-        for attempt in range(self.config.max_retries):
+        Same retry, throttling and token refresh behaviour as _make_request, but
+        against the Unified Catalog host with its own token scope. The session,
+        connection pool and token cache are shared with Data Map requests.
+        """
+        return await self._send(method, f"{self.uc_endpoint}{endpoint}", self.uc_auth_scope, **kwargs)
+
+    async def _send(self, method: str, url: str, scope: str, **kwargs) -> Dict:
+        key = None
+        if coalescing_enabled() and kwargs.get("json") is None and kwargs.get("data") is None:
+            key = request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+        return await self._inflight.do(key, lambda: self._send_with_retry(method, url, scope, **kwargs))
+
+    async def _send_with_retry(self, method: str, url: str, scope: str, **kwargs) -> Dict:
+        headers = dict(kwargs.pop("headers", None) or {})
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        retryable = RETRYABLE_STATUS_CODES if idempotent else NON_IDEMPOTENT_RETRYABLE_STATUS_CODES
+
+        refreshed = False
+        attempt = 0
+        while True:
+            await self._wait_for_pause()
+            request_headers = {**headers, "Authorization": f"Bearer {await self._get_token(scope)}"}
             try:
-                async with self._session.request(method, url, **kwargs) as response:
+                async with self._session.request(method, url, headers=request_headers, **kwargs) as response:
+                    if response.status == 401 and not refreshed:
+                        refreshed = True
+                        await self._get_token(scope, force_refresh=True)
+                        continue
+                    if response.status in retryable and attempt < self.config.max_retries:
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        delay = self._backoff_delay(attempt, retry_after)
+                        if response.status in THROTTLE_STATUS_CODES:
+                            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                        logger.warning(
+                            f"{method} {url} returned HTTP {response.status}; "
+                            f"retry {attempt + 1}/{self.config.max_retries} in {delay:.1f}s"
+                        )
+                        attempt += 1
+                        await asyncio.sleep(delay)
+                        continue
                     response.raise_for_status()
-                    return await response.json()
-            except aiohttp.ClientError as e:
+                    if response.status == 204:
+                        return {}
+                    return await response.json(content_type=None) or {}
+            except aiohttp.ClientResponseError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logger.error(f"Request failed on attempt {attempt + 1}: {e}")
-                if attempt == self.config.max_retries - 1:
+                if attempt >= self.config.max_retries or not idempotent:
                     raise
+                await asyncio.sleep(self._backoff_delay(attempt))
+                attempt += 1
 
     async def _refresh_token(self):
         """Refresh authentication token"""
-        token = await self._credential.get_token(self.auth_scope)
-        self._token = token.token
-        self._session.headers.update({"Authorization": f"Bearer {self._token}"})
+        await self._get_token(force_refresh=True)
+
+    async def _submit_entity_batches(
+        self, method: str, entities: List[Dict], mutation: str, progress_callback=None
+    ) -> List[Dict]:
+        """
+        Send entities to the bulk endpoint in batches, at most
+        config.max_concurrency requests at a time.
+
+        Failed batches are logged and skipped; results keep batch order.
+        """
+        batch_size = self.config.batch_size
+        total = len(entities)
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrency))
+        processed = 0
+
+        async def _submit(batch_no: int, batch: List[Dict]) -> List[Dict]:
+            nonlocal processed
+            async with semaphore:
+                try:
+                    result = await self._make_request(
+                        method, ENDPOINTS["entity"]["bulk_create_or_update"], json={"entities": batch}
+                    )
+                except Exception as e:
+                    logger.error(f"Batch {batch_no} failed: {e}")
+                    return []
+            processed += len(batch)
+            if progress_callback:
+                progress_callback(processed, total)
+            return result.get("mutatedEntities", {}).get(mutation, [])
+
+        batch_results = await asyncio.gather(
+            *(
+                _submit(i // batch_size + 1, entities[i : i + batch_size])
+                for i in range(0, total, batch_size)
+            )
+        )
+        return [entity for batch in batch_results for entity in batch]
 
     # Data Map API Methods
     async def get_entity(self, guid: str, **kwargs) -> Dict:
@@ -157,6 +349,41 @@ class PurviewClient:
         endpoint = format_endpoint(ENDPOINTS["entity"]["get"], guid=guid)
         return await self._make_request("GET", endpoint, params=kwargs)
 
+    async def get_entities_by_guids(
+        self, guids: List[str], chunk_size: int = 100, **kwargs
+    ) -> List[Dict]:
+        """
+        Get many entities through the bulk read endpoint.
+
+        GUIDs are read in chunks of chunk_size, with the chunks sent concurrently
+        (at most config.max_concurrency at a time). Entities that do not exist
+        are simply missing from the result.
+
+        Args:
+            guids: Entity GUIDs to read
+            chunk_size: GUIDs per bulk request
+            **kwargs: Additional query parameters (e.g., minExtInfo, ignoreRelationships)
+
+        Returns:
+            List of entity dicts, in the order the service returned them
+
+        Example:
+            entities = await client.get_entities_by_guids(guids, ignoreRelationships="true")
+        """
+        chunk_size = max(1, chunk_size)
+        extra = list(kwargs.items())
+
+        async def _read(chunk: List[str]) -> List[Dict]:
+            params = [("guid", guid) for guid in chunk] + extra
+            result = await self._make_request("GET", ENDPOINTS["entity"]["list_by_guids"], params=params)
+            return result.get("entities", []) if isinstance(result, dict) else []
+
+        chunks = await self.gather_bounded(
+            (_read(guids[i : i + chunk_size]) for i in range(0, len(guids), chunk_size)),
+            return_exceptions=False,
+        )
+        return [entity for chunk in chunks for entity in chunk]
+
     async def create_entity(self, entity_data: Dict) -> Dict:
         """
         Create a new entity in the Purview catalog.
@@ -317,27 +544,7 @@ class PurviewClient:
             - Automated asset registration from data discovery tools
             - Periodic synchronization of assets from source systems
         """
-        results = []
-        total = len(entities)
-
-        for i in range(0, total, self.config.batch_size):
-            batch = entities[i : i + self.config.batch_size]
-            batch_data = {"entities": batch}
-
-            try:
-                result = await self._make_request(
-                    "POST", ENDPOINTS["entity"]["bulk_create_or_update"], json=batch_data
-                )
-                results.extend(result.get("mutatedEntities", {}).get("CREATE", []))
-
-                if progress_callback:
-                    progress_callback(min(i + self.config.batch_size, total), total)
-
-            except Exception as e:
-                logger.error(f"Batch {i//self.config.batch_size + 1} failed: {e}")
-                continue
-
-        return results
+        return await self._submit_entity_batches("POST", entities, "CREATE", progress_callback)
 
     async def batch_update_entities(
         self, entities: List[Dict], progress_callback=None
@@ -375,27 +582,7 @@ class PurviewClient:
             - Synchronize ownership or stewardship information
             - Update descriptions and documentation across many entities
         """
-        results = []
-        total = len(entities)
-
-        for i in range(0, total, self.config.batch_size):
-            batch = entities[i : i + self.config.batch_size]
-            batch_data = {"entities": batch}
-
-            try:
-                result = await self._make_request(
-                    "PUT", ENDPOINTS["entity"]["bulk_create_or_update"], json=batch_data
-                )
-                results.extend(result.get("mutatedEntities", {}).get("UPDATE", []))
-
-                if progress_callback:
-                    progress_callback(min(i + self.config.batch_size, total), total)
-
-            except Exception as e:
-                logger.error(f"Batch {i//self.config.batch_size + 1} failed: {e}")
-                continue
-
-        return results
+        return await self._submit_entity_batches("PUT", entities, "UPDATE", progress_callback)
 
     # CSV Import/Export Methods
     async def import_entities_from_csv(self, csv_file_path: str, mapping_config: Dict) -> Dict:
@@ -436,12 +623,7 @@ class PurviewClient:
             - Automate asset registration from data discovery tools
         """
         df = pd.read_csv(csv_file_path)
-        entities = []
-
-        for _, row in df.iterrows():
-            entity = self._map_csv_row_to_entity(row, mapping_config)
-            if entity:
-                entities.append(entity)
+        entities = self._map_csv_frame_to_entities(df, mapping_config)
 
         return await self.batch_create_entities(entities)
 
@@ -500,29 +682,39 @@ class PurviewClient:
         df.to_csv(csv_file_path, index=False)
         return f"Exported {len(entities)} entities to {csv_file_path}"
 
-    def _map_csv_row_to_entity(self, row: pd.Series, mapping_config: Dict) -> Dict:
-        """Map CSV row to Purview entity format"""
-        try:
-            entity = {"typeName": mapping_config.get("typeName", "DataSet"), "attributes": {}}
+    def _map_csv_frame_to_entities(self, df: pd.DataFrame, mapping_config: Dict) -> List[Dict]:
+        """Map CSV rows to Purview entity format, resolving the column mapping once per file"""
+        type_name = mapping_config.get("typeName", "DataSet")
+        mapped = [
+            (df.columns.get_loc(csv_col), attr_name)
+            for csv_col, attr_name in mapping_config.get("attributes", {}).items()
+            if csv_col in df.columns
+        ]
+        name_index = df.columns.get_loc("name") if "name" in df.columns else None
 
-            # Map CSV columns to entity attributes
-            for csv_col, attr_name in mapping_config.get("attributes", {}).items():
-                if csv_col in row and pd.notna(row[csv_col]):
-                    entity["attributes"][attr_name] = row[csv_col]
+        # Column-wise values and a frame-wide null mask instead of per-row Series boxing
+        column_values = [df.iloc[:, i].tolist() for i in range(len(df.columns))]
+        missing_mask = df.isna().to_numpy()
 
-            # Add required attributes if not present
-            if "name" not in entity["attributes"] and "name" in row:
-                entity["attributes"]["name"] = row["name"]
+        entities = []
+        for r in range(len(df)):
+            attributes = {
+                attr_name: column_values[index][r]
+                for index, attr_name in mapped
+                if not missing_mask[r, index]
+            }
+            name = None
+            if name_index is not None and not missing_mask[r, name_index]:
+                name = column_values[name_index][r]
 
-            if "qualifiedName" not in entity["attributes"]:
-                entity["attributes"][
-                    "qualifiedName"
-                ] = f"{row.get('name', 'unnamed')}@{self.config.account_name}"
+            # Add required attributes if not present
+            if "name" not in attributes and name is not None:
+                attributes["name"] = name
+            if "qualifiedName" not in attributes:
+                attributes["qualifiedName"] = f"{name if name is not None else 'unnamed'}@{self.config.account_name}"
 
-            return entity
-        except Exception as e:
-            logger.error(f"Failed to map row to entity: {e}")
-            return None
+            entities.append({"typeName": type_name, "attributes": attributes})
+        return entities
 
     def _flatten_entity(self, entity: Dict) -> Dict:
         """Flatten entity structure for CSV export"""
@@ -1107,7 +1299,7 @@ class PurviewClient:
                     print(f"Source: {source['displayName']}")
         """
         params = {"direction": direction, "depth": depth}
-        endpoint = f"{ENDPOINTS['lineage']['lineage']}/{guid}"
+        endpoint = format_endpoint(ENDPOINTS["lineage"]["get"], guid=guid)
         return await self._make_request("GET", endpoint, params=params)
 
     async def create_lineage(self, lineage_data: Dict) -> Dict:
@@ -1271,6 +1463,249 @@ class PurviewClient:
         except Exception as e:
             raise Exception(f"Failed to export collections to CSV: {str(e)}")
 
+    # === UNIFIED CATALOG ===
+
+    async def _uc_list(self, endpoint: str, domain_id: Optional[str] = None, **params) -> List[Dict]:
+        if domain_id:
+            params["domainId"] = domain_id
+        result = await self._make_uc_request("GET", endpoint, params=params)
+        return result.get("value", []) if isinstance(result, dict) else result
+
+    async def gather_bounded(self, awaitables, return_exceptions: bool = True) -> List[Any]:
+        """
+        Await many requests concurrently, at most config.max_concurrency at a time.
+
+        Example:
+            products = await client.gather_bounded(
+                client.get_data_product(pid) for pid in product_ids
+            )
+        """
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrency))
+
+        async def _bounded(awaitable):
+            async with semaphore:
+                return await awaitable
+
+        return await asyncio.gather(
+            *(_bounded(a) for a in awaitables), return_exceptions=return_exceptions
+        )
+
+    # Governance domains
+    async def list_domains(self) -> List[Dict]:
+        """List Unified Catalog governance domains."""
+        return await self._uc_list(ENDPOINTS["unified_catalog"]["list_domains"])
+
+    async def get_domain(self, domain_id: str) -> Dict:
+        """Get a governance domain by ID."""
+        return await self._make_uc_request(
+            "GET", ENDPOINTS["unified_catalog"]["get_domain"].format(domainId=domain_id)
+        )
+
+    async def create_domain(self, domain_data: Dict) -> Dict:
+        """Create a governance domain."""
+        return await self._make_uc_request(
+            "POST", ENDPOINTS["unified_catalog"]["create_domain"], json=domain_data
+        )
+
+    async def update_domain(self, domain_id: str, domain_data: Dict) -> Dict:
+        """Replace a governance domain."""
+        return await self._make_uc_request(
+            "PUT", ENDPOINTS["unified_catalog"]["update_domain"].format(domainId=domain_id), json=domain_data
+        )
+
+    async def delete_domain(self, domain_id: str) -> Dict:
+        """Delete a governance domain."""
+        return await self._make_uc_request(
+            "DELETE", ENDPOINTS["unified_catalog"]["delete_domain"].format(domainId=domain_id)
+        )
+
+    # Data products
+    async def list_data_products(self, domain_id: Optional[str] = None) -> List[Dict]:
+        """List data products, optionally limited to one governance domain."""
+        return await self._uc_list(ENDPOINTS["unified_catalog"]["list_data_products"], domain_id)
+
+    async def get_data_product(self, product_id: str) -> Dict:
+        """Get a data product by ID."""
+        return await self._make_uc_request(
+            "GET", ENDPOINTS["unified_catalog"]["get_data_product"].format(productId=product_id)
+        )
+
+    async def create_data_product(self, product_data: Dict) -> Dict:
+        """Create a data product."""
+        return await self._make_uc_request(
+            "POST", ENDPOINTS["unified_catalog"]["create_data_product"], json=product_data
+        )
+
+    async def update_data_product(self, product_id: str, product_data: Dict) -> Dict:
+        """Replace a data product."""
+        return await self._make_uc_request(
+            "PUT",
+            ENDPOINTS["unified_catalog"]["update_data_product"].format(productId=product_id),
+            json=product_data,
+        )
+
+    async def delete_data_product(self, product_id: str) -> Dict:
+        """Delete a data product."""
+        return await self._make_uc_request(
+            "DELETE", ENDPOINTS["unified_catalog"]["delete_data_product"].format(productId=product_id)
+        )
+
+    async def list_data_product_relationships(
+        self, product_id: str, entity_type: Optional[str] = None
+    ) -> List[Dict]:
+        """List the relationships of a data product, optionally of one entity type."""
+        params = {"entityType": entity_type.upper()} if entity_type else {}
+        return await self._uc_list(
+            ENDPOINTS["unified_catalog"]["list_data_product_relationships"].format(productId=product_id),
+            **params,
+        )
+
+    async def create_data_product_relationship(
+        self, product_id: str, entity_type: str, relationship_data: Dict
+    ) -> Dict:
+        """Link an entity (e.g. a DATAASSET or CRITICALDATACOLUMN) to a data product."""
+        return await self._make_uc_request(
+            "POST",
+            ENDPOINTS["unified_catalog"]["create_data_product_relationship"].format(productId=product_id),
+            params={"entityType": entity_type.upper()},
+            json=relationship_data,
+        )
+
+    # Terms
+    async def list_terms(self, domain_id: Optional[str] = None) -> List[Dict]:
+        """List Unified Catalog terms, optionally limited to one governance domain."""
+        return await self._uc_list(ENDPOINTS["unified_catalog"]["list_terms"], domain_id)
+
+    async def get_term(self, term_id: str) -> Dict:
+        """Get a term by ID."""
+        return await self._make_uc_request(
+            "GET", ENDPOINTS["unified_catalog"]["get_term"].format(termId=term_id)
+        )
+
+    async def create_term(self, term_data: Dict) -> Dict:
+        """Create a term."""
+        return await self._make_uc_request("POST", ENDPOINTS["unified_catalog"]["create_term"], json=term_data)
+
+    async def update_term(self, term_id: str, term_data: Dict) -> Dict:
+        """Replace a term."""
+        return await self._make_uc_request(
+            "PUT", ENDPOINTS["unified_catalog"]["update_term"].format(termId=term_id), json=term_data
+        )
+
+    async def delete_term(self, term_id: str) -> Dict:
+        """Delete a term."""
+        return await self._make_uc_request(
+            "DELETE", ENDPOINTS["unified_catalog"]["delete_term"].format(termId=term_id)
+        )
+
+    # Critical data elements
+    async def list_cdes(self, domain_id: Optional[str] = None) -> List[Dict]:
+        """List critical data elements, optionally limited to one governance domain."""
+        return await self._uc_list(ENDPOINTS["unified_catalog"]["list_critical_data_elements"], domain_id)
+
+    async def get_cde(self, cde_id: str) -> Dict:
+        """Get a critical data element by ID."""
+        return await self._make_uc_request(
+            "GET", ENDPOINTS["unified_catalog"]["get_critical_data_element"].format(cdeId=cde_id)
+        )
+
+    async def create_cde(self, cde_data: Dict) -> Dict:
+        """Create a critical data element."""
+        return await self._make_uc_request(
+            "POST", ENDPOINTS["unified_catalog"]["create_critical_data_element"], json=cde_data
+        )
+
+    async def update_cde(self, cde_id: str, cde_data: Dict) -> Dict:
+        """Replace a critical data element."""
+        return await self._make_uc_request(
+            "PUT", ENDPOINTS["unified_catalog"]["update_critical_data_element"].format(cdeId=cde_id), json=cde_data
+        )
+
+    async def delete_cde(self, cde_id: str) -> Dict:
+        """Delete a critical data element."""
+        return await self._make_uc_request(
+            "DELETE", ENDPOINTS["unified_catalog"]["delete_critical_data_element"].format(cdeId=cde_id)
+        )
+
+    # Objectives (OKRs)
+    async def list_objectives(self, domain_id: Optional[str] = None) -> List[Dict]:
+        """List objectives, optionally limited to one governance domain."""
+        return await self._uc_list(ENDPOINTS["unified_catalog"]["list_objectives"], domain_id)
+
+    async def get_objective(self, objective_id: str) -> Dict:
+        """Get an objective by ID."""
+        return await self._make_uc_request(
+            "GET", ENDPOINTS["unified_catalog"]["get_objective"].format(objectiveId=objective_id)
+        )
+
+    async def create_objective(self, objective_data: Dict) -> Dict:
+        """Create an objective."""
+        return await self._make_uc_request(
+            "POST", ENDPOINTS["unified_catalog"]["create_objective"], json=objective_data
+        )
+
+    async def update_objective(self, objective_id: str, objective_data: Dict) -> Dict:
+        """Replace an objective."""
+        return await self._make_uc_request(
+            "PUT",
+            ENDPOINTS["unified_catalog"]["update_objective"].format(objectiveId=objective_id),
+            json=objective_data,
+        )
+
+    async def delete_objective(self, objective_id: str) -> Dict:
+        """Delete an objective."""
+        return await self._make_uc_request(
+            "DELETE", ENDPOINTS["unified_catalog"]["delete_objective"].format(objectiveId=objective_id)
+        )
+
+    # Data assets
+    async def list_data_assets(
+        self, domain_id: Optional[str] = None, keyword: Optional[str] = None
+    ) -> List[Dict]:
+        """List Unified Catalog data assets, optionally filtered by domain and keyword."""
+        params = {"api-version": CATALOG_LIST_DEFAULT_API_VERSION}
+        if keyword:
+            params["keyword"] = keyword
+        return await self._uc_list(ENDPOINTS["unified_catalog"]["list_data_assets"], domain_id, **params)
+
+    async def get_data_asset(self, asset_id: str, include_lineage: bool = False) -> Dict:
+        """Get a data asset by ID, with extended properties."""
+        return await self._make_uc_request(
+            "GET",
+            ENDPOINTS["unified_catalog"]["get_data_asset"].format(dataAssetId=asset_id),
+            params={
+                "api-version": CATALOG_LIST_DEFAULT_API_VERSION,
+                "includeExtendedProperties": "true",
+                "includeLineage": str(include_lineage).lower(),
+            },
+        )
+
+    async def create_data_asset(self, asset_data: Dict) -> Dict:
+        """Create a data asset."""
+        return await self._make_uc_request(
+            "POST",
+            ENDPOINTS["unified_catalog"]["create_data_asset"],
+            params={"api-version": CATALOG_LIST_DEFAULT_API_VERSION},
+            json=asset_data,
+        )
+
+    async def update_data_asset(self, asset_id: str, asset_data: Dict) -> Dict:
+        """Patch a data asset."""
+        return await self._make_uc_request(
+            "PATCH",
+            ENDPOINTS["unified_catalog"]["update_data_asset"].format(dataAssetId=asset_id),
+            params={"api-version": CATALOG_LIST_DEFAULT_API_VERSION},
+            json=asset_data,
+        )
+
+    async def delete_data_asset(self, asset_id: str) -> Dict:
+        """Delete a data asset."""
+        return await self._make_uc_request(
+            "DELETE",
+            ENDPOINTS["unified_catalog"]["delete_data_asset"].format(dataAssetId=asset_id),
+            params={"api-version": CATALOG_LIST_DEFAULT_API_VERSION},
+        )
+
 
 class BatchOperationProgress:
     """Progress tracker for batch operations"""
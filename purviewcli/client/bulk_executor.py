@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Bounded, order-preserving execution of bulk API batches.
+
+Batches are pulled lazily from a producer iterable (so row-to-entity mapping
+overlaps with in-flight requests), at most ``max_parallel`` requests are in
+flight at any time, and results are yielded in submission order so progress
+and failure reports read the same as a serial run.
+"""
+
+import concurrent.futures
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
+
+
+# Upper bound on submitted-but-unreported batches, as a multiple of max_parallel
+_MAX_BUFFERED_FACTOR = 4
+
+
+class BatchOutcome(NamedTuple):
+    """Result of running one batch through ``run_batches``"""
+
+    item: Any
+    result: Any
+    error: Optional[BaseException]
+
+
+def run_batches(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_parallel: int = 1,
+) -> Iterator[BatchOutcome]:
+    """
+    Apply fn to each item with bounded concurrency, yielding outcomes in order.
+
+    Args:
+        fn: Worker called once per item (e.g. a bulk API call with retry)
+        items: Iterable of prepared batches; consumed lazily
+        max_parallel: Maximum number of fn calls in flight (1 = run inline)
+
+    Yields:
+        BatchOutcome(item, result, error) in the same order as items. Exceptions
+        raised by fn are captured in ``error`` rather than propagated.
+    """
+    if max_parallel <= 1:
+        for item in items:
+            try:
+                yield BatchOutcome(item, fn(item), None)
+            except Exception as exc:
+                yield BatchOutcome(item, None, exc)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel) as pool:
+        inflight: deque = deque()
+
+        def _drain_head():
+            item, future = inflight.popleft()
+            try:
+                return BatchOutcome(item, future.result(), None)
+            except Exception as exc:
+                return BatchOutcome(item, None, exc)
+
+        for item in items:
+            inflight.append((item, pool.submit(fn, item)))
+            # Keep at most max_parallel requests running; finished batches behind a
+            # slow head are buffered (up to a small multiple) to preserve ordering.
+            while sum(1 for _, f in inflight if not f.done()) >= max_parallel:
+                concurrent.futures.wait(
+                    [f for _, f in inflight if not f.done()],
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+            while inflight and inflight[0][1].done():
+                yield _drain_head()
+            while len(inflight) >= max_parallel * _MAX_BUFFERED_FACTOR:
+                yield _drain_head()
+
+        while inflight:
+            yield _drain_head()
@@ -0,0 +1,267 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Bulk Job Journal
+Append-only JSONL write-ahead journal for long-running bulk commands. Each
+batch is recorded as 'started' before its request is sent and as 'done'
+(with the GUIDs the service returned) or 'failed' (with the error) once it
+finishes. An interrupted job can then be resumed from the journal: completed
+batches are skipped, and failed ones are replayed only when asked to. Batches
+of file-driven jobs also record the input rows they could not apply
+(error_rows), so a resumed job can rebuild its error file without the rows of
+batches it replays.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+JOURNAL_VERSION = 1
+
+BATCH_STARTED = "started"
+BATCH_DONE = "done"
+BATCH_FAILED = "failed"
+
+
+def row_range_key(start: int, stop: int) -> str:
+    """Journal key for the input rows [start, stop) of a file-driven job."""
+    return f"rows:{start}-{stop}"
+
+
+def row_ranges(rows: Iterable[int]) -> List[List[int]]:
+    """Collapse row indexes into sorted [start, stop) ranges for error_rows."""
+    ranges: List[List[int]] = []
+    for row in sorted(set(int(r) for r in rows)):
+        if ranges and ranges[-1][1] == row:
+            ranges[-1][1] = row + 1
+        else:
+            ranges.append([row, row + 1])
+    return ranges
+
+
+def csv_job_params(csv_file, batch_size: int, **extra) -> Dict[str, Any]:
+    """
+    Journal parameters for a CSV-driven job.
+
+    Row-range batch keys are only meaningful for the same file (path and size)
+    read with the same batch size.
+    """
+    return {
+        "csv_file": os.path.abspath(csv_file),
+        "csv_size": os.path.getsize(csv_file),
+        "batch_size": batch_size,
+        **extra,
+    }
+
+
+def extract_guids(result: Any) -> List[str]:
+    """
+    Collect entity GUIDs from a bulk API response.
+
+    Understands Atlas mutation responses (``guidAssignments`` and
+    ``mutatedEntities``) and single objects carrying ``guid`` or ``id``.
+    """
+    if not isinstance(result, dict):
+        return []
+    guids: List[str] = []
+    assignments = result.get("guidAssignments")
+    if isinstance(assignments, dict):
+        guids.extend(str(g) for g in assignments.values())
+    mutated = result.get("mutatedEntities")
+    if isinstance(mutated, dict):
+        for entities in mutated.values():
+            for entity in entities or []:
+                if isinstance(entity, dict) and entity.get("guid"):
+                    guids.append(str(entity["guid"]))
+    if not guids:
+        single = result.get("guid") or result.get("id")
+        if isinstance(single, str):
+            guids.append(single)
+    return list(dict.fromkeys(guids))
+
+
+class BulkJournal:
+    """
+    Write-ahead journal for one bulk job.
+
+    The first line records the command and the parameters that determine
+    batch boundaries (input file, batch size, ...); resuming with different
+    parameters is refused because batch keys would no longer line up. Every
+    following line is a batch event; the latest event per key wins. Appends
+    are flushed and fsynced so a killed process loses at most the line being
+    written, and a torn final line is ignored when the journal is reloaded.
+    """
+
+    def __init__(self, path, command: str, params: Optional[Dict[str, Any]] = None, resume: bool = False):
+        """
+        Create a new journal or reopen an existing one.
+
+        Args:
+            path: Journal file (JSONL)
+            command: Name of the bulk command writing the journal
+            params: JSON-serializable parameters that define the batches
+            resume: Reopen an existing journal instead of starting a new one
+
+        Raises:
+            ValueError: When resuming a journal that is missing, unreadable or
+                was written by a different command or with different parameters
+        """
+        self.path = Path(path)
+        self.command = command
+        self.params = json.loads(json.dumps(params or {}))
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if resume:
+            self._load()
+            self._file = open(self.path, "a", encoding="utf-8")
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")
+            self._append(
+                {
+                    "type": "job",
+                    "version": JOURNAL_VERSION,
+                    "command": command,
+                    "params": self.params,
+                    "created": time.time(),
+                }
+            )
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            raise ValueError(f"Journal {self.path} does not exist")
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        # Every event is written as one line ending in a newline, so anything
+        # after the last newline is a torn write from an interrupted run
+        *complete, torn = data.split(b"\n")
+        events = []
+        for number, line in enumerate(complete, 1):
+            if not line.strip():
+                continue
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                raise ValueError(f"Journal {self.path} is corrupt at line {number}")
+
+        header = events[0] if events else {}
+        if header.get("type") != "job" or header.get("version") != JOURNAL_VERSION:
+            raise ValueError(f"{self.path} is not a bulk job journal")
+        if header.get("command") != self.command or header.get("params") != self.params:
+            raise ValueError(
+                f"Journal {self.path} was written by '{header.get('command')}' with different "
+                "parameters; rerun with the original options or start a new journal"
+            )
+        for event in events[1:]:
+            if event.get("type") == "batch" and "key" in event:
+                self.batches[event["key"]] = event
+
+        if torn:
+            with open(self.path, "rb+") as f:
+                f.truncate(len(data) - len(torn))
+
+    def _append(self, event: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(event, default=str) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    # === BATCH EVENTS ===
+
+    def status(self, key: str) -> Optional[str]:
+        """Latest recorded status of a batch, or None if it never ran."""
+        event = self.batches.get(key)
+        return event.get("status") if event else None
+
+    def should_run(self, key: str, retry_failed: bool = False) -> bool:
+        """
+        Whether a batch still needs to run.
+
+        Batches that never ran or were interrupted after 'started' always run;
+        'done' batches never do; 'failed' batches only with retry_failed.
+        """
+        status = self.status(key)
+        if status == BATCH_DONE:
+            return False
+        if status == BATCH_FAILED:
+            return retry_failed
+        return True
+
+    def record(self, key: str, status: str, **fields) -> None:
+        """Append a batch event (thread-safe) and make it durable."""
+        event = {"type": "batch", "key": key, "status": status, "ts": time.time(), **fields}
+        with self._lock:
+            self._append(event)
+            self.batches[key] = event
+
+    def start(self, key: str, **fields) -> None:
+        """Record that a batch is about to be sent."""
+        self.record(key, BATCH_STARTED, **fields)
+
+    def complete(self, key: str, guids: Optional[Iterable[str]] = None, **fields) -> None:
+        """Record a successful batch and the GUIDs it produced."""
+        self.record(key, BATCH_DONE, guids=list(guids or []), **fields)
+
+    def fail(self, key: str, error: Any, **fields) -> None:
+        """Record a failed batch."""
+        self.record(key, BATCH_FAILED, error=str(error), **fields)
+
+    def error_row_ranges(self, retry_failed: bool = False) -> List[Tuple[int, int]]:
+        """
+        Input rows recorded as failed by batches a resumed run will not replay.
+
+        Rows of batches that run again are left out; the replay reports them
+        afresh if they still fail.
+        """
+        ranges = []
+        for key, event in self.batches.items():
+            if not self.should_run(key, retry_failed):
+                ranges.extend((int(start), int(stop)) for start, stop in event.get("error_rows") or [])
+        return sorted(ranges)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of batches per latest status."""
+        counts: Dict[str, int] = {}
+        for event in self.batches.values():
+            counts[event["status"]] = counts.get(event["status"], 0) + 1
+        return counts
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def open_journal(
+    journal_path: Optional[str],
+    resume_path: Optional[str],
+    command: str,
+    params: Optional[Dict[str, Any]] = None,
+) -> Optional[BulkJournal]:
+    """
+    Open the journal selected by a command's --journal/--resume options.
+
+    Returns:
+        A new journal for --journal, the reopened journal for --resume, or
+        None when neither option was given
+
+    Raises:
+        ValueError: When both options are given or the journal cannot be resumed
+    """
+    if journal_path and resume_path:
+        raise ValueError("Use either --journal (new job) or --resume (existing job), not both")
+    if resume_path:
+        return BulkJournal(resume_path, command, params, resume=True)
+    if journal_path:
+        return BulkJournal(journal_path, command, params)
+    return None
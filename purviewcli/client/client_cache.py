@@ -7,14 +7,20 @@ Reduces credential initialization overhead and connection overhead per CLI comma
 """
 
 import weakref
-from typing import Dict, Optional, Any, Type, Union
+from typing import Dict, Optional, Any, Type, Tuple, Union
 from threading import Lock
 
+from .sync_client import SyncPurviewClient, SyncPurviewConfig, resolve_auth_scope
+
 
 # Global client registry with profile scoping
 _client_cache: Dict[str, Dict[str, weakref.ref]] = {}
 _cache_lock = Lock()
 
+# Process-wide pool of HTTP clients keyed by (account name, region, account id, auth scope)
+_sync_client_pool: Dict[Tuple[str, str, Optional[str], str], SyncPurviewClient] = {}
+_sync_pool_lock = Lock()
+
 
 def get_cached_client(
     client_class: Type, profile: Optional[str] = "default"
@@ -60,13 +66,70 @@ def get_cached_client(
         return instance
 
 
+def get_sync_client(
+    account_name: str,
+    azure_region: Optional[str] = "public",
+    account_id: Optional[str] = None,
+) -> SyncPurviewClient:
+    """
+    Get the shared SyncPurviewClient for a Purview account.
+    
+    One client (and therefore one requests session, connection pool and
+    token set) is kept per (account name, region, account id, auth scope)
+    for the lifetime of the process, so every Endpoint subclass reuses the
+    same keep-alive connections and credentials instead of re-authenticating
+    on each request.
+    
+    Args:
+        account_name: Purview account name
+        azure_region: Azure cloud ("public", "china", "usgov")
+        account_id: Optional Purview account ID for Unified Catalog endpoints
+    
+    Returns:
+        Pooled SyncPurviewClient instance
+    """
+    azure_region = azure_region or "public"
+    pool_key = (account_name, azure_region.lower(), account_id, resolve_auth_scope(azure_region))
+
+    client = _sync_client_pool.get(pool_key)
+    if client is not None:
+        return client
+
+    with _sync_pool_lock:
+        # Re-check under the lock so concurrent callers build the client only once
+        client = _sync_client_pool.get(pool_key)
+        if client is None:
+            config = SyncPurviewConfig(
+                account_name=account_name,
+                azure_region=azure_region,
+                account_id=account_id,
+            )
+            client = SyncPurviewClient(config)
+            _sync_client_pool[pool_key] = client
+        return client
+
+
+def clear_sync_client_pool() -> None:
+    """Close and drop all pooled SyncPurviewClient instances"""
+    with _sync_pool_lock:
+        for client in _sync_client_pool.values():
+            try:
+                client._session.close()
+            except Exception:
+                pass
+        _sync_client_pool.clear()
+
+
 def clear_client_cache(profile: Optional[str] = None) -> None:
     """
     Clear cached client instances.
     
     Args:
-        profile: Profile to clear (None = all profiles)
+        profile: Profile to clear (None = all profiles, including pooled HTTP clients)
     """
+    if profile is None:
+        clear_sync_client_pool()
+
     with _cache_lock:
         if profile is None:
             _client_cache.clear()
@@ -89,5 +152,6 @@ def cache_stats() -> Dict[str, Any]:
                 for profile_cache in _client_cache.values()
                 if "instance" in profile_cache and profile_cache["instance"]() is not None
             ),
+            "pooled_http_clients": len(_sync_client_pool),
         }
         return stats
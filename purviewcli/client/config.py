@@ -15,6 +15,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+def get_config_dir() -> Path:
+    """Get the CLI configuration directory (override with PURVIEW_CONFIG_DIR)"""
+    override = os.environ.get('PURVIEW_CONFIG_DIR')
+    if override:
+        return Path(override)
+    if os.name == 'nt':  # Windows
+        return Path.home() / 'AppData' / 'Local' / 'purviewcli'
+    # Unix-like
+    return Path.home() / '.config' / 'purviewcli'
+
 @dataclass
 class PurviewProfile:
     """Purview connection profile"""
@@ -50,11 +60,7 @@ class ConfigManager:
     
     def _get_default_config_dir(self) -> Path:
         """Get default configuration directory"""
-        if os.name == 'nt':  # Windows
-            config_dir = Path.home() / 'AppData' / 'Local' / 'purviewcli'
-        else:  # Unix-like
-            config_dir = Path.home() / '.config' / 'purviewcli'
-        return config_dir
+        return get_config_dir()
     
     def _load_config(self) -> Dict[str, Any]:
         """Load main configuration"""
@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Streaming CSV Reader
+Reads bulk import CSV files in fixed-size chunks so memory use is bounded by
+the batch size instead of the file size, and appends failed rows to an error
+CSV as they occur instead of collecting them until the end of the run.
+"""
+
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+# Rows per chunk for readers that have no user-supplied batch size
+DEFAULT_CHUNK_ROWS = 10000
+
+
+def read_csv_preview(csv_file, rows: int = 1, **read_options) -> pd.DataFrame:
+    """
+    Read only the header and the first rows of a CSV file.
+
+    Used to validate columns and print debug previews before streaming.
+
+    Args:
+        csv_file: Path to the CSV file
+        rows: Number of data rows to read
+        **read_options: Extra keyword arguments for pandas.read_csv
+
+    Returns:
+        DataFrame with the file's columns and at most `rows` rows
+    """
+    return pd.read_csv(csv_file, nrows=rows, **read_options)
+
+
+def iter_csv_batches(
+    csv_file,
+    batch_size: int,
+    transform: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    **read_options,
+) -> Iterator[pd.DataFrame]:
+    """
+    Lazily yield a CSV file as DataFrames of at most batch_size rows.
+
+    Only one chunk is held in memory at a time. The row index keeps counting
+    across chunks, so index values match the row position in the whole file.
+
+    Args:
+        csv_file: Path to the CSV file
+        batch_size: Rows per chunk
+        transform: Optional callable applied to every chunk (e.g. header normalization)
+        **read_options: Extra keyword arguments for pandas.read_csv
+
+    Yields:
+        Non-empty DataFrame chunks in file order
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    with pd.read_csv(csv_file, chunksize=batch_size, **read_options) as reader:
+        for chunk in reader:
+            if chunk.empty:
+                continue
+            yield transform(chunk) if transform is not None else chunk
+
+
+class ErrorCsvWriter:
+    """
+    Append failed rows to an error CSV as soon as they are known.
+
+    The file is only created when the first failed row arrives; it is then
+    truncated and the header written once, matching the columns of that
+    first write. Later writes are aligned to those columns and appended.
+    Resumed jobs call restore() first to carry over the failures of batches
+    they do not replay.
+    """
+
+    def __init__(self, path: Optional[str]):
+        """
+        Initialize the writer.
+
+        Args:
+            path: Error CSV path, or None to discard failed rows
+        """
+        self.path = path
+        self.rows_written = 0
+        self._columns: Optional[List[str]] = None
+
+    def restore(
+        self,
+        csv_file,
+        row_ranges: Iterable[Tuple[int, int]],
+        transform: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    ) -> None:
+        """
+        Rewrite the error CSV with only the given [start, stop) input rows.
+
+        The rows are re-read from the source CSV, so a previous run's error
+        CSV is replaced rather than appended to; rows not listed (e.g. those
+        of batches being replayed) are dropped.
+
+        Args:
+            csv_file: Source CSV the job reads
+            row_ranges: Row index ranges to keep
+            transform: The chunk transform the job applies (e.g. header normalization)
+        """
+        if not self.path:
+            return
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        rows = set()
+        for start, stop in row_ranges:
+            rows.update(range(start, stop))
+        if not rows:
+            return
+        for chunk in iter_csv_batches(csv_file, DEFAULT_CHUNK_ROWS, transform=transform):
+            self.write(chunk[chunk.index.isin(rows)])
+
+    def write(self, rows: Union[pd.DataFrame, Iterable[Dict[str, Any]]]) -> None:
+        """
+        Append failed rows (a DataFrame or an iterable of row dicts).
+        """
+        if not self.path:
+            return
+        frame = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+        if frame.empty:
+            return
+        if self._columns is None:
+            self._columns = list(frame.columns)
+            frame.to_csv(self.path, mode="w", header=True, index=False)
+        else:
+            frame.reindex(columns=self._columns).to_csv(self.path, mode="a", header=False, index=False)
+        self.rows_written += len(frame)
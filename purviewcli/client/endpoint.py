@@ -1,14 +1,53 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import sys
+import copy
 import json
 import os
-from .sync_client import SyncPurviewClient, SyncPurviewConfig
+import functools
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from .client_cache import get_sync_client
+from .query_cache import (
+    cacheable_family,
+    family_ttl_seconds,
+    get_read_query_cache,
+    invalidate_for_write,
+    request_cache_method,
+)
 
 
-class Endpoint:
+@dataclass(frozen=True)
+class RequestSpec:
+    """Immutable description of a single HTTP request built by an Endpoint method"""
+
+    app: Optional[str]
+    method: Optional[str]
+    endpoint: Optional[str]
+    params: Optional[Dict[str, Any]] = None
+    payload: Any = None
+    files: Any = None
+    headers: Optional[Dict[str, str]] = None
+
+    def to_http_dict(self) -> Dict[str, Any]:
+        return {
+            "app": self.app,
+            "method": self.method,
+            "endpoint": self.endpoint,
+            "params": dict(self.params) if self.params else self.params,
+            "payload": self.payload,
+            "files": self.files,
+            "headers": dict(self.headers or {}),
+        }
+
+
+class _RequestState:
+    """Mutable scratch space an Endpoint method fills in while building one request"""
+
+    __slots__ = ("method", "endpoint", "params", "payload", "files", "headers")
+
     def __init__(self):
-        self.app = None
         self.method = None
         self.endpoint = None
         self.params = None
@@ -16,6 +55,75 @@ class Endpoint:
         self.files = None
         self.headers = {}
 
+    def freeze(self, app: Optional[str]) -> RequestSpec:
+        return RequestSpec(
+            app=app,
+            method=self.method,
+            endpoint=self.endpoint,
+            params=dict(self.params) if isinstance(self.params, dict) else self.params,
+            payload=self.payload,
+            files=self.files,
+            headers=dict(self.headers or {}),
+        )
+
+
+def _request_attribute(name):
+    """Expose a field of the calling thread's in-progress request as an attribute"""
+
+    def getter(self):
+        return getattr(self._current_request(), name)
+
+    def setter(self, value):
+        setattr(self._current_request(), name, value)
+
+    return property(getter, setter)
+
+
+class Endpoint:
+    """
+    Base class for API clients.
+
+    Methods decorated with ``decorator`` assign ``self.method``, ``self.endpoint``,
+    ``self.params``, ``self.payload``, ``self.files`` and ``self.headers``. Those
+    attributes live in a per-thread, per-call request state that is frozen into a
+    RequestSpec once the method returns, so one client instance can be shared
+    across worker threads without calls overwriting each other's requests.
+    """
+
+    method = _request_attribute("method")
+    endpoint = _request_attribute("endpoint")
+    params = _request_attribute("params")
+    payload = _request_attribute("payload")
+    files = _request_attribute("files")
+    headers = _request_attribute("headers")
+
+    def __init__(self):
+        self.app = None
+        self._request_local = threading.local()
+
+    def _request_stack(self):
+        local = self.__dict__.get("_request_local")
+        if local is None:
+            local = self.__dict__.setdefault("_request_local", threading.local())
+        stack = getattr(local, "stack", None)
+        if stack is None:
+            # Bottom frame holds attributes assigned outside a decorated call
+            stack = local.stack = [_RequestState()]
+        return stack
+
+    def _current_request(self) -> _RequestState:
+        return self._request_stack()[-1]
+
+    def _build_request(self, func, args) -> RequestSpec:
+        """Run a request-building method in a fresh request state and freeze the result"""
+        stack = self._request_stack()
+        stack.append(_RequestState())
+        try:
+            func(self, args)
+            return stack[-1].freeze(self.app)
+        finally:
+            stack.pop()
+
 
 def get_data(http_dict):
     """Execute HTTP request using SyncPurviewClient"""
@@ -28,16 +136,13 @@ def get_data(http_dict):
         # Get account ID from environment (optional)
         account_id = os.getenv("PURVIEW_ACCOUNT_ID")
 
-        # Create config
-        config = SyncPurviewConfig(
-            account_name=account_name, 
+        # Reuse the process-wide client (session, connection pool, tokens) for this account
+        client = get_sync_client(
+            account_name,
             azure_region=os.getenv("AZURE_REGION", "public"),
-            account_id=account_id
+            account_id=account_id,
         )
 
-        # Create synchronous client
-        client = SyncPurviewClient(config)
-
         # Make the request
         # If debug enabled via PURVIEWCLI_DEBUG env var, print helpful diagnostics
         debug = os.getenv("PURVIEWCLI_DEBUG")
@@ -55,15 +160,39 @@ def get_data(http_dict):
             except Exception:
                 print("[PURVIEWCLI DEBUG] Request: (could not serialize request info)")
 
+        method = http_dict.get("method", "GET")
+        endpoint = http_dict.get("endpoint", "/")
+
+        # Serve idempotent reads of slow-changing families from the read-query cache.
+        # Callers own (and sometimes mutate) what they get back, so hand out copies.
+        query_cache = get_read_query_cache()
+        family = cacheable_family(method, endpoint)
+        cache_method = request_cache_method(family, endpoint) if family else None
+        cache_params = {
+            "account": account_name,
+            "account_id": account_id,
+            "params": http_dict.get("params"),
+            "headers": http_dict.get("headers"),
+        }
+        if cache_method:
+            cached = query_cache.get(cache_method, cache_params)
+            if cached is not None:
+                if debug:
+                    print(f"[PURVIEWCLI DEBUG] Read cache hit: {method} {endpoint}")
+                return copy.deepcopy(cached)
+
         result = client.make_request(
-            method=http_dict.get("method", "GET"),
-            endpoint=http_dict.get("endpoint", "/"),
+            method=method,
+            endpoint=endpoint,
             params=http_dict.get("params"),
             json=http_dict.get("payload"),
             files=http_dict.get("files"),
             headers=http_dict.get("headers", {}),
         )
 
+        # Invalidate even when the write failed; it may have partially applied
+        invalidate_for_write(query_cache, method, endpoint)
+
         if debug:
             try:
                 print("[PURVIEWCLI DEBUG] Response:", json.dumps(result, default=str, indent=2))
@@ -75,7 +204,12 @@ def get_data(http_dict):
         # Normalize to return the raw JSON payload when available so
         # calling code (which expects the API JSON) works consistently
         if isinstance(result, dict) and result.get("status") == "success" and "data" in result:
-            return result.get("data")
+            data = result.get("data")
+            if cache_method and data is not None:
+                query_cache.put(
+                    cache_method, cache_params, copy.deepcopy(data), family_ttl_seconds(family)
+                )
+            return data
 
         return result
 
@@ -84,6 +218,13 @@ def get_data(http_dict):
 
 
 def get_json(args, param):
+    """
+    Resolve a payload argument.
+
+    A string is treated as a path to a JSON file. Anything else (a dict or list
+    built in memory, or pre-encoded JSON bytes) is used as the payload as-is, so
+    callers can hand batches over without a temp-file round trip.
+    """
     response = None
     # Fix: Use .get() to avoid KeyError if param is missing
     value = args.get(param, None)
@@ -100,28 +241,25 @@ def get_json(args, param):
     return response
 
 
+def execute_request(request: RequestSpec):
+    """Execute an immutable RequestSpec through the shared HTTP client"""
+    return get_data(request.to_http_dict())
+
+
 def decorator(func):
+    @functools.wraps(func)
     def wrapper(self, args):
-        func(self, args)
-        http_dict = {
-            "app": self.app,
-            "method": self.method,
-            "endpoint": self.endpoint,
-            "params": self.params,
-            "payload": self.payload,
-            "files": self.files,
-            "headers": self.headers,
-        }
-        data = get_data(http_dict)
-        return data
+        request = self._build_request(func, args)
+        return execute_request(request)
 
     return wrapper
 
 
 def no_api_call_decorator(func):
     """Decorator for operations that don't require API calls"""
+    @functools.wraps(func)
     def wrapper(self, args):
-        func(self, args)
+        self._build_request(func, args)
         # Return success status without making HTTP request
         return {"status_code": None, "message": "operation completed", "data": None}
 
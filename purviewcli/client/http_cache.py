@@ -0,0 +1,268 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Persistent HTTP Response Caching System
+Opt-in (PURVIEW_HTTP_CACHE=true) on-disk cache for large, slow-changing reads:
+the full typedef dump, collections, glossary reads and Unified Catalog
+business domains. Entries live in a SQLite database in the CLI config directory
+so they survive across pvw invocations. Entries that came with an ETag are
+revalidated with If-None-Match on every use; the rest expire after a TTL.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, NamedTuple, Optional
+
+from .config import get_config_dir
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_FILE = "http_cache.sqlite"
+
+# Entries without an ETag are served without revalidation for this long
+DEFAULT_HTTP_CACHE_TTL_SECONDS = 900
+
+# (cacheable GET path pattern, path prefix whose writes invalidate it)
+PERSISTENT_CACHE_RULES = (
+    (re.compile(r"^/datamap/api/atlas/v2/types/typedefs(/headers)?$"), "/datamap/api/atlas/v2/types/"),
+    (re.compile(r"^/account/collections(/[^/]+)?$"), "/account/collections"),
+    (re.compile(r"^/datamap/api/atlas/v2/glossary(/[^/]+/detailed)?$"), "/datamap/api/atlas/v2/glossary"),
+    (re.compile(r"^/datagovernance/catalog/businessdomains$"), "/datagovernance/catalog/businessdomains"),
+)
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def http_cache_key(identity: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build the cache key for a GET request.
+
+    The identity (token scope, tenant and client) is part of the key so a
+    response fetched with one principal's permissions is never served to another.
+    """
+    normalized = {k: v for k, v in (params or {}).items() if v is not None}
+    raw = f"{identity}|{url}|{json.dumps(normalized, sort_keys=True, default=str)}"
+    return sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CachedResponse(NamedTuple):
+    """A persisted response body with its validator"""
+
+    data: Any
+    etag: Optional[str]
+    stored_at: float
+
+
+class HttpResponseCache:
+    """
+    SQLite-backed response cache shared by all pvw processes on the machine.
+
+    Every operation opens its own short-lived connection, so the cache is safe
+    to use from worker threads; storage errors are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory for the SQLite file (None = CLI config dir)
+            ttl_seconds: Lifetime of entries without an ETag (None = PURVIEW_HTTP_CACHE_TTL)
+            enabled: Force the cache on or off (None = honor PURVIEW_HTTP_CACHE)
+        """
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._ttl_seconds = ttl_seconds
+        self._enabled = enabled
+        self._schema_lock = Lock()
+        self._schema_ready: set = set()
+        self._hits = 0
+        self._revalidated = 0
+        self._misses = 0
+
+    # === CONFIGURATION ===
+
+    @property
+    def enabled(self) -> bool:
+        if self._enabled is not None:
+            return self._enabled
+        return os.getenv("PURVIEW_HTTP_CACHE", "false").lower() == "true"
+
+    @property
+    def ttl_seconds(self) -> int:
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        try:
+            return int(os.getenv("PURVIEW_HTTP_CACHE_TTL", str(DEFAULT_HTTP_CACHE_TTL_SECONDS)))
+        except ValueError:
+            return DEFAULT_HTTP_CACHE_TTL_SECONDS
+
+    @property
+    def cache_file(self) -> Path:
+        return (self._cache_dir or get_config_dir()) / HTTP_CACHE_FILE
+
+    def is_cacheable(self, method: str, endpoint: str) -> bool:
+        """True if a request may be served from (and stored in) the cache"""
+        if not self.enabled or (method or "").upper() != "GET" or not endpoint:
+            return False
+        path = endpoint.split("?", 1)[0]
+        return any(pattern.match(path) for pattern, _ in PERSISTENT_CACHE_RULES)
+
+    # === STORAGE ===
+
+    def _connect(self) -> sqlite3.Connection:
+        cache_file = self.cache_file
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(cache_file), timeout=10)
+        with self._schema_lock:
+            if str(cache_file) not in self._schema_ready:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    " key TEXT PRIMARY KEY, path TEXT NOT NULL, etag TEXT,"
+                    " body TEXT NOT NULL, stored_at REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS responses_path ON responses(path)")
+                conn.commit()
+                self._schema_ready.add(str(cache_file))
+        return conn
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """
+        Return a usable entry for key, or None.
+
+        Entries with an ETag are always returned (the caller must revalidate);
+        entries without one are returned only while younger than the TTL.
+        """
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT body, etag, stored_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"HTTP cache lookup failed: {e}")
+            return None
+
+        if row is None:
+            self._misses += 1
+            return None
+        body, etag, stored_at = row
+        if not etag and time.time() - stored_at > self.ttl_seconds:
+            self._misses += 1
+            return None
+        if etag:
+            self._revalidated += 1
+        else:
+            self._hits += 1
+        return CachedResponse(json.loads(body), etag, stored_at)
+
+    def store(self, key: str, endpoint: str, data: Any, etag: Optional[str] = None) -> None:
+        """Persist a successful response body and its ETag"""
+        try:
+            body = json.dumps(data)
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, path, etag, body, stored_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, endpoint.split("?", 1)[0], etag, body, time.time()),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.debug(f"Could not persist HTTP cache entry: {e}")
+
+    def touch(self, key: str) -> None:
+        """Record a successful revalidation (HTTP 304) for key"""
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key))
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Could not update HTTP cache entry: {e}")
+
+    def invalidate_for_write(self, method: str, endpoint: str) -> None:
+        """Drop cached responses a write to endpoint could have changed"""
+        if not self.enabled or (method or "").upper() not in WRITE_METHODS or not endpoint:
+            return
+        path = endpoint.split("?", 1)[0]
+        prefixes = [
+            prefix
+            for _, prefix in PERSISTENT_CACHE_RULES
+            if path.startswith(prefix) or prefix.startswith(path)
+        ]
+        if not prefixes:
+            return
+        try:
+            conn = self._connect()
+            try:
+                for prefix in prefixes:
+                    conn.execute("DELETE FROM responses WHERE substr(path, 1, ?) = ?", (len(prefix), prefix))
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Could not invalidate HTTP cache entries: {e}")
+
+    def clear(self) -> None:
+        """Remove the cache database"""
+        with self._schema_lock:
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    Path(f"{self.cache_file}{suffix}").unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.debug(f"Could not remove HTTP cache file: {e}")
+            self._schema_ready.discard(str(self.cache_file))
+            self._hits = 0
+            self._revalidated = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Get cache statistics for diagnostics"""
+        entries = 0
+        if self.cache_file.exists():
+            try:
+                conn = self._connect()
+                try:
+                    entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+                finally:
+                    conn.close()
+            except sqlite3.Error:
+                pass
+        return {
+            "enabled": self.enabled,
+            "entries": entries,
+            "hits": self._hits,
+            "revalidated": self._revalidated,
+            "misses": self._misses,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+# Global HTTP response cache instance
+_global_http_cache = HttpResponseCache()
+
+
+def get_http_cache() -> HttpResponseCache:
+    """Get the global persistent HTTP response cache instance"""
+    return _global_http_cache
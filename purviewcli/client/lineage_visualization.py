@@ -8,6 +8,7 @@ Provides comprehensive data lineage analysis, visualization, and impact assessme
 import asyncio
 import json
 import math
+from collections import Counter, deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple, Set
@@ -19,17 +20,23 @@ from rich.panel import Panel
 from rich.tree import Tree
 from rich.text import Text
 
-# Optional graph analysis dependencies - graceful fallback if not available
+# Optional pandas dependency for CSV export
 try:
     import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    pd = None
+    PANDAS_AVAILABLE = False
+    print("Warning: pandas not available. Lineage CSV export will be unavailable.")
+
+# Optional networkx dependency, only used to export lineage graphs (GraphML);
+# all lineage analysis runs on LineageGraph's own adjacency index
+try:
     import networkx as nx
     GRAPH_AVAILABLE = True
-except ImportError as e:
-    # Create mock classes for when graph dependencies are not available
-    pd = None
+except ImportError:
     nx = None
     GRAPH_AVAILABLE = False
-    print(f"Warning: Graph analysis dependencies not available ({e}). Advanced lineage features will be limited.")
 
 from .api_client import PurviewClient, PurviewConfig
 
@@ -80,12 +87,192 @@ class LineageEdge:
 
 @dataclass
 class LineageGraph:
-    """Complete lineage graph structure"""
+    """
+    Complete lineage graph structure.
+
+    Edges are indexed by node: per-node outgoing and incoming adjacency maps
+    give O(1) degree and neighbour queries, and an edge key set
+    (source, target, process) drops duplicate edges. Add edges through
+    add_edge(); edges appended to ``edges`` directly are indexed on the next query.
+    """
     nodes: Dict[str, LineageNode] = field(default_factory=dict)
     edges: List[LineageEdge] = field(default_factory=list)
     root_guid: str = ""
     depth: int = 0
     direction: str = ""
+    _out: Dict[str, Dict[str, List[LineageEdge]]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _in: Dict[str, Dict[str, List[LineageEdge]]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _edge_keys: Set[Tuple[str, str, Optional[str]]] = field(default_factory=set, init=False, repr=False, compare=False)
+    _indexed: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._reindex()
+
+    def _reindex(self):
+        edges, self.edges = self.edges, []
+        self._out, self._in, self._edge_keys, self._indexed = {}, {}, set(), 0
+        for edge in edges:
+            self.add_edge(edge)
+
+    def _index(self):
+        if self._indexed != len(self.edges):
+            self._reindex()
+
+    def add_edge(self, edge: LineageEdge) -> bool:
+        """Add an edge unless an edge with the same (source, target, process) exists."""
+        self._index()
+        key = (edge.source_guid, edge.target_guid, edge.process_guid)
+        if key in self._edge_keys:
+            return False
+        self._edge_keys.add(key)
+        self.edges.append(edge)
+        self._out.setdefault(edge.source_guid, {}).setdefault(edge.target_guid, []).append(edge)
+        self._in.setdefault(edge.target_guid, {}).setdefault(edge.source_guid, []).append(edge)
+        self._indexed = len(self.edges)
+        return True
+
+    def successors(self, guid: str) -> List[str]:
+        """Nodes reached by an edge from guid."""
+        self._index()
+        return list(self._out.get(guid, ()))
+
+    def predecessors(self, guid: str) -> List[str]:
+        """Nodes with an edge into guid."""
+        self._index()
+        return list(self._in.get(guid, ()))
+
+    def out_degree(self, guid: str) -> int:
+        """Number of outgoing edges of guid."""
+        self._index()
+        return sum(len(edges) for edges in self._out.get(guid, {}).values())
+
+    def in_degree(self, guid: str) -> int:
+        """Number of incoming edges of guid."""
+        self._index()
+        return sum(len(edges) for edges in self._in.get(guid, {}).values())
+
+    def degree(self, guid: str) -> int:
+        return self.in_degree(guid) + self.out_degree(guid)
+
+    def has_edge(self, source_guid: str, target_guid: str) -> bool:
+        """Whether any edge leads from source_guid to target_guid."""
+        self._index()
+        return target_guid in self._out.get(source_guid, {})
+
+    def descendants(self, guid: str) -> Set[str]:
+        """All nodes reachable from guid (excluding guid)."""
+        return self._reachable(guid, downstream=True)
+
+    def ancestors(self, guid: str) -> Set[str]:
+        """All nodes that reach guid (excluding guid)."""
+        return self._reachable(guid, downstream=False)
+
+    def _reachable(self, guid: str, downstream: bool) -> Set[str]:
+        self._index()
+        adjacency = self._out if downstream else self._in
+        seen = {guid}
+        queue = deque([guid])
+        while queue:
+            for neighbour in adjacency.get(queue.popleft(), ()):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    queue.append(neighbour)
+        seen.discard(guid)
+        return seen
+
+    def shortest_path(self, source_guid: str, target_guid: str) -> Optional[List[str]]:
+        """Shortest directed path from source to target (breadth-first), or None."""
+        return self.shortest_paths(source_guid, [target_guid]).get(target_guid)
+
+    def shortest_paths(
+        self, source_guid: str, target_guids: Optional[List[str]] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Shortest directed paths from source to many targets with a single BFS.
+
+        Returns {target: path} for every reachable target (every reachable
+        node when target_guids is None). The search stops once all requested
+        targets have been reached.
+        """
+        self._index()
+        remaining = None if target_guids is None else set(target_guids)
+        parents: Dict[str, Optional[str]] = {source_guid: None}
+        reached = []
+        queue = deque([source_guid])
+        while queue:
+            current = queue.popleft()
+            if remaining is None or current in remaining:
+                reached.append(current)
+                if remaining is not None:
+                    remaining.discard(current)
+                    if not remaining:
+                        break
+            for neighbour in self._out.get(current, ()):
+                if neighbour not in parents:
+                    parents[neighbour] = current
+                    queue.append(neighbour)
+
+        paths = {}
+        for target in reached:
+            path = []
+            current = target
+            while current is not None:
+                path.append(current)
+                current = parents[current]
+            paths[target] = path[::-1]
+        return paths
+
+    def topological_depths(self) -> Dict[str, int]:
+        """
+        Longest-path depth of every node from the graph's sources (Kahn's algorithm).
+
+        Nodes without incoming edges are at depth 0. Nodes on a cycle are
+        numbered breadth-first from the node where the cycle is entered.
+        """
+        self._index()
+        guids = set(self.nodes) | set(self._out) | set(self._in)
+        pending = {guid: len(self._in.get(guid, ())) for guid in guids}
+        depths = {guid: 0 for guid, count in pending.items() if count == 0}
+        queue = deque(sorted(depths))
+        while queue:
+            current = queue.popleft()
+            for neighbour in self._out.get(current, ()):
+                depths[neighbour] = max(depths.get(neighbour, 0), depths[current] + 1)
+                pending[neighbour] -= 1
+                if pending[neighbour] == 0:
+                    queue.append(neighbour)
+
+        # Whatever is still pending sits on or behind a cycle; walk it
+        # breadth-first from where it is entered, visiting each node once
+        cyclic = {guid for guid, count in pending.items() if count > 0}
+        while cyclic:
+            start = min(cyclic, key=lambda guid: (guid not in depths, depths.get(guid, 0), guid))
+            depths.setdefault(start, 0)
+            cyclic.discard(start)
+            queue = deque([start])
+            while queue:
+                current = queue.popleft()
+                for neighbour in self._out.get(current, ()):
+                    if neighbour in cyclic:
+                        cyclic.discard(neighbour)
+                        depths[neighbour] = max(depths.get(neighbour, 0), depths[current] + 1)
+                        queue.append(neighbour)
+        return depths
+
+    def to_networkx(self) -> Any:
+        """Copy the graph into a networkx DiGraph (requires networkx)."""
+        if nx is None:
+            raise RuntimeError("networkx export requires networkx. Install it with: pip install networkx")
+
+        nx_graph = nx.DiGraph()
+        for guid, node in self.nodes.items():
+            nx_graph.add_node(guid, name=node.name, type=node.type_name, depth=node.depth)
+        for edge in self.edges:
+            attributes = {'relationship_type': edge.relationship_type}
+            if edge.process_guid:
+                attributes['process_guid'] = edge.process_guid
+            nx_graph.add_edge(edge.source_guid, edge.target_guid, **attributes)
+        return nx_graph
 
 @dataclass
 class ImpactAnalysis:
@@ -101,9 +288,18 @@ class ImpactAnalysis:
 class AdvancedLineageAnalyzer:
     """Advanced data lineage analysis and visualization"""
     
-    def __init__(self, client: PurviewClient):
+    def __init__(
+        self,
+        client: PurviewClient,
+        max_concurrency: int = 8,
+        max_nodes: int = 5000,
+        hydrate_chunk_size: int = 100
+    ):
         self.client = client
         self.console = Console(legacy_windows=False)
+        self.max_concurrency = max_concurrency
+        self.max_nodes = max_nodes
+        self.hydrate_chunk_size = hydrate_chunk_size
     
     async def get_comprehensive_lineage(
         self, 
@@ -120,22 +316,17 @@ class AdvancedLineageAnalyzer:
             direction=direction.value
         )
         
-        visited_guids = set()
-        
         try:
             # Get root entity information
             root_entity = await self.client.get_entity(entity_guid)
             root_node = self._create_lineage_node(root_entity, 0, "ROOT")
             lineage_graph.nodes[entity_guid] = root_node
             
-            # Build lineage graph recursively
-            await self._build_lineage_recursive(
-                entity_guid, 
-                lineage_graph, 
-                visited_guids, 
-                direction, 
-                depth.value, 
-                0,
+            # Build lineage graph level by level
+            await self._crawl_lineage(
+                lineage_graph,
+                direction,
+                depth.value,
                 include_processes
             )
             
@@ -147,106 +338,116 @@ class AdvancedLineageAnalyzer:
         
         return lineage_graph
     
-    async def _build_lineage_recursive(
+    async def _crawl_lineage(
         self,
-        current_guid: str,
         graph: LineageGraph,
-        visited: Set[str],
         direction: LineageDirection,
         max_depth: int,
-        current_depth: int,
         include_processes: bool
     ):
-        """Recursively build lineage graph"""
-        
-        if current_depth >= max_depth and max_depth != -1:
-            return
-        
-        if current_guid in visited:
-            return
-        
-        visited.add(current_guid)
-        
-        try:
-            # Get lineage from Purview API
-            lineage_response = await self.client._make_request('GET', f'/lineage/{current_guid}')
-            
-            # Process upstream lineage
-            if direction in [LineageDirection.INPUT, LineageDirection.BOTH]:
-                await self._process_lineage_direction(
-                    lineage_response, graph, visited, direction, max_depth, 
-                    current_depth, "INPUT", include_processes
+        """
+        Build the lineage graph breadth-first, one depth level at a time.
+
+        The lineage of every node on the frontier is requested concurrently
+        (bounded by max_concurrency), and the nodes discovered on a level are
+        hydrated with one chunked bulk entity read. Upstream nodes are only
+        expanded upstream and downstream nodes downstream. The crawl stops
+        adding nodes once the graph holds max_nodes.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        visited = {graph.root_guid}
+        frontier = [(graph.root_guid, direction.value)]
+        level = 0
+
+        async def _lineage(guid: str, node_direction: str) -> Dict:
+            async with semaphore:
+                return await self.client.get_lineage(guid, direction=node_direction, depth=1)
+
+        while frontier and (max_depth == -1 or level < max_depth):
+            responses = await asyncio.gather(
+                *(_lineage(guid, node_direction) for guid, node_direction in frontier),
+                return_exceptions=True
+            )
+
+            discovered: Dict[str, str] = {}
+            headers: Dict[str, Dict] = {}
+            for (guid, node_direction), response in zip(frontier, responses):
+                if not isinstance(response, dict):
+                    # Continue processing even if one entity fails
+                    continue
+                headers.update(response.get('guidEntityMap') or {})
+                for lineage_direction in (["INPUT", "OUTPUT"] if node_direction == "BOTH" else [node_direction]):
+                    for next_guid, edge in self._collect_lineage_edges(response, guid, lineage_direction):
+                        if next_guid not in visited:
+                            if len(graph.nodes) + len(discovered) >= self.max_nodes:
+                                # Over budget: drop the node and its edge so no edge dangles
+                                continue
+                            visited.add(next_guid)
+                            discovered[next_guid] = lineage_direction
+                        graph.add_edge(edge)
+
+            if not discovered:
+                break
+
+            level += 1
+            entities = await self._hydrate_entities(list(discovered))
+            for next_guid, lineage_direction in discovered.items():
+                entity = entities.get(next_guid) or headers.get(next_guid) or {'guid': next_guid}
+                graph.nodes[next_guid] = self._create_lineage_node(
+                    {**entity, 'guid': next_guid}, level, lineage_direction
                 )
-            
-            # Process downstream lineage
-            if direction in [LineageDirection.OUTPUT, LineageDirection.BOTH]:
-                await self._process_lineage_direction(
-                    lineage_response, graph, visited, direction, max_depth, 
-                    current_depth, "OUTPUT", include_processes
+
+            if len(graph.nodes) >= self.max_nodes:
+                self.console.print(
+                    f"[yellow]Lineage crawl stopped at {self.max_nodes} nodes (depth {level})[/yellow]"
                 )
-                
-        except Exception as e:
-            # Continue processing even if one entity fails
-            pass
-    
-    async def _process_lineage_direction(
+                break
+
+            frontier = list(discovered.items())
+
+    def _collect_lineage_edges(
         self,
         lineage_response: Dict,
-        graph: LineageGraph,
-        visited: Set[str],
-        direction: LineageDirection,
-        max_depth: int,
-        current_depth: int,
-        lineage_direction: str,
-        include_processes: bool
-    ):
-        """Process lineage in a specific direction"""
-        
-        relations = lineage_response.get('relations', [])
-        
-        for relation in relations:
+        current_guid: str,
+        lineage_direction: str
+    ) -> List[Tuple[str, LineageEdge]]:
+        """Return (neighbour, edge) for the edges touching current_guid in one direction"""
+
+        neighbours = []
+        for relation in lineage_response.get('relations', []):
             from_guid = relation.get('fromEntityId')
             to_guid = relation.get('toEntityId')
-            
+
             if not from_guid or not to_guid:
                 continue
-            
+
             # Determine the next entity to process
-            if lineage_direction == "INPUT":
+            if lineage_direction == "INPUT" and to_guid == current_guid:
                 next_guid = from_guid
-                current_is_target = to_guid
-            else:
+            elif lineage_direction == "OUTPUT" and from_guid == current_guid:
                 next_guid = to_guid
-                current_is_target = from_guid
-            
-            if next_guid not in graph.nodes:
-                try:
-                    # Get entity details
-                    entity = await self.client.get_entity(next_guid)
-                    node = self._create_lineage_node(
-                        entity, 
-                        current_depth + 1, 
-                        lineage_direction
-                    )
-                    graph.nodes[next_guid] = node
-                    
-                    # Create edge
-                    edge = LineageEdge(
-                        source_guid=from_guid,
-                        target_guid=to_guid,
-                        relationship_type=relation.get('relationshipType', 'unknown')
-                    )
-                    graph.edges.append(edge)
-                    
-                    # Continue recursively
-                    await self._build_lineage_recursive(
-                        next_guid, graph, visited, direction, max_depth, 
-                        current_depth + 1, include_processes
-                    )
-                    
-                except Exception as e:
-                    continue
-    
+            else:
+                continue
+
+            neighbours.append((next_guid, LineageEdge(
+                source_guid=from_guid,
+                target_guid=to_guid,
+                relationship_type=relation.get('relationshipType', 'unknown')
+            )))
+
+        return neighbours
+
+    async def _hydrate_entities(self, guids: List[str]) -> Dict[str, Dict]:
+        """Read full entity details for a crawl level in bulk, keyed by GUID"""
+        try:
+            entities = await self.client.get_entities_by_guids(
+                guids, chunk_size=self.hydrate_chunk_size, ignoreRelationships="true"
+            )
+        except Exception:
+            # Fall back to the entity headers from the lineage responses
+            return {}
+        return {entity.get('guid'): entity for entity in entities if entity.get('guid')}
+
     def _create_lineage_node(self, entity: Dict, depth: int, direction: str) -> LineageNode:
         """Create a lineage node from entity data"""
         attributes = entity.get('attributes', {})
@@ -268,17 +469,20 @@ class AdvancedLineageAnalyzer:
     async def _enhance_lineage_graph(self, graph: LineageGraph):
         """Enhance lineage graph with additional metadata and analysis"""
         
+        topological_depths = graph.topological_depths()
+        
         # Add node metrics
         for node in graph.nodes.values():
             try:
                 # Count incoming and outgoing edges
-                incoming = len([e for e in graph.edges if e.target_guid == node.guid])
-                outgoing = len([e for e in graph.edges if e.source_guid == node.guid])
+                incoming = graph.in_degree(node.guid)
+                outgoing = graph.out_degree(node.guid)
                 
                 node.metadata.update({
                     'incoming_count': incoming,
                     'outgoing_count': outgoing,
-                    'connection_count': incoming + outgoing
+                    'connection_count': incoming + outgoing,
+                    'topological_depth': topological_depths.get(node.guid, 0)
                 })
                 
                 # Add additional entity metadata
@@ -302,24 +506,9 @@ class AdvancedLineageAnalyzer:
                 recommendations=[]
             )
         
-        # Create NetworkX graph for analysis
-        nx_graph = self._create_networkx_graph(graph)
-        
-        # Find downstream entities
-        downstream_entities = []
-        if change_entity_guid in nx_graph:
-            try:
-                downstream_entities = list(nx.descendants(nx_graph, change_entity_guid))
-            except:
-                pass
-        
-        # Find upstream entities
-        upstream_entities = []
-        if change_entity_guid in nx_graph:
-            try:
-                upstream_entities = list(nx.ancestors(nx_graph, change_entity_guid))
-            except:
-                pass
+        # Find downstream and upstream entities
+        downstream_entities = list(graph.descendants(change_entity_guid))
+        upstream_entities = list(graph.ancestors(change_entity_guid))
         
         # Calculate impact score
         impact_score = self._calculate_impact_score(
@@ -332,7 +521,7 @@ class AdvancedLineageAnalyzer:
         impact_level = self._determine_impact_level(impact_score, downstream_entities, graph.nodes)
         
         # Find critical paths
-        critical_paths = self._find_critical_paths(nx_graph, change_entity_guid, downstream_entities)
+        critical_paths = self._find_critical_paths(graph, change_entity_guid, downstream_entities)
         
         # Generate recommendations
         recommendations = self._generate_impact_recommendations(
@@ -344,32 +533,11 @@ class AdvancedLineageAnalyzer:
             impact_level=impact_level,
             impact_score=impact_score,
             downstream_count=len(downstream_entities),
-            upstream_count=len(upstream_entities),            critical_paths=critical_paths,
+            upstream_count=len(upstream_entities),
+            critical_paths=critical_paths,
             recommendations=recommendations
         )
     
-    def _create_networkx_graph(self, graph: LineageGraph) -> Any:
-        """Create NetworkX directed graph from lineage graph"""
-        if nx is None:
-            return None
-        
-        nx_graph = nx.DiGraph()
-        
-        # Add nodes
-        for guid, node in graph.nodes.items():
-            nx_graph.add_node(guid, **{
-                'name': node.name,
-                'type': node.type_name,
-                'depth': node.depth
-            })
-        
-        # Add edges
-        for edge in graph.edges:
-            nx_graph.add_edge(edge.source_guid, edge.target_guid, 
-                            relationship_type=edge.relationship_type)
-        
-        return nx_graph
-    
     def _calculate_impact_score(
         self, 
         downstream_count: int, 
@@ -410,7 +578,7 @@ class AdvancedLineageAnalyzer:
     
     def _find_critical_paths(
         self, 
-        nx_graph: Any, 
+        graph: LineageGraph, 
         source_guid: str, 
         downstream_entities: List[str]
     ) -> List[List[str]]:
@@ -421,17 +589,15 @@ class AdvancedLineageAnalyzer:
         # Find paths to entities with many connections (hubs)
         important_entities = [
             guid for guid in downstream_entities
-            if nx_graph.out_degree(guid) + nx_graph.in_degree(guid) > 2
+            if graph.degree(guid) > 2
         ]
         
-        for target_guid in important_entities[:5]:  # Limit to top 5
-            try:
-                if nx.has_path(nx_graph, source_guid, target_guid):
-                    path = nx.shortest_path(nx_graph, source_guid, target_guid)
-                    if len(path) > 2:  # Only include non-trivial paths
-                        critical_paths.append(path)
-            except:
-                continue
+        targets = important_entities[:5]  # Limit to top 5
+        paths = graph.shortest_paths(source_guid, targets)
+        for target_guid in targets:
+            path = paths.get(target_guid)
+            if path and len(path) > 2:  # Only include non-trivial paths
+                critical_paths.append(path)
         
         return critical_paths
     
@@ -498,13 +664,13 @@ class AdvancedLineageAnalyzer:
         upstream_nodes = [n for n in graph.nodes.values() if n.direction == "INPUT"]
         if upstream_nodes:
             upstream_branch = tree.add("⬅️  [bold green]Upstream Dependencies[/bold green]")
-            self._add_nodes_to_tree(upstream_branch, upstream_nodes, graph.edges, max_depth)
+            self._add_nodes_to_tree(upstream_branch, upstream_nodes, graph, max_depth)
         
         # Add downstream section
         downstream_nodes = [n for n in graph.nodes.values() if n.direction == "OUTPUT"]
         if downstream_nodes:
             downstream_branch = tree.add("[->] [bold yellow]Downstream Impact[/bold yellow]")
-            self._add_nodes_to_tree(downstream_branch, downstream_nodes, graph.edges, max_depth)
+            self._add_nodes_to_tree(downstream_branch, downstream_nodes, graph, max_depth)
         
         return tree
     
@@ -512,7 +678,7 @@ class AdvancedLineageAnalyzer:
         self, 
         parent_branch: Tree, 
         nodes: List[LineageNode], 
-        edges: List[LineageEdge],
+        graph: LineageGraph,
         max_depth: int
     ):
         """Add nodes to tree branch"""
@@ -537,9 +703,9 @@ class AdvancedLineageAnalyzer:
                 if node.classifications:
                     node_label += f" | [TAG] {classifications_str}"
                 
-                # Add connection count if available
-                if 'connection_count' in node.metadata:
-                    conn_count = node.metadata['connection_count']
+                # Add connection count
+                conn_count = graph.degree(node.guid)
+                if conn_count:
                     node_label += f" | [LINK] {conn_count} connections"
                 
                 parent_branch.add(node_label)
@@ -623,6 +789,7 @@ class AdvancedLineageAnalyzer:
                         'source_guid': edge.source_guid,
                         'target_guid': edge.target_guid,
                         'relationship_type': edge.relationship_type,
+                        'process_guid': edge.process_guid,
                         'attributes': edge.attributes
                     }
                     for edge in graph.edges
@@ -632,6 +799,11 @@ class AdvancedLineageAnalyzer:
             with open(output_path, 'w') as f:
                 json.dump(graph_data, f, indent=2)
         
+        elif format.lower() == 'graphml':
+            # to_networkx() raises the install hint when networkx is missing
+            nx_graph = graph.to_networkx()
+            nx.write_graphml(nx_graph, output_path)
+        
         elif format.lower() == 'csv':
             # Export nodes
             nodes_df = pd.DataFrame([
@@ -665,8 +837,19 @@ class AdvancedLineageAnalyzer:
         
         self.console.print(f"[green]Lineage graph exported to {output_path}[/green]")
     
-    async def find_lineage_gaps(self, graph: LineageGraph) -> List[Dict]:
-        """Identify potential gaps in lineage documentation"""
+    async def find_lineage_gaps(
+        self,
+        graph: LineageGraph,
+        similarity_threshold: float = 0.7,
+        top_k: int = 5
+    ) -> List[Dict]:
+        """
+        Identify potential gaps in lineage documentation.
+
+        Unconnected entities whose names have a similarity above
+        similarity_threshold are reported as potential missing connections,
+        keeping at most top_k matches per entity.
+        """
         
         gaps = []
         
@@ -676,10 +859,7 @@ class AdvancedLineageAnalyzer:
             if node.guid == graph.root_guid:
                 continue
                 
-            has_upstream = any(e.target_guid == node.guid for e in graph.edges)
-            has_downstream = any(e.source_guid == node.guid for e in graph.edges)
-            
-            if not has_upstream and not has_downstream:
+            if graph.degree(node.guid) == 0:
                 isolated_nodes.append(node)
         
         if isolated_nodes:
@@ -692,25 +872,16 @@ class AdvancedLineageAnalyzer:
         
         # Find potential missing relationships (entities that should be connected)
         # This is a simplified heuristic based on naming patterns
-        potential_connections = []
-        for node1 in graph.nodes.values():
-            for node2 in graph.nodes.values():
-                if node1.guid != node2.guid:
-                    similarity_score = self._calculate_name_similarity(node1.name, node2.name)
-                    if similarity_score > 0.7:  # High similarity
-                        # Check if they're already connected
-                        connected = any(
-                            (e.source_guid == node1.guid and e.target_guid == node2.guid) or
-                            (e.source_guid == node2.guid and e.target_guid == node1.guid)
-                            for e in graph.edges
-                        )
-                        
-                        if not connected:
-                            potential_connections.append({
-                                'entity1': node1.guid,
-                                'entity2': node2.guid,
-                                'similarity_score': similarity_score
-                            })
+        potential_connections = [
+            {
+                'entity1': guid1,
+                'entity2': guid2,
+                'similarity_score': similarity_score
+            }
+            for guid1, guid2, similarity_score in self._find_similar_name_pairs(
+                graph, similarity_threshold, top_k
+            )
+        ]
         
         if potential_connections:
             gaps.append({
@@ -722,19 +893,70 @@ class AdvancedLineageAnalyzer:
         
         return gaps
     
+    def _find_similar_name_pairs(
+        self,
+        graph: LineageGraph,
+        threshold: float,
+        top_k: int
+    ) -> List[Tuple[str, str, float]]:
+        """
+        Find unconnected node pairs with name similarity above threshold.
+
+        Candidates come from an inverted index over name words with prefix
+        filtering: words are ordered rarest first, and two names can only
+        reach a word-set (Jaccard) similarity of threshold if the first
+        len - ceil(threshold * len) + 1 words of each overlap. Only those
+        pairs are scored, so common words like "dim" or "table" do not pull
+        in every other node. Returns (guid1, guid2, score) sorted by score.
+        """
+        words = {guid: self._name_words(node.name) for guid, node in graph.nodes.items()}
+        frequency = Counter(word for name_words in words.values() for word in name_words)
+        index: Dict[str, List[str]] = {}
+        matches: Dict[str, List[Tuple[float, str]]] = {}
+
+        for guid, name_words in words.items():
+            if not name_words:
+                continue
+            ordered = sorted(name_words, key=lambda word: (frequency[word], word))
+            prefix_length = len(ordered) - math.ceil(threshold * len(ordered)) + 1
+
+            candidates = set()
+            for word in ordered[:prefix_length]:
+                candidates.update(index.get(word, ()))
+                index.setdefault(word, []).append(guid)
+
+            for other in candidates:
+                similarity_score = self._word_similarity(name_words, words[other])
+                # Check if they're already connected
+                if similarity_score <= threshold or graph.has_edge(guid, other) or graph.has_edge(other, guid):
+                    continue
+                matches.setdefault(guid, []).append((similarity_score, other))
+                matches.setdefault(other, []).append((similarity_score, guid))
+
+        pairs = {}
+        for guid, node_matches in matches.items():
+            for similarity_score, other in sorted(node_matches, key=lambda m: (-m[0], m[1]))[:top_k]:
+                pairs[tuple(sorted((guid, other)))] = similarity_score
+
+        return sorted(
+            ((guid1, guid2, score) for (guid1, guid2), score in pairs.items()),
+            key=lambda pair: (-pair[2], pair[0], pair[1])
+        )
+
+    @staticmethod
+    def _name_words(name: str) -> Set[str]:
+        return set(name.lower().split('_'))
+
+    @staticmethod
+    def _word_similarity(words1: Set[str], words2: Set[str]) -> float:
+        if not words1 or not words2:
+            return 0.0
+        return len(words1 & words2) / len(words1 | words2)
+
     def _calculate_name_similarity(self, name1: str, name2: str) -> float:
         """Calculate similarity between two entity names"""
         # Simple similarity based on common words and structure
-        words1 = set(name1.lower().split('_'))
-        words2 = set(name2.lower().split('_'))
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        common_words = words1.intersection(words2)
-        total_words = words1.union(words2)
-        
-        return len(common_words) / len(total_words) if total_words else 0.0
+        return self._word_similarity(self._name_words(name1), self._name_words(name2))
 
 class LineageReporting:
     """Generate comprehensive lineage reports"""
@@ -10,7 +10,7 @@ import json
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable, Tuple
+from typing import Dict, List, Optional, Any, Awaitable, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from rich.console import Console
@@ -89,7 +89,12 @@ class Threshold:
 class MonitoringDashboard:
     """Real-time monitoring dashboard for Purview"""
     
-    def __init__(self, client: PurviewClient):
+    def __init__(
+        self,
+        client: PurviewClient,
+        max_concurrency: int = 8,
+        collector_timeout: float = 20.0
+    ):
         self.client = client
         self.console = Console(legacy_windows=False)
         self.metrics: List[Metric] = []
@@ -98,6 +103,8 @@ class MonitoringDashboard:
         self.is_monitoring = False
         self.monitoring_thread = None
         self.refresh_interval = 30  # seconds
+        self.max_concurrency = max_concurrency  # per-collector fan-out limit
+        self.collector_timeout = collector_timeout  # seconds
         
         # Default thresholds
         self._setup_default_thresholds()
@@ -113,30 +120,37 @@ class MonitoringDashboard:
         ]
     
     async def collect_metrics(self) -> List[Metric]:
-        """Collect current metrics from Purview"""
+        """
+        Collect current metrics from Purview.
+
+        The collectors run concurrently, each limited to collector_timeout
+        seconds. A collector that times out contributes whatever it had
+        counted so far, tagged partial=true (or nothing if it cannot report
+        partial results), so one slow collector does not hold up the rest.
+        """
         metrics = []
-        current_time = datetime.now()
+        scan_counts: Dict[str, int] = {}
+        lineage_counts: Dict[str, int] = {}
+        
+        collectors = [
+            ("scan", self._collect_scan_metrics(scan_counts),
+             lambda: self._scan_metrics(scan_counts, datetime.now())
+             if scan_counts.get('tallied') else []),
+            ("entity", self._collect_entity_metrics(), None),
+            ("API", self._collect_api_metrics(), None),
+            ("classification", self._collect_classification_metrics(), None),
+            ("lineage", self._collect_lineage_metrics(lineage_counts),
+             lambda: self._lineage_metrics(
+                 lineage_counts['with_lineage'], lineage_counts['checked'], datetime.now()
+             ) if lineage_counts.get('checked') else []),
+        ]
         
         try:
-            # Scan status metrics
-            scan_metrics = await self._collect_scan_metrics()
-            metrics.extend(scan_metrics)
-            
-            # Entity count metrics
-            entity_metrics = await self._collect_entity_metrics()
-            metrics.extend(entity_metrics)
-            
-            # API performance metrics
-            api_metrics = await self._collect_api_metrics()
-            metrics.extend(api_metrics)
-            
-            # Classification coverage metrics
-            classification_metrics = await self._collect_classification_metrics()
-            metrics.extend(classification_metrics)
-            
-            # Lineage completeness metrics
-            lineage_metrics = await self._collect_lineage_metrics()
-            metrics.extend(lineage_metrics)
+            results = await asyncio.gather(
+                *(self._run_collector(name, collector, partial) for name, collector, partial in collectors)
+            )
+            for collector_metrics in results:
+                metrics.extend(collector_metrics)
             
         except Exception as e:
             self.console.print(f"[red]Error collecting metrics: {e}[/red]")
@@ -150,59 +164,92 @@ class MonitoringDashboard:
         
         return metrics
     
-    async def _collect_scan_metrics(self) -> List[Metric]:
-        """Collect scan-related metrics"""
+    async def _run_collector(
+        self,
+        name: str,
+        collector: Awaitable[List[Metric]],
+        partial: Optional[Callable[[], List[Metric]]]
+    ) -> List[Metric]:
+        """Run one collector under collector_timeout, falling back to its partial results"""
+        try:
+            return await asyncio.wait_for(collector, timeout=self.collector_timeout)
+        except asyncio.TimeoutError:
+            self.console.print(
+                f"[yellow]Warning: {name} metrics timed out after {self.collector_timeout}s"
+                f"{'; reporting partial results' if partial else ''}[/yellow]"
+            )
+            if partial is None:
+                return []
+            metrics = partial()
+            for metric in metrics:
+                metric.tags["partial"] = "true"
+            return metrics
+    
+    async def _bounded_gather(self, coroutines) -> List[Any]:
+        """Await coroutines concurrently, at most max_concurrency at a time; errors are returned"""
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        
+        async def _bounded(coroutine):
+            async with semaphore:
+                return await coroutine
+        
+        return await asyncio.gather(*(_bounded(c) for c in coroutines), return_exceptions=True)
+    
+    async def _collect_scan_metrics(self, counts: Optional[Dict[str, int]] = None) -> List[Metric]:
+        """Collect scan-related metrics; counts is updated as scan runs are tallied"""
         metrics = []
-        current_time = datetime.now()
+        counts = {} if counts is None else counts
+        for key in ('running', 'failed', 'completed', 'tallied'):
+            counts.setdefault(key, 0)
         
         try:
             # Get data sources
             data_sources = await self.client._make_request('GET', '/scan/datasources')
+            ds_names = [ds.get('name', '') for ds in data_sources.get('value', [])]
+            
+            # Get scans for every data source
+            scans_responses = await self._bounded_gather(
+                self.client._make_request('GET', f'/scan/datasources/{ds_name}/scans')
+                for ds_name in ds_names
+            )
+            scan_paths = [
+                (ds_name, scan.get('name', ''))
+                for ds_name, response in zip(ds_names, scans_responses)
+                if isinstance(response, dict)
+                for scan in response.get('value', [])
+            ]
             
-            running_scans = 0
-            failed_scans = 0
-            completed_scans = 0
+            # Get recent runs of every scan
+            async def _tally_runs(ds_name: str, scan_name: str):
+                runs_response = await self.client._make_request(
+                    'GET', f'/scan/datasources/{ds_name}/scans/{scan_name}/runs'
+                )
+                for run in runs_response.get('value', [])[-5:]:  # Check last 5 runs
+                    status = run.get('status', '').lower()
+                    if status == 'running':
+                        counts['running'] += 1
+                    elif status == 'failed':
+                        counts['failed'] += 1
+                    elif status == 'succeeded':
+                        counts['completed'] += 1
+                counts['tallied'] += 1
             
-            for ds in data_sources.get('value', []):
-                ds_name = ds.get('name', '')
-                
-                # Get scans for this data source
-                try:
-                    scans_response = await self.client._make_request('GET', f'/scan/datasources/{ds_name}/scans')
-                    scans = scans_response.get('value', [])
-                    
-                    for scan in scans:
-                        scan_name = scan.get('name', '')
-                        
-                        # Get recent runs
-                        try:
-                            runs_response = await self.client._make_request('GET', f'/scan/datasources/{ds_name}/scans/{scan_name}/runs')
-                            runs = runs_response.get('value', [])
-                            
-                            for run in runs[-5:]:  # Check last 5 runs
-                                status = run.get('status', '').lower()
-                                if status == 'running':
-                                    running_scans += 1
-                                elif status == 'failed':
-                                    failed_scans += 1
-                                elif status == 'succeeded':
-                                    completed_scans += 1
-                        except:
-                            continue
-                except:
-                    continue
+            await self._bounded_gather(_tally_runs(ds_name, scan_name) for ds_name, scan_name in scan_paths)
             
-            metrics.extend([
-                Metric("running_scans", running_scans, current_time, MetricType.SCAN_STATUS),
-                Metric("failed_scans", failed_scans, current_time, MetricType.SCAN_STATUS),
-                Metric("completed_scans", completed_scans, current_time, MetricType.SCAN_STATUS),
-            ])
+            metrics.extend(self._scan_metrics(counts, datetime.now()))
             
         except Exception as e:
             self.console.print(f"[yellow]Warning: Could not collect scan metrics: {e}[/yellow]")
         
         return metrics
     
+    def _scan_metrics(self, counts: Dict[str, int], current_time: datetime) -> List[Metric]:
+        return [
+            Metric("running_scans", counts.get('running', 0), current_time, MetricType.SCAN_STATUS),
+            Metric("failed_scans", counts.get('failed', 0), current_time, MetricType.SCAN_STATUS),
+            Metric("completed_scans", counts.get('completed', 0), current_time, MetricType.SCAN_STATUS),
+        ]
+    
     async def _collect_entity_metrics(self) -> List[Metric]:
         """Collect entity-related metrics"""
         metrics = []
@@ -296,10 +343,12 @@ class MonitoringDashboard:
         
         return metrics
     
-    async def _collect_lineage_metrics(self) -> List[Metric]:
-        """Collect lineage completeness metrics"""
+    async def _collect_lineage_metrics(self, counts: Optional[Dict[str, int]] = None) -> List[Metric]:
+        """Collect lineage completeness metrics; counts is updated as entities are checked"""
         metrics = []
-        current_time = datetime.now()
+        counts = {} if counts is None else counts
+        counts.setdefault('checked', 0)
+        counts.setdefault('with_lineage', 0)
         
         try:
             # This is a simplified approach - in practice, you'd want more sophisticated lineage analysis
@@ -314,33 +363,34 @@ class MonitoringDashboard:
             search_response = await self.client._make_request('POST', '/search/query', json=search_payload)
             entities = search_response.get('value', [])
             
-            entities_with_lineage = 0
-            for entity in entities:
-                guid = entity.get('id', '')
-                if guid:
-                    try:
-                        lineage = await self.client._make_request('GET', f'/lineage/{guid}')
-                        if lineage.get('relations'):
-                            entities_with_lineage += 1
-                    except:
-                        continue
+            async def _check_lineage(guid: str):
+                lineage = await self.client._make_request('GET', f'/lineage/{guid}')
+                counts['checked'] += 1
+                if lineage.get('relations'):
+                    counts['with_lineage'] += 1
             
-            total_datasets = len(entities)
-            if total_datasets > 0:
-                lineage_percentage = (entities_with_lineage / total_datasets) * 100
-            else:
-                lineage_percentage = 0
+            await self._bounded_gather(
+                _check_lineage(entity['id']) for entity in entities if entity.get('id')
+            )
             
-            metrics.extend([
-                Metric("entities_with_lineage", entities_with_lineage, current_time, MetricType.LINEAGE_COMPLETENESS),
-                Metric("lineage_completeness", lineage_percentage, current_time, MetricType.LINEAGE_COMPLETENESS),
-            ])
+            metrics.extend(self._lineage_metrics(counts['with_lineage'], len(entities), datetime.now()))
             
         except Exception as e:
             self.console.print(f"[yellow]Warning: Could not collect lineage metrics: {e}[/yellow]")
         
         return metrics
     
+    def _lineage_metrics(self, entities_with_lineage: int, total_datasets: int, current_time: datetime) -> List[Metric]:
+        if total_datasets > 0:
+            lineage_percentage = (entities_with_lineage / total_datasets) * 100
+        else:
+            lineage_percentage = 0
+        
+        return [
+            Metric("entities_with_lineage", entities_with_lineage, current_time, MetricType.LINEAGE_COMPLETENESS),
+            Metric("lineage_completeness", lineage_percentage, current_time, MetricType.LINEAGE_COMPLETENESS),
+        ]
+    
     def check_thresholds(self, metrics: List[Metric]) -> List[Alert]:
         """Check metrics against thresholds and generate alerts"""
         new_alerts = []
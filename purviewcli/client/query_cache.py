@@ -4,10 +4,16 @@
 Read-Query Caching System
 Optional in-memory cache with TTL for read-only operations (search, list, read).
 Reduces API calls for repeated queries in a single session.
+
+The shared request executor (``endpoint.get_data``) caches GET responses for the
+endpoint families in ``READ_CACHE_FAMILIES`` and invalidates a family whenever a
+write is sent to an overlapping path, so long-running scripts and the MCP server
+stop re-fetching the same typedefs and collections payloads.
 """
 
+import os
 import time
-from typing import Dict, Any, Optional, Callable, Tuple
+from typing import Dict, Any, Optional, Callable, NamedTuple, Tuple
 from threading import Lock
 from hashlib import md5
 import json
@@ -16,9 +22,10 @@ import json
 class CacheEntry:
     """Individual cache entry with TTL expiry"""
     
-    def __init__(self, value: Any, ttl_seconds: int):
+    def __init__(self, value: Any, ttl_seconds: int, method_name: str = ""):
         self.value = value
         self.ttl_seconds = ttl_seconds
+        self.method_name = method_name
         self.created_at = time.time()
     
     def is_expired(self) -> bool:
@@ -125,7 +132,7 @@ class ReadQueryCache:
         ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl_seconds
         
         with self._lock:
-            self._cache[cache_key] = CacheEntry(value, ttl)
+            self._cache[cache_key] = CacheEntry(value, ttl, method_name)
     
     def invalidate(self, method_name: Optional[str] = None) -> None:
         """
@@ -139,7 +146,9 @@ class ReadQueryCache:
                 self._cache.clear()
             else:
                 # Clear entries matching method prefix
-                keys_to_delete = [k for k in self._cache.keys() if method_name in k]
+                keys_to_delete = [
+                    k for k, e in self._cache.items() if e.method_name.startswith(method_name)
+                ]
                 for key in keys_to_delete:
                     del self._cache[key]
     
@@ -170,6 +179,93 @@ class ReadQueryCache:
             self._misses = 0
 
 
+# === REQUEST-LEVEL CACHING ===
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class ReadCacheFamily(NamedTuple):
+    """Endpoint family whose GET responses may be served from the read-query cache"""
+
+    name: str
+    read_prefix: str
+    read_suffix: str
+    invalidate_prefixes: Tuple[str, ...]
+    default_ttl_seconds: int
+
+
+# GETs matching read_prefix (and read_suffix, when set) are cached; any write whose
+# path overlaps one of invalidate_prefixes drops the whole family.
+# Override TTLs with PURVIEW_READ_CACHE_TTL_<NAME> (seconds, 0 = do not cache).
+READ_CACHE_FAMILIES: Tuple[ReadCacheFamily, ...] = (
+    ReadCacheFamily(
+        "typedefs", "/datamap/api/atlas/v2/types/", "", ("/datamap/api/atlas/v2/types/",), 300
+    ),
+    ReadCacheFamily("collections", "/account/collections", "", ("/account/collections",), 120),
+    ReadCacheFamily(
+        "glossary", "/datamap/api/atlas/v2/glossary", "", ("/datamap/api/atlas/v2/glossary",), 60
+    ),
+    # Headers carry classifications and term assignments, so entity writes
+    # (bulk, classification, labels) and glossary term assignments invalidate them
+    ReadCacheFamily(
+        "entity_headers",
+        "/datamap/api/atlas/v2/entity/guid/",
+        "/header",
+        ("/datamap/api/atlas/v2/entity", "/datamap/api/atlas/v2/glossary"),
+        30,
+    ),
+    ReadCacheFamily(
+        "uc_domains",
+        "/datagovernance/catalog/businessdomains",
+        "",
+        ("/datagovernance/catalog/businessdomains",),
+        120,
+    ),
+)
+
+
+def read_cache_enabled() -> bool:
+    """Request-level caching is on unless PURVIEW_READ_CACHE=false"""
+    return os.getenv("PURVIEW_READ_CACHE", "true").lower() != "false"
+
+
+def family_ttl_seconds(family: ReadCacheFamily) -> int:
+    """TTL for a family, honoring PURVIEW_READ_CACHE_TTL_<NAME>"""
+    raw = os.getenv(f"PURVIEW_READ_CACHE_TTL_{family.name.upper()}")
+    if raw is None:
+        return family.default_ttl_seconds
+    try:
+        return int(raw)
+    except ValueError:
+        return family.default_ttl_seconds
+
+
+def cacheable_family(method: str, endpoint: str) -> Optional[ReadCacheFamily]:
+    """Return the cache family for a GET request, or None if it must not be cached"""
+    if (method or "GET").upper() != "GET" or not endpoint or not read_cache_enabled():
+        return None
+    path = endpoint.split("?", 1)[0]
+    for family in READ_CACHE_FAMILIES:
+        if path.startswith(family.read_prefix) and path.endswith(family.read_suffix):
+            return family if family_ttl_seconds(family) > 0 else None
+    return None
+
+
+def request_cache_method(family: ReadCacheFamily, endpoint: str) -> str:
+    """Cache method name for a request: the family name followed by the request path"""
+    return f"{family.name}:{endpoint}"
+
+
+def invalidate_for_write(cache: "ReadQueryCache", method: str, endpoint: str) -> None:
+    """Drop every cached family a write to endpoint could have changed"""
+    if (method or "").upper() not in WRITE_METHODS or not endpoint:
+        return
+    path = endpoint.split("?", 1)[0]
+    for family in READ_CACHE_FAMILIES:
+        if any(path.startswith(prefix) or prefix.startswith(path) for prefix in family.invalidate_prefixes):
+            cache.invalidate(f"{family.name}:")
+
+
 # Global cache instance
 _global_query_cache = ReadQueryCache(default_ttl_seconds=60)
 
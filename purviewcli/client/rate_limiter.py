@@ -1,7 +1,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import random
 import threading
 import time
+from contextlib import contextmanager
 
 class RateLimiter:
     """
@@ -30,3 +32,129 @@ class RateLimiter:
                 self.allowance = 0
             else:
                 self.allowance -= 1.0
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header value into seconds.
+    Accepts delta-seconds ("5", "1.5") or an HTTP-date; returns None when absent or invalid.
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class AdaptiveConcurrencyController:
+    """
+    Thread-safe AIMD (additive-increase / multiplicative-decrease) concurrency limiter.
+
+    Callers hold a slot for the duration of each HTTP request. Every successful
+    response grows the limit by 1/limit (about +1 per full window); a throttling
+    response (429/503) halves it and pauses all callers until Retry-After has
+    elapsed, so parallel bulk jobs converge on the highest rate the service accepts.
+    config example: { 'initial_limit': 16, 'min_limit': 1, 'max_limit': 64 }
+    """
+    def __init__(self, config=None):
+        config = config or {}
+        self.min_limit = max(1, config.get('min_limit', 1))
+        self.max_limit = max(self.min_limit, config.get('max_limit', 64))
+        initial = config.get('initial_limit', 16)
+        self.decrease_factor = config.get('decrease_factor', 0.5)
+        self.base_backoff = config.get('base_backoff', 1.0)   # seconds, used without Retry-After
+        self.max_backoff = config.get('max_backoff', 60.0)
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial)))
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._throttled = 0
+        self._succeeded = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self):
+        return max(self.min_limit, int(self._limit))
+
+    def acquire(self):
+        """Block until a request slot is free and no Retry-After pause is active"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if self._paused_until > now:
+                    self._cond.wait(self._paused_until - now)
+                    continue
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return
+                self._cond.wait()
+
+    def release(self):
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """Context manager holding one request slot"""
+        self.acquire()
+        try:
+            yield self
+        finally:
+            self.release()
+
+    def on_success(self):
+        """Additive increase after a non-throttled response"""
+        with self._cond:
+            self._succeeded += 1
+            previous = self.limit
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / max(self._limit, 1.0))
+            if self.limit > previous:
+                self._cond.notify_all()
+
+    def on_throttle(self, retry_after=None, attempt=0):
+        """
+        Multiplicative decrease after a 429/503 and pause new requests.
+
+        Args:
+            retry_after: Seconds from the Retry-After header (None = exponential backoff)
+            attempt: Zero-based retry attempt for the throttled request
+
+        Returns:
+            Seconds the caller should wait before retrying
+        """
+        if retry_after is None:
+            delay = min(self.max_backoff, self.base_backoff * (2 ** attempt))
+            delay += random.uniform(0, 0.1) * delay
+        else:
+            delay = min(self.max_backoff * 2, retry_after)
+        with self._cond:
+            self._throttled += 1
+            now = time.monotonic()
+            # One decrease per pause window: a burst of 429s from the same window
+            # should not collapse the limit to the floor.
+            if now >= self._last_decrease + max(delay, 1.0) or self._last_decrease == 0.0:
+                self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+                self._last_decrease = now
+            self._paused_until = max(self._paused_until, now + delay)
+            self._cond.notify_all()
+        return delay
+
+    def stats(self):
+        with self._cond:
+            return {
+                'limit': self.limit,
+                'in_flight': self._in_flight,
+                'succeeded': self._succeeded,
+                'throttled': self._throttled,
+            }
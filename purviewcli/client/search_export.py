@@ -0,0 +1,309 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Partitioned Search Export
+Splits the catalog into disjoint partitions with a facet query (entityType,
+collectionId or assetType), streams each partition concurrently with
+``Search.iter_search`` into a part file, and merges the parts into a single
+NDJSON, CSV or Parquet file. Progress is recorded in a manifest next to the
+output so an interrupted export can be resumed without re-reading finished
+partitions.
+"""
+
+import csv
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .bulk_executor import run_batches
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+PARTITION_FACETS = ("entityType", "collectionId", "assetType")
+
+# Facets where an asset carries exactly one value, so partitions never overlap.
+# Other facets (assetType is a list) are de-duplicated by id while merging.
+SINGLE_VALUED_FACETS = {"entityType", "collectionId"}
+
+MANIFEST_VERSION = 1
+
+
+def _combine_filters(base_filter: Optional[Dict[str, Any]], condition: Dict[str, Any]) -> Dict[str, Any]:
+    if not base_filter:
+        return condition
+    return {"and": [base_filter, condition]}
+
+
+def plan_partitions(
+    search,
+    facet: str,
+    base_filter: Optional[Dict[str, Any]] = None,
+    keywords: Optional[str] = "*",
+    facet_count: int = 1000,
+) -> List[Dict[str, Any]]:
+    """
+    Split a search into disjoint partitions using one facet query.
+
+    Every facet value becomes a partition; a final remainder partition
+    matches assets with none of the returned values (missing facet, or values
+    beyond facet_count), so the union of partitions covers the whole result set.
+
+    Args:
+        search: Search client used for the facet query
+        facet: Field to partition on (see PARTITION_FACETS)
+        base_filter: Filter applied to every partition, or None
+        keywords: Search keywords
+        facet_count: Maximum number of facet values requested
+
+    Returns:
+        List of partition dicts with 'key', 'filter' and 'expected' (count or None)
+
+    Raises:
+        RuntimeError: When the facet query fails
+    """
+    request = {
+        "keywords": keywords,
+        "limit": 1,
+        "facets": [{"facet": facet, "count": facet_count, "sort": {"count": "desc"}}],
+    }
+    if base_filter:
+        request["filter"] = base_filter
+
+    result = search.searchQuery({"--payloadFile": request})
+    if not isinstance(result, dict) or result.get("status") == "error":
+        message = result.get("message") if isinstance(result, dict) else result
+        raise RuntimeError(f"Facet query failed: {message}")
+
+    buckets = (result.get("@search.facets") or {}).get(facet) or []
+    values = [b.get("value") for b in buckets if b.get("value") not in (None, "")]
+
+    partitions = [
+        {
+            "key": f"{facet}={bucket['value']}",
+            "filter": _combine_filters(base_filter, {facet: bucket["value"]}),
+            "expected": bucket.get("count"),
+        }
+        for bucket in buckets
+        if bucket.get("value") not in (None, "")
+    ]
+    remainder = (
+        _combine_filters(base_filter, {"not": {"or": [{facet: v} for v in values]}})
+        if values
+        else base_filter
+    )
+    partitions.append({"key": f"{facet}=<other>", "filter": remainder, "expected": None})
+    return partitions
+
+
+class SearchExporter:
+    """
+    Export every search result matching a filter into one output file.
+
+    Partitions are streamed in parallel (one continuation-token cursor each)
+    into part files under ``<output>.parts/``; ``<output>.manifest.json`` tracks
+    which partitions finished so ``run(resume=True)`` only re-reads the rest.
+    """
+
+    def __init__(
+        self,
+        search,
+        output_path,
+        fmt: str = "ndjson",
+        facet: str = "entityType",
+        base_filter: Optional[Dict[str, Any]] = None,
+        keywords: Optional[str] = "*",
+        max_parallel: int = 4,
+        page_size: int = 1000,
+        progress: Optional[Callable[[Dict[str, Any], Optional[BaseException]], None]] = None,
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            search: Search client (shared by all worker threads)
+            output_path: Merged output file
+            fmt: One of EXPORT_FORMATS
+            facet: Partitioning facet (see PARTITION_FACETS)
+            base_filter: Filter applied to the whole export, or None
+            keywords: Search keywords
+            max_parallel: Number of partitions streamed concurrently
+            page_size: Results per search page
+            progress: Optional callback(partition, error) after each partition
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format '{fmt}'. Use one of: {', '.join(EXPORT_FORMATS)}")
+        if fmt == "parquet":
+            try:
+                import pyarrow  # noqa: F401  (parquet engine for pandas)
+            except ImportError:
+                raise RuntimeError("Parquet export requires pyarrow. Install it with: pip install pyarrow")
+        self.search = search
+        self.output_path = Path(output_path)
+        self.fmt = fmt
+        self.facet = facet
+        self.base_filter = base_filter
+        self.keywords = keywords
+        self.max_parallel = max_parallel
+        self.page_size = page_size
+        self.progress = progress
+        self.parts_dir = self.output_path.with_name(self.output_path.name + ".parts")
+        self.manifest_path = self.output_path.with_name(self.output_path.name + ".manifest.json")
+
+    # === MANIFEST ===
+
+    def _settings(self) -> Dict[str, Any]:
+        return {
+            "facet": self.facet,
+            "filter": self.base_filter,
+            "keywords": self.keywords,
+            "format": self.fmt,
+        }
+
+    def _load_manifest(self) -> Optional[Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return None
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("settings") != self._settings():
+            raise ValueError(
+                f"Manifest {self.manifest_path} was written for different export settings; "
+                "remove it or rerun without --resume"
+            )
+        return manifest
+
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        tmp_path = self.manifest_path.with_name(f"{self.manifest_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    # === EXPORT ===
+
+    def _export_partition(self, partition: Dict[str, Any]) -> int:
+        count = 0
+        with open(self.parts_dir / partition["part_file"], "w", encoding="utf-8") as f:
+            for record in self.search.iter_search(
+                filter=partition["filter"], page_size=self.page_size, keywords=self.keywords
+            ):
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write("\n")
+                count += 1
+        return count
+
+    def run(self, resume: bool = False) -> Dict[str, Any]:
+        """
+        Run (or resume) the export.
+
+        Returns:
+            Summary dict with 'partitions', 'failed' (list of keys), 'records'
+            and 'output' (None when partitions failed and nothing was merged)
+        """
+        manifest = self._load_manifest() if resume else None
+        if manifest is None:
+            shutil.rmtree(self.parts_dir, ignore_errors=True)
+            partitions = plan_partitions(self.search, self.facet, self.base_filter, self.keywords)
+            for index, partition in enumerate(partitions):
+                partition.update(part_file=f"part-{index:05d}.ndjson", status="pending", records=0)
+            manifest = {"version": MANIFEST_VERSION, "settings": self._settings(), "partitions": partitions}
+        self.parts_dir.mkdir(parents=True, exist_ok=True)
+        self._save_manifest(manifest)
+
+        pending = [
+            p
+            for p in manifest["partitions"]
+            if p["status"] != "done" or not (self.parts_dir / p["part_file"]).exists()
+        ]
+        for outcome in run_batches(self._export_partition, pending, self.max_parallel):
+            partition = outcome.item
+            if outcome.error is None:
+                partition.update(status="done", records=outcome.result)
+                partition.pop("error", None)
+            else:
+                partition.update(status="failed", error=str(outcome.error))
+            self._save_manifest(manifest)
+            if self.progress:
+                self.progress(partition, outcome.error)
+
+        failed = [p["key"] for p in manifest["partitions"] if p["status"] != "done"]
+        summary = {
+            "partitions": len(manifest["partitions"]),
+            "failed": failed,
+            "records": 0,
+            "output": None,
+        }
+        if failed:
+            return summary
+
+        summary["records"] = self._merge(manifest["partitions"])
+        summary["output"] = str(self.output_path)
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
+        self.manifest_path.unlink()
+        return summary
+
+    # === MERGE ===
+
+    def _iter_records(self, partitions: List[Dict[str, Any]]):
+        seen = None if self.facet in SINGLE_VALUED_FACETS else set()
+        for partition in partitions:
+            with open(self.parts_dir / partition["part_file"], "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if seen is not None:
+                        record_id = record.get("id")
+                        if record_id in seen:
+                            continue
+                        if record_id is not None:
+                            seen.add(record_id)
+                    yield record
+
+    def _merge(self, partitions: List[Dict[str, Any]]) -> int:
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.output_path.with_name(f"{self.output_path.name}.{os.getpid()}.tmp")
+        if self.fmt == "ndjson":
+            count = self._write_ndjson(partitions, tmp_path)
+        elif self.fmt == "csv":
+            count = self._write_csv(partitions, tmp_path)
+        else:
+            count = self._write_parquet(partitions, tmp_path)
+        os.replace(tmp_path, self.output_path)
+        return count
+
+    def _write_ndjson(self, partitions, path: Path) -> int:
+        count = 0
+        with open(path, "w", encoding="utf-8") as out:
+            for record in self._iter_records(partitions):
+                out.write(json.dumps(record, ensure_ascii=False))
+                out.write("\n")
+                count += 1
+        return count
+
+    @staticmethod
+    def _flatten(record: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            key: json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value
+            for key, value in record.items()
+        }
+
+    def _write_csv(self, partitions, path: Path) -> int:
+        # First pass collects the column union so rows can be streamed in the second
+        columns: Dict[str, None] = {}
+        for record in self._iter_records(partitions):
+            columns.update(dict.fromkeys(record))
+        count = 0
+        with open(path, "w", encoding="utf-8", newline="") as out:
+            writer = csv.DictWriter(out, fieldnames=list(columns), extrasaction="ignore")
+            writer.writeheader()
+            for record in self._iter_records(partitions):
+                writer.writerow(self._flatten(record))
+                count += 1
+        return count
+
+    def _write_parquet(self, partitions, path: Path) -> int:
+        import pandas as pd
+
+        rows = [self._flatten(record) for record in self._iter_records(partitions)]
+        pd.DataFrame(rows).to_parquet(path, index=False)
+        return len(rows)
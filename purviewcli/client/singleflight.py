@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Request Coalescing
+Deduplicates identical concurrent idempotent requests ("singleflight"): while
+a GET for a key is on the wire, later callers for the same key wait for that
+response instead of sending their own. Nothing is cached once the request
+completes; the next caller goes to the wire again.
+"""
+
+import asyncio
+import copy
+import json
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# Methods that are safe to share a single response between callers
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+
+def coalescing_enabled() -> bool:
+    return os.getenv("PURVIEW_DISABLE_REQUEST_COALESCING", "false").lower() != "true"
+
+
+def request_key(method: str, url: str, params: Any = None, headers: Any = None) -> Optional[str]:
+    """
+    Key identifying an idempotent request, or None if it must not be coalesced.
+
+    Only GET/HEAD requests are coalesced. Params and headers are part of the
+    key, so requests that differ in query string or caller-supplied headers
+    (e.g. If-None-Match) never share a response.
+    """
+    if method.upper() not in COALESCED_METHODS:
+        return None
+    return json.dumps(
+        [method.upper(), url, params or {}, headers or {}], sort_keys=True, default=str
+    )
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Thread-based request coalescing.
+
+    The first caller for a key (the leader) runs the request; callers that
+    arrive while it is in flight block until it finishes and receive the same
+    exception or a deep copy of its result, since callers may mutate the
+    responses they get back. The copy is taken from a snapshot made before
+    the leader returns, so nothing the leader's caller does to its result
+    reaches the followers.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key: Optional[str], fn: Callable[[], Any]) -> Any:
+        """Run fn once per concurrent key; a None key always runs fn."""
+        if key is None:
+            return fn()
+
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            raise
+
+        with self._lock:
+            del self._calls[key]
+            waiters = call.waiters
+        try:
+            # No follower can join once the key is gone; snapshot for those
+            # waiting before the leader's caller gets the result
+            if waiters:
+                call.result = copy.deepcopy(result)
+        finally:
+            call.done.set()
+        return result
+
+
+class _AsyncCall:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self):
+        self.task: Optional["asyncio.Future"] = None
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of SingleFlight for the aiohttp client.
+
+    The request runs as a task that every caller awaits through asyncio.shield,
+    so cancelling one caller (leader included) does not cancel the request
+    for the others. Followers receive deep copies of a snapshot taken before
+    the task resolves.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _AsyncCall] = {}
+        self.shared = 0
+
+    async def do(self, key: Optional[str], fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn once per concurrent key; a None key always awaits fn."""
+        if key is None:
+            return await fn()
+
+        call = self._calls.get(key)
+        if call is not None:
+            call.waiters += 1
+            self.shared += 1
+            _, snapshot = await asyncio.shield(call.task)
+            return copy.deepcopy(snapshot)
+
+        call = self._calls[key] = _AsyncCall()
+        call.task = asyncio.ensure_future(self._run(key, call, fn))
+        result, _ = await asyncio.shield(call.task)
+        return result
+
+    async def _run(self, key: str, call: _AsyncCall, fn: Callable[[], Awaitable[Any]]):
+        try:
+            result = await fn()
+        finally:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        # The key is gone, so the waiter count is final; the leader has not seen result yet
+        return result, (copy.deepcopy(result) if call.waiters else None)
+
@@ -9,6 +9,7 @@ import os
 import json
 import subprocess
 import logging
+import threading
 from typing import Dict, Optional
 from azure.identity import DefaultAzureCredential, ClientSecretCredential
 from azure.core.credentials import AccessToken
@@ -17,10 +18,21 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import ssl
 import urllib3
+from .account_cache import get_cached_account, store_account
+from .http_cache import get_http_cache, http_cache_key
+from .rate_limiter import AdaptiveConcurrencyController, parse_retry_after
+from .singleflight import SingleFlight, coalescing_enabled, request_key
+from .token_cache import get_token_cache, identity_cache_key
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Responses that mean "slow down" rather than "failed"
+THROTTLE_STATUS_CODES = (429, 503)
+
+# Methods that may be replayed after a response that could follow a completed write
+IDEMPOTENT_METHODS = frozenset({"HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"})
+
 
 # Custom Authentication Exceptions
 class PurviewAuthenticationError(Exception):
@@ -144,6 +156,27 @@ class AzureCliCredentialFixed:
             raise AzureCliAuthenticationError(f"Unexpected authentication error: {str(e)}")
 
 
+def resolve_base_url(account_name: str, azure_region: Optional[str] = "public") -> str:
+    """Return the Data Map base URL for an account in the given Azure cloud"""
+    region = (azure_region or "").lower()
+    if region == "china":
+        return f"https://{account_name}.purview.azure.cn"
+    if region == "usgov":
+        return f"https://{account_name}.purview.azure.us"
+    return f"https://{account_name}.purview.azure.com"
+
+
+def resolve_auth_scope(azure_region: Optional[str] = "public") -> str:
+    """Return the Data Map token scope for the given Azure cloud"""
+    region = (azure_region or "").lower()
+    if region == "china":
+        return "https://purview.azure.cn/.default"
+    if region == "usgov":
+        return "https://purview.azure.us/.default"
+    # Allow override via environment variable for special tenants using legacy service principal
+    return os.environ.get("PURVIEW_AUTH_SCOPE", "https://purview.azure.net/.default")
+
+
 class SyncPurviewConfig:
     """Simple synchronous config"""
 
@@ -160,42 +193,113 @@ class SyncPurviewClient:
         self.config = config
 
         # Set up regular Purview API endpoints based on Azure region, using account name in the URL
-        if config.azure_region and config.azure_region.lower() == "china":
-            self.base_url = f"https://{config.account_name}.purview.azure.cn"
-            self.auth_scope = "https://purview.azure.cn/.default"
-        elif config.azure_region and config.azure_region.lower() == "usgov":
-            self.base_url = f"https://{config.account_name}.purview.azure.us"
-            self.auth_scope = "https://purview.azure.us/.default"
-        else:
-            self.base_url = f"https://{config.account_name}.purview.azure.com"
-            # Allow override via environment variable for special tenants using legacy service principal
-            self.auth_scope = os.environ.get("PURVIEW_AUTH_SCOPE", "https://purview.azure.net/.default")
+        self.base_url = resolve_base_url(config.account_name, config.azure_region)
+        self.auth_scope = resolve_auth_scope(config.azure_region)
 
         # Set up Unified Catalog endpoint using Purview account ID format
         self.account_id = config.account_id or self._get_purview_account_id()
         self.uc_base_url = f"https://{self.account_id}-api.purview-service.microsoft.com"
         self.uc_auth_scope = "73c2949e-da2d-457a-9607-fcc665198967/.default"
 
-        self._token = None
-        self._uc_token = None
         self._credential = None
+        self._token_cache = get_token_cache()
         
         # Configure session with retry strategy for Azure Front Door SSL issues
         self._session = self._create_session_with_retries()
 
+        # Per-host adaptive concurrency controllers (429/503 + Retry-After driven)
+        self._throttles: Dict[str, AdaptiveConcurrencyController] = {}
+        self._throttle_lock = threading.Lock()
+
+        # Identical concurrent GETs (e.g. fan-out jobs hitting a hot GUID) share one round trip
+        self._inflight = SingleFlight()
+
+    def _throttle_for(self, base_url: str) -> AdaptiveConcurrencyController:
+        """Get the adaptive concurrency controller for a host (Data Map or Unified Catalog)"""
+        controller = self._throttles.get(base_url)
+        if controller is None:
+            with self._throttle_lock:
+                controller = self._throttles.get(base_url)
+                if controller is None:
+                    controller = AdaptiveConcurrencyController({
+                        "initial_limit": int(os.getenv("PURVIEW_ADAPTIVE_INITIAL_CONCURRENCY", "16")),
+                        "max_limit": int(os.getenv("PURVIEW_ADAPTIVE_MAX_CONCURRENCY", "64")),
+                    })
+                    self._throttles[base_url] = controller
+        return controller
+
+    def _send_request(self, method: str, url: str, headers: Dict, base_url: str, kwargs: Dict, files=None):
+        """
+        Send one HTTP request under the host's adaptive concurrency limit.
+
+        429/503 responses shrink the limit, pause all callers for Retry-After
+        (or an exponential backoff) and are retried here; other responses grow it.
+        A 503 may come from a gateway after the write was applied, so it is
+        only retried for idempotent methods; 429 is retried for every method.
+        Multipart uploads are not retried because the file stream is consumed.
+        """
+        controller = self._throttle_for(base_url)
+        max_retries = 0 if files else int(os.getenv("PURVIEW_MAX_THROTTLE_RETRIES", "6"))
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        # Serialize the JSON body once (throttle retries resend the same bytes);
+        # callers may also hand over a payload that is already encoded
+        body = None
+        payload = kwargs.get("json") if not files else None
+        if isinstance(payload, (bytes, bytearray)):
+            body = bytes(payload)
+        elif payload is not None:
+            body = json.dumps(payload, allow_nan=False).encode("utf-8")
+
+        for attempt in range(max_retries + 1):
+            with controller.slot():
+                response = self._session.request(
+                    method=method.upper(),
+                    url=url,
+                    headers=headers,
+                    params=kwargs.get("params"),
+                    data=body,
+                    files=files,
+                    timeout=60,  # Increased timeout for Azure Front Door
+                )
+
+            if response.status_code not in THROTTLE_STATUS_CODES:
+                controller.on_success()
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if attempt >= max_retries or (response.status_code == 503 and not idempotent):
+                controller.on_throttle(retry_after, attempt)
+                return response
+
+            delay = controller.on_throttle(retry_after, attempt)
+            logger.warning(
+                f"Throttled with HTTP {response.status_code} on {method.upper()} {url}; "
+                f"retrying in {delay:.1f}s (concurrency limit now {controller.limit})"
+            )
+        return response
+
     def _create_session_with_retries(self):
         """Create a requests session with retry strategy and SSL workarounds for Azure Front Door"""
         session = requests.Session()
         
-        # Retry strategy for transient errors and SSL issues
+        # Retry strategy for transient errors and SSL issues.
+        # 429/503 are handled by the adaptive throttle in _send_request, and
+        # non-idempotent POSTs are never replayed on server errors.
         retry_strategy = Retry(
             total=5,  # Total number of retries
             backoff_factor=1,  # Wait 1, 2, 4, 8, 16 seconds between retries
-            status_forcelist=[429, 500, 502, 503, 504],  # Retry on these HTTP status codes
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]  # Retry on all methods
+            status_forcelist=[500, 502, 504],  # Retry on these HTTP status codes
+            allowed_methods=sorted(IDEMPOTENT_METHODS),  # Idempotent methods only
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the connection pool for clients shared across worker threads
+        pool_size = int(os.getenv("PURVIEW_HTTP_POOL_SIZE", "32"))
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+        )
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         
@@ -214,6 +318,14 @@ class SyncPurviewClient:
             # For Unified Catalog, tenant ID is commonly used as the account ID.
             tenant_id = os.getenv("AZURE_TENANT_ID")
             account_name = self.config.account_name
+            rg = os.getenv("PURVIEW_RESOURCE_GROUP", "").strip()
+
+            # Reuse a previous discovery for this account before shelling out to az
+            if account_name and account_name != "test-purview-account":
+                cached = get_cached_account(account_name, rg or None)
+                if cached:
+                    logger.debug(f"Using cached Purview account ID for {account_name}")
+                    return cached["account_id"]
 
             import subprocess
 
@@ -236,7 +348,6 @@ class SyncPurviewClient:
                 atlas_url = ""
 
                 # Prefer explicit resource group when provided.
-                rg = os.getenv("PURVIEW_RESOURCE_GROUP", "").strip()
                 if account_name and rg and account_name != "test-purview-account":
                     try:
                         result = _run_az([
@@ -271,6 +382,7 @@ class SyncPurviewClient:
                 
                 if atlas_url and "-api.purview-service.microsoft.com" in atlas_url:
                     account_id = atlas_url.split("://")[1].split("-api.purview-service.microsoft.com")[0]
+                    store_account(account_name, account_id, atlas_url, rg or None)
                 else:
                     raise Exception(f"Could not extract account ID from Atlas URL: {atlas_url or 'empty'}")
             except Exception as e:
@@ -285,8 +397,27 @@ class SyncPurviewClient:
                     )
         return account_id
 
-    def _get_authentication_token(self, for_unified_catalog=False):
-        """Get Azure authentication token for regular Purview or Unified Catalog APIs"""
+    def _identity_key(self, for_unified_catalog=False) -> str:
+        """Key identifying the token scope and principal used for a request"""
+        auth_scope = self.uc_auth_scope if for_unified_catalog else self.auth_scope
+        return identity_cache_key(auth_scope)[0]
+
+    def _get_authentication_token(self, for_unified_catalog=False, force_refresh=False):
+        """Get a cached (or freshly acquired) token for regular Purview or Unified Catalog APIs"""
+        auth_scope = self.uc_auth_scope if for_unified_catalog else self.auth_scope
+        cache_key, persist_if = identity_cache_key(auth_scope)
+
+        if force_refresh:
+            self._token_cache.invalidate(cache_key)
+            self._credential = None  # Force re-authentication
+
+        access_token = self._token_cache.get_or_fetch(
+            cache_key, lambda: self._acquire_access_token(for_unified_catalog), persist_if
+        )
+        return access_token.token
+
+    def _acquire_access_token(self, for_unified_catalog=False) -> AccessToken:
+        """Acquire a new Azure access token through the credential chain"""
         api_type = "Unified Catalog" if for_unified_catalog else "Purview"
         auth_scope = self.uc_auth_scope if for_unified_catalog else self.auth_scope
         
@@ -306,7 +437,7 @@ class SyncPurviewClient:
                     )
                     token = self._credential.get_token(auth_scope)
                     logger.info(f"Successfully authenticated using service principal for {api_type} API")
-                    return token.token
+                    return token
                 except ClientAuthenticationError as e:
                     error_msg = str(e)
                     if "not found in the tenant" in error_msg or "AADSTS500011" in error_msg:
@@ -327,7 +458,7 @@ class SyncPurviewClient:
                 self._credential = AzureCliCredentialFixed()
                 token = self._credential.get_token(auth_scope)
                 logger.info(f"Successfully authenticated using Azure CLI for {api_type} API")
-                return token.token
+                return token
             except InvalidServicePrincipalError as e:
                 logger.error(f"Service principal not registered: {e}")
                 raise
@@ -342,7 +473,7 @@ class SyncPurviewClient:
                 self._credential = DefaultAzureCredential()
                 token = self._credential.get_token(auth_scope)
                 logger.info(f"Successfully authenticated using system credentials for {api_type} API")
-                return token.token
+                return token
             except ClientAuthenticationError as e:
                 error_msg = str(e)
                 if "not found in the tenant" in error_msg or "AADSTS500011" in error_msg:
@@ -377,7 +508,19 @@ class SyncPurviewClient:
             )
 
     def make_request(self, method: str, endpoint: str, **kwargs) -> Dict:
-        """Make actual HTTP request to Microsoft Purview"""
+        """
+        Make actual HTTP request to Microsoft Purview.
+
+        Identical concurrent GET/HEAD requests (same endpoint, params and
+        headers, no body) are coalesced: only the first goes to the wire and
+        the others receive a copy of its response.
+        """
+        key = None
+        if coalescing_enabled() and not kwargs.get("files") and kwargs.get("json") is None:
+            key = request_key(method, endpoint, kwargs.get("params"), kwargs.get("headers"))
+        return self._inflight.do(key, lambda: self._make_request(method, endpoint, **kwargs))
+
+    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict:
         try:
             # Determine if this is a Unified Catalog / Data Map (Atlas) request
             is_unified_catalog = (
@@ -387,17 +530,10 @@ class SyncPurviewClient:
                 or endpoint.startswith('/datamap')
             )
             
-            # Get the appropriate authentication token and base URL
-            if is_unified_catalog:
-                if not self._uc_token:
-                    self._uc_token = self._get_authentication_token(for_unified_catalog=True)
-                token = self._uc_token
-                base_url = self.uc_base_url
-            else:
-                if not self._token:
-                    self._token = self._get_authentication_token(for_unified_catalog=False)
-                token = self._token
-                base_url = self.base_url
+            # Get the appropriate authentication token and base URL.
+            # The token cache refreshes proactively shortly before expiry.
+            token = self._get_authentication_token(for_unified_catalog=is_unified_catalog)
+            base_url = self.uc_base_url if is_unified_catalog else self.base_url
             
             # Verify we got a token
             if not token:
@@ -430,17 +566,31 @@ class SyncPurviewClient:
             logger.debug(f"Using {'Unified Catalog' if is_unified_catalog else 'Purview'} API")
             logger.debug(f"Token (first 20 chars): {token[:20]}...")
             
-            # Make the actual HTTP request using session with retries
-            response = self._session.request(
-                method=method.upper(),
-                url=url,
-                headers=headers,
-                params=kwargs.get("params"),
-                json=kwargs.get("json") if not files else None,
-                files=files,
-                timeout=60,  # Increased timeout for Azure Front Door
-            )
+            # Large, slow-changing reads may be served from the persistent
+            # response cache, revalidating with If-None-Match when we hold an ETag
+            http_cache = get_http_cache()
+            cache_key = None
+            cached = None
+            if not files and http_cache.is_cacheable(method, endpoint):
+                cache_key = http_cache_key(
+                    self._identity_key(is_unified_catalog), url, kwargs.get("params")
+                )
+                cached = http_cache.lookup(cache_key)
+                if cached is not None:
+                    if not cached.etag:
+                        logger.debug(f"Serving {url} from HTTP cache")
+                        return {"status": "success", "data": cached.data, "status_code": 200}
+                    headers["If-None-Match"] = cached.etag
+
+            # Make the actual HTTP request through the adaptive throttle
+            response = self._send_request(method, url, headers, base_url, kwargs, files)
+            http_cache.invalidate_for_write(method, endpoint)
+
             # Handle the response
+            if response.status_code == 304 and cached is not None:
+                logger.debug(f"HTTP cache entry for {url} revalidated")
+                http_cache.touch(cache_key)
+                return {"status": "success", "data": cached.data, "status_code": 200}
             if 200 <= response.status_code < 300:
                 if not response.content or not response.content.strip():
                     logger.debug(f"Response received: {response.status_code} (empty body)")
@@ -452,6 +602,8 @@ class SyncPurviewClient:
                 try:
                     data = response.json()
                     logger.debug(f"Response received: {response.status_code}")
+                    if cache_key:
+                        http_cache.store(cache_key, endpoint, data, response.headers.get("ETag"))
                     return {"status": "success", "data": data, "status_code": response.status_code}
                 except json.JSONDecodeError:
                     return {
@@ -464,33 +616,19 @@ class SyncPurviewClient:
                 logger.warning(f"Received 401 Unauthorized: {response.text}")
                 logger.debug(f"Attempting to refresh token for {'Unified Catalog' if is_unified_catalog else 'Purview'} API")
                 try:
-                    if is_unified_catalog:
-                        self._uc_token = None
-                        self._credential = None  # Force re-authentication
-                        self._uc_token = self._get_authentication_token(for_unified_catalog=True)
-                        token = self._uc_token
-                        logger.debug("Unified Catalog token refreshed")
-                    else:
-                        self._token = None
-                        self._credential = None  # Force re-authentication
-                        self._token = self._get_authentication_token(for_unified_catalog=False)
-                        token = self._token
-                        logger.debug("Purview token refreshed")
+                    token = self._get_authentication_token(
+                        for_unified_catalog=is_unified_catalog, force_refresh=True
+                    )
+                    logger.debug(
+                        f"{'Unified Catalog' if is_unified_catalog else 'Purview'} token refreshed"
+                    )
                         
                     headers["Authorization"] = f"Bearer {token}"
                     logger.debug(f"New token (first 20 chars): {token[:20] if token else 'None'}...")
 
                     # Retry the request with session
                     logger.debug(f"Retrying request to {url} with refreshed token")
-                    response = self._session.request(
-                        method=method.upper(),
-                        url=url,
-                        headers=headers,
-                        params=kwargs.get("params"),
-                        json=kwargs.get("json") if not files else None,
-                        files=files,
-                        timeout=60,
-                    )
+                    response = self._send_request(method, url, headers, base_url, kwargs, files)
 
                     if 200 <= response.status_code < 300:
                         logger.info(f"Request succeeded after token refresh: {response.status_code}")
@@ -0,0 +1,354 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Access Token Caching System
+Expiry-aware cache for Data Map and Unified Catalog access tokens.
+Tokens are refreshed shortly before they expire and persisted to an encrypted
+file in the CLI config directory so consecutive pvw invocations can skip the
+credential chain (az CLI subprocess, service principal round trip) entirely.
+"""
+
+import base64
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from azure.core.credentials import AccessToken
+from cryptography.fernet import Fernet, InvalidToken
+
+from .config import get_config_dir
+
+logger = logging.getLogger(__name__)
+
+# Refresh tokens this many seconds before they expire
+DEFAULT_REFRESH_MARGIN_SECONDS = 300
+
+TOKEN_CACHE_FILE = "token_cache.bin"
+TOKEN_CACHE_KEY_FILE = "token_cache.key"
+
+
+def token_cache_key(
+    scope: str,
+    tenant_id: Optional[str] = None,
+    client_id: Optional[str] = None,
+    principal: Optional[str] = None,
+) -> str:
+    """
+    Build the cache key for a token.
+
+    Tokens are scoped by resource scope (Data Map vs Unified Catalog), tenant,
+    client and signed-in principal so a service principal never reuses an
+    Azure CLI user token, and a new az login never reuses the previous user's.
+    """
+    return f"{scope}|{tenant_id or ''}|{client_id or ''}|{principal or ''}"
+
+
+_cli_account_cache: Dict[Tuple[str, int], Optional[Tuple[str, str]]] = {}
+
+
+def active_cli_account() -> Optional[Tuple[str, str]]:
+    """
+    Return (tenant_id, user name) of the active az CLI account, or None.
+
+    Read from azureProfile.json (honouring AZURE_CONFIG_DIR) rather than by
+    running 'az account show', and re-read whenever the file changes.
+    """
+    config_dir = os.getenv("AZURE_CONFIG_DIR") or os.path.join(os.path.expanduser("~"), ".azure")
+    profile = os.path.join(config_dir, "azureProfile.json")
+    try:
+        cache_key = (profile, os.stat(profile).st_mtime_ns)
+    except OSError:
+        return None
+    if cache_key not in _cli_account_cache:
+        account = None
+        try:
+            with open(profile, encoding="utf-8-sig") as f:
+                subscriptions = json.load(f).get("subscriptions", [])
+            for subscription in subscriptions:
+                if subscription.get("isDefault"):
+                    user = (subscription.get("user") or {}).get("name")
+                    if subscription.get("tenantId") and user:
+                        account = (subscription["tenantId"], user)
+                    break
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug(f"Could not read the az CLI profile: {e}")
+        _cli_account_cache.clear()
+        _cli_account_cache[cache_key] = account
+    return _cli_account_cache[cache_key]
+
+
+def token_claims(token: str) -> Dict:
+    """Decode the (unverified) claims of a JWT access token; {} if it is not a JWT"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return claims if isinstance(claims, dict) else {}
+    except (IndexError, ValueError):
+        return {}
+
+
+def token_issued_to(token: AccessToken, tenant_id: str, principal: str) -> bool:
+    """Whether token was issued in tenant_id to the user or application named principal"""
+    claims = token_claims(token.token)
+    names = {
+        str(claims[claim]).lower()
+        for claim in ("upn", "unique_name", "preferred_username", "email", "appid", "azp", "oid")
+        if claims.get(claim)
+    }
+    return claims.get("tid") == tenant_id and principal.lower() in names
+
+
+def identity_cache_key(scope: str) -> Tuple[str, Callable[[AccessToken], bool]]:
+    """
+    Cache key for tokens from the ambient credential chain, and a check
+    deciding whether an acquired token may be persisted to disk.
+
+    Service principal credentials (AZURE_CLIENT_ID/AZURE_CLIENT_SECRET) are
+    keyed by tenant and client. Otherwise tokens come from az CLI or other
+    user credentials, so the active az CLI account is part of the key, and a
+    token is persisted only if its tid and user claims match that account.
+    Without an az CLI account tokens are cached in memory only.
+    """
+    tenant_id = os.getenv("AZURE_TENANT_ID")
+    client_id = os.getenv("AZURE_CLIENT_ID")
+    if client_id and os.getenv("AZURE_CLIENT_SECRET"):
+        key = token_cache_key(scope, tenant_id, client_id)
+        return key, lambda token: token_issued_to(token, tenant_id or token_claims(token.token).get("tid"), client_id)
+
+    account = active_cli_account()
+    if account is None:
+        return token_cache_key(scope, tenant_id), lambda token: False
+    account_tenant, user = account
+    key = token_cache_key(scope, tenant_id, principal=f"{account_tenant}/{user}")
+    return key, lambda token: token_issued_to(token, account_tenant, user)
+
+
+def _persistence_enabled() -> bool:
+    return os.getenv("PURVIEW_DISABLE_TOKEN_CACHE", "false").lower() != "true"
+
+
+class TokenCache:
+    """
+    Thread-safe access token cache with proactive refresh and optional
+    encrypted on-disk persistence.
+
+    The encryption key lives next to the cache file with owner-only
+    permissions; the cache file is never readable without it.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        refresh_margin_seconds: int = DEFAULT_REFRESH_MARGIN_SECONDS,
+        persist: Optional[bool] = None,
+    ):
+        """
+        Initialize the token cache.
+
+        Args:
+            cache_dir: Directory for the encrypted cache file (None = CLI config dir)
+            refresh_margin_seconds: Treat tokens as expired this long before expiry
+            persist: Persist tokens to disk (None = honor PURVIEW_DISABLE_TOKEN_CACHE)
+        """
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.persist = _persistence_enabled() if persist is None else persist
+        self._tokens: Dict[str, AccessToken] = {}
+        self._lock = Lock()
+        self._key_locks: Dict[str, Lock] = {}
+        # Keys whose tokens are never written to disk
+        self._memory_only: Set[str] = set()
+        self._loaded = False
+        self._hits = 0
+        self._misses = 0
+
+    # === PERSISTENCE ===
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir or get_config_dir()
+
+    def _fernet(self) -> Fernet:
+        key_file = self.cache_dir / TOKEN_CACHE_KEY_FILE
+        if not key_file.exists():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write the key to an owner-only temp file, then link it into place:
+            # the link fails if another process created the key first, in which
+            # case its key is used and ours is discarded
+            tmp_file = key_file.with_name(f"{key_file.name}.{os.getpid()}.tmp")
+            fd = os.open(str(tmp_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(Fernet.generate_key())
+            try:
+                os.link(tmp_file, key_file)
+            except FileExistsError:
+                pass
+            finally:
+                os.unlink(tmp_file)
+        return Fernet(key_file.read_bytes().strip())
+
+    def _read_disk(self) -> Dict[str, AccessToken]:
+        cache_file = self.cache_dir / TOKEN_CACHE_FILE
+        if not cache_file.exists():
+            return {}
+        try:
+            raw = self._fernet().decrypt(cache_file.read_bytes())
+            entries = json.loads(raw.decode("utf-8"))
+            return {
+                key: AccessToken(token=value["token"], expires_on=int(value["expires_on"]))
+                for key, value in entries.items()
+            }
+        except (InvalidToken, ValueError, KeyError, OSError) as e:
+            logger.debug(f"Discarding unreadable token cache file: {e}")
+            return {}
+
+    def _write_disk(self) -> None:
+        now = time.time()
+        entries = {
+            key: {"token": token.token, "expires_on": token.expires_on}
+            for key, token in self._tokens.items()
+            if token.expires_on > now and key not in self._memory_only
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = self._fernet().encrypt(json.dumps(entries).encode("utf-8"))
+            cache_file = self.cache_dir / TOKEN_CACHE_FILE
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            fd = os.open(str(tmp_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not persist token cache: {e}")
+
+    def _ensure_loaded(self) -> None:
+        # Caller holds self._lock
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.persist:
+            for key, token in self._read_disk().items():
+                self._tokens.setdefault(key, token)
+
+    # === CACHE OPERATIONS ===
+
+    def _is_fresh(self, token: AccessToken) -> bool:
+        return token.expires_on - self.refresh_margin_seconds > time.time()
+
+    def get(self, key: str) -> Optional[AccessToken]:
+        """Return a cached token that is not within the refresh margin of expiry"""
+        with self._lock:
+            self._ensure_loaded()
+            token = self._tokens.get(key)
+            if token is not None and self._is_fresh(token):
+                self._hits += 1
+                return token
+            self._misses += 1
+            return None
+
+    def put(self, key: str, token: AccessToken, persist: bool = True) -> None:
+        """
+        Store a token and persist the cache when enabled.
+
+        With persist=False the token is kept in memory for this process only
+        (and any copy of the key on disk is dropped).
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if persist:
+                self._memory_only.discard(key)
+            else:
+                self._memory_only.add(key)
+            if self.persist:
+                # Merge tokens written by other pvw processes since we loaded
+                for disk_key, disk_token in self._read_disk().items():
+                    if disk_key in self._memory_only:
+                        continue
+                    current = self._tokens.get(disk_key)
+                    if current is None or disk_token.expires_on > current.expires_on:
+                        self._tokens[disk_key] = disk_token
+            self._tokens[key] = token
+            if self.persist:
+                self._write_disk()
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch_fn: Callable[[], AccessToken],
+        persist_if: Optional[Callable[[AccessToken], bool]] = None,
+    ) -> AccessToken:
+        """
+        Return a fresh cached token or acquire one with fetch_fn.
+
+        Concurrent callers for the same key wait for a single acquisition.
+        persist_if decides whether an acquired token may be written to disk.
+        """
+        token = self.get(key)
+        if token is not None:
+            return token
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, Lock())
+
+        with key_lock:
+            token = self.get(key)
+            if token is not None:
+                return token
+            token = fetch_fn()
+            self.put(key, token, persist=persist_if is None or persist_if(token))
+            return token
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop cached tokens (e.g. after a 401).
+
+        Args:
+            key: Specific token key to drop (None = drop all tokens)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if key is None:
+                self._tokens.clear()
+            else:
+                self._tokens.pop(key, None)
+            if self.persist:
+                self._write_disk()
+
+    def clear(self) -> None:
+        """Clear all tokens and remove the persisted cache file"""
+        with self._lock:
+            self._tokens.clear()
+            self._memory_only.clear()
+            self._loaded = True
+            self._hits = 0
+            self._misses = 0
+            try:
+                (self.cache_dir / TOKEN_CACHE_FILE).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"Could not remove token cache file: {e}")
+
+    def stats(self) -> Dict[str, object]:
+        """Get cache statistics for diagnostics"""
+        with self._lock:
+            return {
+                "cached_tokens": len(self._tokens),
+                "fresh_tokens": sum(1 for t in self._tokens.values() if self._is_fresh(t)),
+                "hits": self._hits,
+                "misses": self._misses,
+                "persistent": self.persist,
+            }
+
+
+# Global token cache instance
+_global_token_cache = TokenCache()
+
+
+def get_token_cache() -> TokenCache:
+    """Get the global access token cache instance"""
+    return _global_token_cache
@@ -9,10 +9,7 @@ Supported entity types (all handled transparently via the type handler registry)
 
 import argparse
 import csv
-import json
-import os
 import sys
-import tempfile
 import time
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
@@ -40,21 +37,6 @@ def _load_guids(path: str) -> List[str]:
         return [line.strip() for line in handle if line.strip()]
 
 
-def _write_payload(payload: Dict[str, Any]) -> str:
-    temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-    try:
-        json.dump(payload, temp_file, indent=2)
-        temp_file.flush()
-    finally:
-        temp_file.close()
-    return temp_file.name
-
-
-def _cleanup_temp(path: Optional[str]) -> None:
-    if path and os.path.exists(path):
-        os.remove(path)
-
-
 def _extract_entity_object(result: Dict[str, Any]) -> Dict[str, Any]:
     if "entity" in result and isinstance(result["entity"], dict):
         return result["entity"]
@@ -189,11 +171,7 @@ def _copy_classifications(entity_client: Entity, source_guid: str, target_guid:
         print(f"DRY RUN: Would add {len(classifications)} classifications to {target_guid}")
         return
 
-    payload_file = _write_payload(payload)
-    try:
-        entity_client.entityCreateClassifications({"--guid": [target_guid], "--payloadFile": payload_file})
-    finally:
-        _cleanup_temp(payload_file)
+    entity_client.entityCreateClassifications({"--guid": [target_guid], "--payloadFile": payload})
 
 
 def _copy_labels(entity_obj: Dict[str, Any], entity_client: Entity, target_guid: str, dry_run: bool) -> None:
@@ -206,11 +184,7 @@ def _copy_labels(entity_obj: Dict[str, Any], entity_client: Entity, target_guid:
         print(f"DRY RUN: Would set {len(labels)} labels to {target_guid}")
         return
 
-    payload_file = _write_payload(payload)
-    try:
-        entity_client.entityCreateLabels({"--guid": [target_guid], "--payloadFile": payload_file})
-    finally:
-        _cleanup_temp(payload_file)
+    entity_client.entityCreateLabels({"--guid": [target_guid], "--payloadFile": payload})
 
 
 def _copy_business_metadata(entity_obj: Dict[str, Any], entity_client: Entity, target_guid: str, dry_run: bool) -> None:
@@ -223,15 +197,11 @@ def _copy_business_metadata(entity_obj: Dict[str, Any], entity_client: Entity, t
         print(f"DRY RUN: Would add business metadata to {target_guid}")
         return
 
-    payload_file = _write_payload(payload)
-    try:
-        entity_client.entityAddOrUpdateBusinessMetadata({
-            "--guid": [target_guid],
-            "--payloadFile": payload_file,
-            "--isOverwrite": True,
-        })
-    finally:
-        _cleanup_temp(payload_file)
+    entity_client.entityAddOrUpdateBusinessMetadata({
+        "--guid": [target_guid],
+        "--payloadFile": payload,
+        "--isOverwrite": True,
+    })
 
 
 def _extract_relationships(result: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -286,11 +256,7 @@ def _clone_entity(
         print(f"DRY RUN: Would create new entity for {source_guid}")
         new_guid = f"dry-run-{source_guid}"
     else:
-        payload_file = _write_payload(payload)
-        try:
-            create_result = entity_client.entityCreate({"--payloadFile": payload_file})
-        finally:
-            _cleanup_temp(payload_file)
+        create_result = entity_client.entityCreate({"--payloadFile": payload})
         new_guid = _extract_created_guid(create_result)
 
     if not new_guid:
@@ -418,11 +384,9 @@ def _copy_relationships(
             if dry_run:
                 print(f"DRY RUN: Would create {len(payload_relationships)} relationships for {target_guid}")
             else:
-                payload_file = _write_payload({"relationships": payload_relationships})
-                try:
-                    relationship_client.relationshipCreateBulk({"--payloadFile": payload_file})
-                finally:
-                    _cleanup_temp(payload_file)
+                relationship_client.relationshipCreateBulk(
+                    {"--payloadFile": {"relationships": payload_relationships}}
+                )
 
         if len(relationships) < limit:
             break
@@ -438,14 +402,10 @@ def _move_to_collection(entity_client: Entity, target_guid: str, collection_id:
         print(f"DRY RUN: Would move {target_guid} to collection {collection_id}")
         return
 
-    payload_file = _write_payload(payload)
-    try:
-        entity_client.entityMoveToCollection({
-            "--collectionId": collection_id,
-            "--payloadFile": payload_file
-        })
-    finally:
-        _cleanup_temp(payload_file)
+    entity_client.entityMoveToCollection({
+        "--collectionId": collection_id,
+        "--payloadFile": payload
+    })
 
 
 def copy_entities(args: argparse.Namespace) -> int:
@@ -0,0 +1,26 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Shared fixtures for the unit tests."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+from unittest.mock import patch
+
+import pytest
+from azure.core.credentials import AccessToken
+
+from purviewcli.client.sync_client import SyncPurviewClient, SyncPurviewConfig
+
+
+@pytest.fixture
+def sync_client(monkeypatch, tmp_path):
+    """SyncPurviewClient for account 'aid' with an isolated config dir and a fixed token."""
+    monkeypatch.setenv("PURVIEW_CONFIG_DIR", str(tmp_path))
+    monkeypatch.setenv("PURVIEW_DISABLE_TOKEN_CACHE", "true")
+    client = SyncPurviewClient(SyncPurviewConfig("acct", account_id="aid"))
+    client._token_cache.clear()
+    token = AccessToken("tok", int(time.time()) + 3600)
+    with patch.object(client, "_acquire_access_token", return_value=token):
+        yield client
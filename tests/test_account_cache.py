@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for persisted Purview account ID discovery."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+from unittest.mock import MagicMock, patch
+
+from purviewcli.client import account_cache
+from purviewcli.client.sync_client import SyncPurviewClient, SyncPurviewConfig
+
+CATALOG_URL = "https://abc123-api.purview-service.microsoft.com"
+
+
+def _discover(monkeypatch, tmp_path, run_mock):
+    monkeypatch.setenv("PURVIEW_CONFIG_DIR", str(tmp_path))
+    monkeypatch.setenv("PURVIEW_RESOURCE_GROUP", "rg-data")
+    monkeypatch.delenv("PURVIEW_ACCOUNT_ID", raising=False)
+    with patch("subprocess.run", run_mock):
+        return SyncPurviewClient(SyncPurviewConfig("contoso"))
+
+
+def test_discovered_account_id_is_reused(monkeypatch, tmp_path):
+    run_mock = MagicMock(return_value=MagicMock(stdout=CATALOG_URL + "\n"))
+
+    first = _discover(monkeypatch, tmp_path, run_mock)
+    second = _discover(monkeypatch, tmp_path, run_mock)
+
+    assert first.uc_base_url == second.uc_base_url == CATALOG_URL
+    assert run_mock.call_count == 1
+    cached = account_cache.get_cached_account("contoso", "rg-data", cache_dir=tmp_path)
+    assert cached["catalog_endpoint"] == CATALOG_URL
+
+
+def test_cache_is_scoped_by_resource_group(tmp_path):
+    account_cache.store_account("contoso", "abc123", CATALOG_URL, "rg-data", cache_dir=tmp_path)
+
+    assert account_cache.get_cached_account("contoso", "rg-data", cache_dir=tmp_path)
+    assert account_cache.get_cached_account("contoso", "rg-other", cache_dir=tmp_path) is None
+
+
+def test_expired_entries_are_ignored(monkeypatch, tmp_path):
+    account_cache.store_account("contoso", "abc123", CATALOG_URL, None, cache_dir=tmp_path)
+    monkeypatch.setenv("PURVIEW_ACCOUNT_CACHE_TTL", "60")
+    with patch.object(account_cache.time, "time", return_value=time.time() + 120):
+        assert account_cache.get_cached_account("contoso", None, cache_dir=tmp_path) is None
@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for the AIMD concurrency controller and its use in SyncPurviewClient."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+import requests_mock
+
+from purviewcli.client.rate_limiter import AdaptiveConcurrencyController, parse_retry_after
+
+
+def test_parse_retry_after_seconds_and_invalid():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_throttle_halves_limit_and_success_ramps_additively():
+    controller = AdaptiveConcurrencyController({"initial_limit": 16, "max_limit": 32})
+
+    delay = controller.on_throttle(retry_after=0)
+    assert delay == 0
+    assert controller.limit == 8
+
+    for _ in range(9):
+        controller.on_success()
+    assert controller.limit == 9
+
+
+def test_retry_after_pauses_new_requests():
+    controller = AdaptiveConcurrencyController({"initial_limit": 4})
+    controller.on_throttle(retry_after=0.2)
+
+    started = time.monotonic()
+    with controller.slot():
+        waited = time.monotonic() - started
+    assert waited >= 0.15
+
+
+def test_client_retries_429_honoring_retry_after(sync_client):
+    client = sync_client
+
+    with requests_mock.Mocker() as m:
+        m.post(
+            "https://aid-api.purview-service.microsoft.com/datamap/api/atlas/v2/entity/bulk",
+            [
+                {"status_code": 429, "headers": {"Retry-After": "0"}, "json": {}},
+                {"status_code": 200, "json": {"mutatedEntities": {}}},
+            ],
+        )
+        result = client.make_request("POST", "/datamap/api/atlas/v2/entity/bulk", json={"entities": []})
+
+    assert result["status"] == "success"
+    assert m.call_count == 2
+    stats = client._throttle_for(client.uc_base_url).stats()
+    assert stats["throttled"] == 1 and stats["succeeded"] == 1
+
+
+def test_client_does_not_replay_post_after_503(sync_client):
+    client = sync_client
+    base = "https://aid-api.purview-service.microsoft.com/datamap/api/atlas/v2/entity"
+    responses = [
+        {"status_code": 503, "headers": {"Retry-After": "0"}, "json": {}},
+        {"status_code": 200, "json": {"guid": "g1"}},
+    ]
+
+    with requests_mock.Mocker() as m:
+        m.post(f"{base}/bulk", responses)
+        m.get(f"{base}/guid/g1", responses)
+        write = client.make_request("POST", "/datamap/api/atlas/v2/entity/bulk", json={"entities": []})
+        read = client.make_request("GET", "/datamap/api/atlas/v2/entity/guid/g1")
+
+    assert write["status"] == "error"
+    assert read["status"] == "success"
+    assert [r.method for r in m.request_history] == ["POST", "GET", "GET"]
+    assert client._throttle_for(client.uc_base_url).stats()["throttled"] == 2
@@ -0,0 +1,263 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for retries, token refresh and concurrent batches in the async PurviewClient."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+from azure.core.credentials import AccessToken
+
+from purviewcli.client.api_client import DATAMAP_API_VERSION, PurviewClient, PurviewConfig
+from purviewcli.client.token_cache import TokenCache
+
+
+class FakeResponse:
+    def __init__(self, status, body=None, headers=None):
+        self.status = status
+        self._body = body if body is not None else {}
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(MagicMock(), (), status=self.status)
+
+    async def json(self, content_type=None):
+        return self._body
+
+
+class FakeSession:
+    """Returns scripted responses, or calls responder(method, url, kwargs) when given."""
+
+    def __init__(self, responses=None, responder=None):
+        self.responses = list(responses or [])
+        self.responder = responder
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        if self.responder:
+            return self.responder(method, url, kwargs)
+        return self.responses.pop(0)
+
+
+class FakeCredential:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_token(self, scope):
+        self.calls += 1
+        return AccessToken(f"token-{self.calls}", int(time.time()) + 3600)
+
+
+def _client(session, **config):
+    client = PurviewClient(PurviewConfig(account_name="acct", retry_backoff_seconds=0, **config))
+    client._session = session
+    client._credential = FakeCredential()
+    client._token_cache = TokenCache(persist=False)
+    return client
+
+
+def test_retries_throttled_request_after_retry_after():
+    session = FakeSession(
+        [FakeResponse(429, headers={"Retry-After": "2"}), FakeResponse(503), FakeResponse(200, {"ok": True})]
+    )
+    client = _client(session)
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    with patch("purviewcli.client.api_client.asyncio.sleep", fake_sleep):
+        result = asyncio.run(client._make_request("GET", "/entity/guid/g1"))
+
+    assert result == {"ok": True}
+    assert len(session.calls) == 3
+    assert sleeps[0] == 2.0
+    assert client._paused_until > 0
+
+
+def test_gives_up_after_max_retries():
+    session = FakeSession([FakeResponse(500) for _ in range(3)])
+    client = _client(session, max_retries=2)
+
+    try:
+        asyncio.run(client._make_request("GET", "/entity/guid/g1"))
+    except aiohttp.ClientResponseError as e:
+        assert e.status == 500
+    else:
+        raise AssertionError("expected ClientResponseError")
+    assert len(session.calls) == 3
+
+
+def test_post_is_not_resent_after_server_error_or_timeout():
+    def timeout(method, url, kwargs):
+        raise asyncio.TimeoutError()
+
+    for session, expected in (
+        (FakeSession([FakeResponse(500), FakeResponse(200)]), aiohttp.ClientResponseError),
+        (FakeSession([FakeResponse(503), FakeResponse(200)]), aiohttp.ClientResponseError),
+        (FakeSession(responder=timeout), asyncio.TimeoutError),
+    ):
+        client = _client(session)
+        try:
+            asyncio.run(client._make_request("POST", "/entity/bulk", json={"entities": []}))
+        except expected:
+            pass
+        else:
+            raise AssertionError(f"expected {expected.__name__}")
+        assert len(session.calls) == 1
+
+
+def test_post_is_retried_when_throttled():
+    session = FakeSession([FakeResponse(429), FakeResponse(200, {"ok": True})])
+    client = _client(session)
+
+    assert asyncio.run(client._make_request("POST", "/entity/bulk", json={"entities": []})) == {"ok": True}
+    assert len(session.calls) == 2
+
+
+def test_unauthorized_refreshes_token_once():
+    session = FakeSession([FakeResponse(401), FakeResponse(200, {"guid": "g1"})])
+    client = _client(session)
+
+    assert asyncio.run(client._make_request("GET", "/entity/guid/g1")) == {"guid": "g1"}
+    auth = [kwargs["headers"]["Authorization"] for _, _, kwargs in session.calls]
+    assert auth == ["Bearer token-1", "Bearer token-2"]
+
+
+def test_batch_create_runs_batches_concurrently_in_order():
+    in_flight = 0
+    peak = 0
+
+    async def slow_json(batch):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if batch[0]["guid"] == "-3":
+            raise aiohttp.ClientResponseError(MagicMock(), (), status=400)
+        return {"mutatedEntities": {"CREATE": [{"guid": e["guid"]} for e in batch]}}
+
+    class SlowResponse(FakeResponse):
+        def __init__(self, batch):
+            super().__init__(200)
+            self.batch = batch
+
+        async def __aenter__(self):
+            self._body = await slow_json(self.batch)
+            return self
+
+    session = FakeSession(responder=lambda method, url, kwargs: SlowResponse(kwargs["json"]["entities"]))
+    client = _client(session, batch_size=1, max_concurrency=2)
+    entities = [{"guid": f"-{i}"} for i in range(1, 6)]
+    progress = []
+
+    created = asyncio.run(client.batch_create_entities(entities, lambda done, total: progress.append(done)))
+
+    assert [e["guid"] for e in created] == ["-1", "-2", "-4", "-5"]
+    assert peak == 2
+    assert progress == sorted(progress) and progress[-1] == 4
+
+
+def test_unified_catalog_requests_use_uc_host_and_scope():
+    session = FakeSession([FakeResponse(200, {"value": [{"id": "d1"}]}), FakeResponse(200, {"id": "p1"})])
+    client = _client(session, account_id="acct-id")
+    scopes = []
+    original = client._credential.get_token
+
+    async def record_scope(scope):
+        scopes.append(scope)
+        return await original(scope)
+
+    client._credential.get_token = record_scope
+
+    async def run():
+        domains = await client.list_domains()
+        product = await client.create_data_product_relationship("p1", "dataasset", {"entityId": "a1"})
+        return domains, product
+
+    domains, product = asyncio.run(run())
+
+    assert domains == [{"id": "d1"}]
+    assert product == {"id": "p1"}
+    (_, list_url, _), (_, rel_url, rel_kwargs) = session.calls
+    assert list_url == "https://acct-id-api.purview-service.microsoft.com/datagovernance/catalog/businessdomains"
+    assert rel_url.endswith("/datagovernance/catalog/dataproducts/p1/relationships")
+    assert rel_kwargs["params"] == {"entityType": "DATAASSET"}
+    # One token for the UC audience, reused across requests
+    assert scopes == ["73c2949e-da2d-457a-9607-fcc665198967/.default"]
+
+
+def test_gather_bounded_limits_concurrency_and_returns_errors():
+    client = _client(FakeSession(), max_concurrency=2)
+    in_flight = 0
+    peak = 0
+
+    async def job(i):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if i == 2:
+            raise ValueError("boom")
+        return i
+
+    results = asyncio.run(client.gather_bounded(job(i) for i in range(5)))
+
+    assert results[:2] == [0, 1] and isinstance(results[2], ValueError) and results[3:] == [3, 4]
+    assert peak == 2
+
+
+def test_unified_catalog_creates_are_sent_once_on_gateway_errors():
+    def respond(method, url, kwargs):
+        if kwargs["json"]["name"] == "slow":
+            raise asyncio.TimeoutError()
+        return FakeResponse(502)
+
+    session = FakeSession(responder=respond)
+    client = _client(session, account_id="acct-id")
+    creates = [
+        client.create_domain({"name": "d"}),
+        client.create_data_product({"name": "p"}),
+        client.create_term({"name": "t"}),
+        client.create_cde({"name": "c"}),
+        client.create_objective({"name": "o"}),
+        client.create_data_asset({"name": "a"}),
+        client.create_term({"name": "slow"}),
+    ]
+
+    results = asyncio.run(client.gather_bounded(creates))
+
+    assert all(isinstance(r, (aiohttp.ClientResponseError, asyncio.TimeoutError)) for r in results)
+    assert len(session.calls) == len(creates)
+
+
+def test_get_entities_by_guids_reads_in_chunks():
+    session = FakeSession(
+        responder=lambda method, url, kwargs: FakeResponse(
+            200, {"entities": [{"guid": value} for key, value in kwargs["params"] if key == "guid"]}
+        )
+    )
+    client = _client(session)
+
+    entities = asyncio.run(client.get_entities_by_guids(["g1", "g2", "g3"], chunk_size=2, minExtInfo="true"))
+
+    assert [e["guid"] for e in entities] == ["g1", "g2", "g3"]
+    assert [kwargs["params"] for _, _, kwargs in session.calls] == [
+        [("guid", "g1"), ("guid", "g2"), ("minExtInfo", "true"), ("api-version", DATAMAP_API_VERSION)],
+        [("guid", "g3"), ("minExtInfo", "true"), ("api-version", DATAMAP_API_VERSION)],
+    ]
+    assert session.calls[0][1].endswith("/datamap/api/atlas/v2/entity/bulk")
@@ -0,0 +1,209 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the bulk job journal and --journal/--resume on bulk commands."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from purviewcli.cli.cli import main
+from purviewcli.client.bulk_journal import (
+    BulkJournal,
+    csv_job_params,
+    extract_guids,
+    open_journal,
+    row_range_key,
+)
+
+
+def _events(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_journal_resume_skips_done_and_optionally_failed(tmp_path):
+    path = tmp_path / "job.jsonl"
+    with BulkJournal(path, "cmd", {"batch_size": 2}) as journal:
+        journal.start("rows:0-2")
+        journal.complete("rows:0-2", ["g1"])
+        journal.fail("rows:2-4", "HTTP 500")
+        journal.start("rows:4-6")
+
+    resumed = BulkJournal(path, "cmd", {"batch_size": 2}, resume=True)
+    assert not resumed.should_run("rows:0-2")
+    assert not resumed.should_run("rows:2-4")
+    assert resumed.should_run("rows:2-4", retry_failed=True)
+    assert resumed.should_run("rows:4-6")  # interrupted after 'started'
+    assert resumed.should_run("rows:6-8")
+    assert resumed.counts() == {"done": 1, "failed": 1, "started": 1}
+    resumed.close()
+
+
+def test_journal_drops_torn_final_line(tmp_path):
+    path = tmp_path / "job.jsonl"
+    with BulkJournal(path, "cmd") as journal:
+        journal.complete("rows:0-1", [])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "batch", "key": "rows:1-')
+
+    with BulkJournal(path, "cmd", resume=True) as journal:
+        journal.complete("rows:1-2", [])
+
+    assert [e.get("key") for e in _events(path)] == [None, "rows:0-1", "rows:1-2"]
+
+
+def test_journal_refuses_different_parameters(tmp_path):
+    path = tmp_path / "job.jsonl"
+    BulkJournal(path, "cmd", {"batch_size": 2}).close()
+
+    with pytest.raises(ValueError, match="different"):
+        BulkJournal(path, "cmd", {"batch_size": 3}, resume=True)
+    with pytest.raises(ValueError, match="not both"):
+        open_journal(str(path), str(path), "cmd")
+
+
+def test_extract_guids_from_mutation_response():
+    result = {
+        "guidAssignments": {"-1": "g1"},
+        "mutatedEntities": {"CREATE": [{"guid": "g1"}], "UPDATE": [{"guid": "g2"}]},
+    }
+    assert extract_guids(result) == ["g1", "g2"]
+    assert row_range_key(0, 100) == "rows:0-100"
+
+
+@patch("purviewcli.client._entity.Entity")
+def test_bulk_create_csv_resume_and_retry_failed(mock_entity_cls, tmp_path):
+    csv_file = tmp_path / "entities.csv"
+    csv_file.write_text(
+        "typeName,qualifiedName\n" + "".join(f"DataSet,qn://{i}\n" for i in range(4)), encoding="utf-8"
+    )
+    journal = tmp_path / "job.jsonl"
+    sent = []
+    fail_qns = {"qn://2"}
+
+    def fake_create(args):
+        first_qn = args["--payloadFile"]["entities"][0]["attributes"]["qualifiedName"]
+        sent.append(first_qn)
+        if first_qn in fail_qns:
+            raise RuntimeError("token expired")
+        return {"mutatedEntities": {"CREATE": [{"guid": f"guid-{first_qn}"}]}}
+
+    mock_entity_cls.return_value = MagicMock(entityCreateBulk=MagicMock(side_effect=fake_create))
+    base = ["entity", "bulk-create-csv", "--csv-file", str(csv_file), "--batch-size", "2", "--max-retries", "0"]
+
+    result = CliRunner().invoke(main, base + ["--journal", str(journal)])
+    assert result.exit_code == 0, result.output
+    assert sent == ["qn://0", "qn://2"]
+    done = [e for e in _events(journal) if e.get("status") == "done"]
+    assert done[0]["key"] == "rows:0-2" and done[0]["guids"] == ["guid-qn://0"]
+
+    sent.clear()
+    result = CliRunner().invoke(main, base + ["--resume", str(journal)])
+    assert result.exit_code == 0, result.output
+    assert sent == []
+    assert "Skipped 4 row(s)" in result.output
+
+    fail_qns.clear()
+    result = CliRunner().invoke(main, base + ["--resume", str(journal), "--retry-failed"])
+    assert result.exit_code == 0, result.output
+    assert sent == ["qn://2"]
+    with BulkJournal(journal, "entity bulk-create-csv", csv_job_params(str(csv_file), 2), resume=True) as resumed:
+        assert resumed.counts() == {"done": 2}
+
+
+@patch("purviewcli.client._entity.Entity")
+def test_bulk_update_csv_resume_rebuilds_error_csv_and_skips_invalid_batches(mock_entity_cls, tmp_path):
+    csv_file = tmp_path / "update.csv"
+    csv_file.write_text("guid,typeName,description\ng1,DataSet,a\ng2,,b\ng3,DataSet,c\n", encoding="utf-8")
+    journal = tmp_path / "job.jsonl"
+    error_csv = tmp_path / "errors.csv"
+    sent = []
+    fail_guids = {"g3"}
+
+    def fake_update(args):
+        guid = args["--payloadFile"]["entities"][0]["guid"]
+        sent.append(guid)
+        if guid in fail_guids:
+            raise RuntimeError("HTTP 500")
+        return {"mutatedEntities": {"UPDATE": [{"guid": guid}]}}
+
+    mock_entity_cls.return_value = MagicMock(entityCreateBulk=MagicMock(side_effect=fake_update))
+    base = ["entity", "bulk-update-csv", "--csv-file", str(csv_file), "--batch-size", "1",
+            "--max-retries", "0", "--error-csv", str(error_csv)]
+
+    def error_guids():
+        return [line.split(",")[0] for line in error_csv.read_text().splitlines()]
+
+    result = CliRunner().invoke(main, base + ["--journal", str(journal)])
+    assert result.exit_code == 0, result.output
+    assert sent == ["g1", "g3"]
+    invalid = [e for e in _events(journal) if e.get("key") == "rows:1-2"]
+    assert invalid[-1]["status"] == "done" and invalid[-1]["row_failures"] == 1
+    assert invalid[-1]["error_rows"] == [[1, 2]]
+    assert error_guids() == ["guid", "g2", "g3"]
+
+    # A replayed batch that fails again is listed once, not once per run
+    sent.clear()
+    result = CliRunner().invoke(main, base + ["--resume", str(journal), "--retry-failed"])
+    assert result.exit_code == 0, result.output
+    assert sent == ["g3"]
+    assert error_guids() == ["guid", "g2", "g3"]
+
+    # Once it succeeds, its earlier failure row is gone
+    fail_guids.clear()
+    sent.clear()
+    result = CliRunner().invoke(main, base + ["--resume", str(journal), "--retry-failed"])
+    assert result.exit_code == 0, result.output
+    assert sent == ["g3"]
+    assert error_guids() == ["guid", "g2"]
+
+
+@patch("purviewcli.client._entity.Entity")
+def test_bulk_delete_optimized_resume_skips_deleted_requests(mock_entity_cls, tmp_path):
+    journal = tmp_path / "delete.jsonl"
+    calls = []
+
+    def fake_delete(args):
+        calls.append(list(args["--guid"]))
+        if args["--guid"] == ["g3"]:
+            raise RuntimeError("preempted")
+        return {"mutatedEntities": {"DELETE": []}}
+
+    mock_entity_cls.return_value = MagicMock(entityDeleteBulk=MagicMock(side_effect=fake_delete))
+    base = ["entity", "bulk-delete-optimized", "g1", "g2", "g3", "--bulk-size", "2", "--max-parallel", "1"]
+
+    result = CliRunner().invoke(main, base + ["--journal", str(journal)])
+    assert result.exit_code == 0, result.output
+    assert calls == [["g1", "g2"], ["g3"]]
+
+    calls.clear()
+    result = CliRunner().invoke(main, base + ["--resume", str(journal), "--retry-failed"])
+    assert result.exit_code == 0, result.output
+    assert calls == [["g3"]]
+
+
+def test_uc_add_relationship_resume_skips_linked_guids(tmp_path):
+    guids_file = tmp_path / "guids.txt"
+    guids_file.write_text("g1\ng2\n", encoding="utf-8")
+    journal = tmp_path / "link.jsonl"
+    client = MagicMock()
+    client.find_data_asset_by_entity_guid.side_effect = lambda args: {
+        "value": [{"id": f"uc-{args['--entity-guid']}"}]
+    }
+    client.create_data_product_relationship.side_effect = [{}, {"status": "error", "message": "HTTP 500"}, {}]
+    base = ["uc", "dataproduct", "add-relationship", "--product-id", "p1", "--entity-type", "DATAASSET",
+            "--guids-file", str(guids_file)]
+
+    with patch("purviewcli.cli.unified_catalog.UnifiedCatalogClient", return_value=client):
+        first = CliRunner().invoke(main, base + ["--journal", str(journal)])
+        second = CliRunner().invoke(main, base + ["--resume", str(journal), "--retry-failed"])
+
+    assert first.exit_code == 0, first.output
+    assert second.exit_code == 0, second.output
+    linked = [c.args[0]["--entity-id"] for c in client.create_data_product_relationship.call_args_list]
+    assert linked == [["uc-g1"], ["uc-g2"], ["uc-g2"]]
+    assert "Skipped 1 GUID(s)" in second.output
@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the batched column-lineage import."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from purviewcli.cli.cli import main
+from purviewcli.client._lineage import Lineage
+
+TABLES = {
+    f"{n}" * 8 + "-0000-0000-0000-000000000000": [f"col{i}" for i in range(3)]
+    for n in (1, 2, 3)
+}
+T1, T2, T3 = list(TABLES)
+
+
+class FakeApi:
+    def __init__(self, fail_writes=0):
+        self.reads = []
+        self.writes = []
+        self.fail_writes = fail_writes
+
+    def __call__(self, http_dict):
+        if http_dict["method"] == "GET":
+            guids = http_dict["params"]["guid"]
+            self.reads.append(list(guids))
+            return {
+                "entities": [
+                    {
+                        "guid": guid,
+                        "relationshipAttributes": {
+                            "columns": [
+                                {"guid": f"{guid[:1]}-{name}", "displayText": name.upper(),
+                                 "attributes": {"dataType": "int"}}
+                                for name in TABLES[guid]
+                            ]
+                        },
+                    }
+                    for guid in guids
+                    if guid in TABLES
+                ]
+            }
+        self.writes.append(http_dict["payload"])
+        if len(self.writes) <= self.fail_writes:
+            return {"status": "error", "message": "HTTP 500"}
+        return {"mutatedEntities": {"CREATE": http_dict["payload"]["entities"]}}
+
+
+def _mapping(source, source_col, target, target_col):
+    return {"source_table_guid": source, "source_column": source_col,
+            "target_table_guid": target, "target_column": target_col}
+
+
+def test_batch_reads_each_table_once_and_writes_per_chunk():
+    mappings = [_mapping(T1, f"col{i % 3}", T2 if i % 2 else T3, f"col{i % 3}") for i in range(6)]
+    mappings.append(_mapping(T1, "missing", T2, "col0"))
+    api = FakeApi()
+
+    with patch("purviewcli.client.endpoint.get_data", api):
+        result = Lineage().lineageCreateColumnLevelBatch(
+            {"--mappings": mappings, "--batch-size": 4, "--read-batch-size": 2}
+        )
+
+    assert [len(r) for r in api.reads] == [2, 1]
+    assert [len(w["entities"]) for w in api.writes] == [4, 2]
+    assert result["created_count"] == 6 and result["failed_count"] == 1
+    assert result["status"] == "partial"
+    assert "missing" in result["results"][6]["message"]
+
+    first = api.writes[0]
+    assert first["entities"][0]["attributes"]["inputs"] == [{"guid": "1-col0", "typeName": "column"}]
+    assert first["entities"][0]["attributes"]["outputs"] == [{"guid": "3-col0", "typeName": "column"}]
+    temp_guids = [e["guid"] for e in first["entities"]] + [r["guid"] for r in first["relationships"]]
+    assert len(set(temp_guids)) == len(temp_guids)
+    assert first["relationships"][0]["end2"]["guid"] == first["entities"][0]["guid"]
+
+
+def test_failed_write_marks_its_rows_failed():
+    mappings = [_mapping(T1, "col0", T2, f"col{i}") for i in range(3)]
+    api = FakeApi(fail_writes=1)
+
+    with patch("purviewcli.client.endpoint.get_data", api):
+        result = Lineage().lineageCreateColumnLevelBatch({"--mappings": mappings, "--batch-size": 2})
+
+    assert [r["status"] for r in result["results"]] == ["error", "error", "success"]
+    assert result["results"][0]["message"] == "HTTP 500"
+
+
+def test_import_column_csv_uses_batch_engine(tmp_path):
+    csv_file = tmp_path / "columns.csv"
+    csv_file.write_text(
+        "source_table_guid,source_column,target_table_guid,target_column,process_name\n"
+        + "".join(f"{T1},col{i},{T2},col{i},P{i}\n" for i in range(3)),
+        encoding="utf-8",
+    )
+    api = FakeApi()
+
+    with patch("purviewcli.client.endpoint.get_data", api):
+        result = CliRunner().invoke(main, ["lineage", "import-column-csv", str(csv_file), "--batch-size", "2"])
+
+    assert result.exit_code == 0, result.output
+    assert len(api.reads) == 1 and len(api.writes) == 2
+    assert [e["attributes"]["name"] for w in api.writes for e in w["entities"]] == ["P0", "P1", "P2"]
+    assert "SUCCESS: 3" in result.output
+
+
+def test_import_column_csv_journal_resumes_by_row_range(tmp_path):
+    csv_file = tmp_path / "columns.csv"
+    csv_file.write_text(
+        "source_table_guid,source_column,target_table_guid,target_column\n"
+        + "".join(f"{T1},col{i},{T2},col{i}\n" for i in range(3))
+        + f"{T1},missing,{T2},col0\n",
+        encoding="utf-8",
+    )
+    journal = tmp_path / "job.jsonl"
+    base = ["lineage", "import-column-csv", str(csv_file), "--batch-size", "2"]
+
+    api = FakeApi(fail_writes=1)
+    with patch("purviewcli.client.endpoint.get_data", api):
+        result = CliRunner().invoke(main, base + ["--journal", str(journal)])
+    assert result.exit_code == 0, result.output
+    events = {e["key"]: e for e in map(json.loads, journal.read_text().splitlines()) if e.get("type") == "batch"}
+    assert events["rows:0-2"]["status"] == "failed"
+    assert events["rows:2-4"]["status"] == "done" and events["rows:2-4"]["row_failures"] == 1
+
+    api = FakeApi()
+    with patch("purviewcli.client.endpoint.get_data", api):
+        result = CliRunner().invoke(main, base + ["--resume", str(journal)])
+    assert result.exit_code == 0, result.output
+    assert api.writes == [] and api.reads == []
+    assert "Skipped 4 row(s)" in result.output
+
+    with patch("purviewcli.client.endpoint.get_data", api):
+        result = CliRunner().invoke(main, base + ["--resume", str(journal), "--retry-failed"])
+    assert result.exit_code == 0, result.output
+    assert [[e["attributes"]["inputs"][0]["guid"] for e in w["entities"]] for w in api.writes] == [["1-col0", "1-col1"]]
+    assert "SUCCESS: 2" in result.output
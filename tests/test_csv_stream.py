@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for the chunked CSV reader used by the bulk CSV imports."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+from click.testing import CliRunner
+
+from purviewcli.cli.cli import main
+from purviewcli.client._lineage import Lineage
+from purviewcli.client.csv_stream import ErrorCsvWriter, iter_csv_batches
+
+
+def _write_csv(path, header, rows):
+    path.write_text("\n".join([header] + rows) + "\n", encoding="utf-8")
+    return path
+
+
+def test_iter_csv_batches_is_lazy_and_keeps_file_positions(tmp_path):
+    csv_file = _write_csv(tmp_path / "rows.csv", "guid", [f"g{i}" for i in range(5)])
+
+    with patch("purviewcli.client.csv_stream.pd.read_csv", wraps=pd.read_csv) as read_csv:
+        batches = iter_csv_batches(csv_file, 2)
+        read_csv.assert_not_called()
+        first = next(batches)
+        rest = list(batches)
+
+    assert read_csv.call_args.kwargs["chunksize"] == 2
+    assert first["guid"].tolist() == ["g0", "g1"]
+    assert [b.index.tolist() for b in rest] == [[2, 3], [4]]
+
+
+def test_iter_csv_batches_skips_header_only_file(tmp_path):
+    csv_file = _write_csv(tmp_path / "empty.csv", "guid", [])
+    assert list(iter_csv_batches(csv_file, 10)) == []
+
+
+def test_error_csv_writer_appends_under_one_header(tmp_path):
+    path = tmp_path / "errors.csv"
+    path.write_text("stale\n", encoding="utf-8")
+    writer = ErrorCsvWriter(str(path))
+
+    writer.write(pd.DataFrame({"guid": ["a"], "typeName": ["DataSet"]}))
+    writer.write([{"typeName": "Process", "guid": "b"}])
+    writer.write([])
+
+    assert path.read_text().splitlines() == ["guid,typeName", "a,DataSet", "b,Process"]
+    assert writer.rows_written == 2
+
+
+def test_error_csv_writer_restore_keeps_only_listed_rows(tmp_path):
+    csv_file = _write_csv(tmp_path / "rows.csv", "guid,typeName", [f"g{i},DataSet" for i in range(5)])
+    path = tmp_path / "errors.csv"
+    path.write_text("guid,typeName\ng1,DataSet\ng1,DataSet\ng3,DataSet\n", encoding="utf-8")
+    writer = ErrorCsvWriter(str(path))
+
+    writer.restore(str(csv_file), [(1, 2), (4, 5)])
+    writer.write([{"typeName": "Process", "guid": "g9"}])
+
+    assert path.read_text().splitlines() == ["guid,typeName", "g1,DataSet", "g4,DataSet", "g9,Process"]
+
+    ErrorCsvWriter(str(path)).restore(str(csv_file), [])
+    assert not path.exists()
+
+
+def test_error_csv_writer_without_path_creates_nothing(tmp_path):
+    writer = ErrorCsvWriter(None)
+    writer.write([{"guid": "a"}])
+    assert writer.rows_written == 0
+
+
+@patch("purviewcli.client._entity.Entity")
+def test_bulk_delete_csv_writes_failed_rows_before_reading_next_batch(mock_entity_cls, tmp_path):
+    csv_file = _write_csv(tmp_path / "delete.csv", "guid", ["g1", "g2", "g3"])
+    error_csv = tmp_path / "errors.csv"
+    error_lines_seen = []
+
+    def fake_delete(args):
+        error_lines_seen.append(len(error_csv.read_text().splitlines()) if error_csv.exists() else 0)
+        if args["--guid"] == ["g1", "g2"]:
+            raise RuntimeError("HTTP 500")
+        return {"mutatedEntities": {}}
+
+    mock_entity_cls.return_value = MagicMock(entityDeleteBulk=MagicMock(side_effect=fake_delete))
+
+    result = CliRunner().invoke(
+        main,
+        ["entity", "bulk-delete-csv", "--csv-file", str(csv_file), "--batch-size", "2",
+         "--error-csv", str(error_csv)],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Success: 1, Failed: 2" in result.output
+    # The first batch's failures were on disk before the second batch was sent
+    assert error_lines_seen == [0, 3]
+    assert error_csv.read_text().splitlines() == ["guid", "g1", "g2"]
+
+
+def test_csv_lineage_is_built_across_chunks(tmp_path):
+    csv_file = _write_csv(
+        tmp_path / "lineage.csv",
+        "source_entity_guid,target_entity_guid,process_name",
+        [f"s{i},t{i},p{i}" for i in range(3)],
+    )
+
+    with patch("purviewcli.client.csv_stream.DEFAULT_CHUNK_ROWS", 2), \
+            patch("purviewcli.client.csv_stream.pd.read_csv", wraps=pd.read_csv) as read_csv:
+        result = Lineage()._process_csv_lineage(str(csv_file), {})
+
+    assert [e["guid"] for e in result["entities"]] == ["-1", "-2", "-3"]
+    assert result["entities"][2]["attributes"]["inputs"] == [{"guid": "s2", "typeName": "DataSet"}]
+    assert any(call.kwargs.get("chunksize") for call in read_csv.call_args_list)
+
+
+def test_uc_term_import_csv_dry_run_streams_terms(tmp_path):
+    csv_file = _write_csv(
+        tmp_path / "terms.csv",
+        "name,description,Term Template Names",
+        ["Customer,Customer entity,Tpl", ",skipped,", "Product,Catalog,"],
+    )
+
+    with patch("purviewcli.cli.unified_catalog.UnifiedCatalogClient"), \
+            patch("purviewcli.cli.unified_catalog.TERM_PREVIEW_PAGE_SIZE", 1):
+        result = CliRunner().invoke(
+            main, ["uc", "term", "import-csv", "--csv-file", str(csv_file), "--domain-id", "d1", "--dry-run"]
+        )
+
+    assert result.exit_code == 0, result.output
+    assert result.output.count("Terms to Import") == 2
+    assert "Term 2 - Product" in result.output
+    assert "Term Templates" in result.output
+    assert "Found 2 term(s) in CSV file" in result.output
+
+
+def test_uc_term_import_csv_reports_before_sending(tmp_path):
+    csv_file = _write_csv(
+        tmp_path / "terms.csv",
+        "name,description,Term Template Names",
+        ["Customer,Customer entity,Tpl", "Product,Catalog,"],
+    )
+
+    with patch("purviewcli.cli.unified_catalog.UnifiedCatalogClient") as client_cls, \
+            patch("purviewcli.cli.unified_catalog.console.status") as status:
+        client_cls.return_value.create_term.return_value = {"id": "t-1"}
+        result = CliRunner().invoke(
+            main, ["uc", "term", "import-csv", "--csv-file", str(csv_file), "--domain-id", "d1"]
+        )
+
+    assert result.exit_code == 0, result.output
+    first_sent = result.output.index("Created: Customer")
+    assert result.output.index("Found 2 term(s) in CSV file") < first_sent
+    assert result.output.index("Term Templates") < first_sent
+    assert result.output.count("Term Templates") == 1
+    assert client_cls.return_value.create_term.call_count == 2
+    updates = [c.args[0] for c in status.return_value.__enter__.return_value.update.call_args_list]
+    assert updates == ["[bold green]Processing term 1/2: Customer", "[bold green]Processing term 2/2: Product"]
+    assert "Total terms processed: 2" in result.output
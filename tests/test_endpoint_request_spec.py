@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for per-call request state in Endpoint / decorator."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import concurrent.futures
+from unittest.mock import patch
+
+from purviewcli.client.endpoint import Endpoint, RequestSpec, decorator
+
+
+class _EchoClient(Endpoint):
+    def __init__(self):
+        Endpoint.__init__(self)
+        self.app = "catalog"
+
+    @decorator
+    def entityRead(self, args):
+        """Read one entity."""
+        self.method = "GET"
+        self.endpoint = f"/entity/guid/{args['--guid']}"
+        # Yield to other threads mid-build to provoke interleaving
+        time.sleep(0.001)
+        self.params = {"guid": args["--guid"]}
+
+    @decorator
+    def entityUpdate(self, args):
+        current = self.entityRead({"--guid": args["--guid"]})
+        self.method = "PUT"
+        self.endpoint = f"/entity/guid/{args['--guid']}"
+        self.payload = {"previous": current["endpoint"]}
+
+
+def _echo(http_dict):
+    return dict(http_dict)
+
+
+@patch("purviewcli.client.endpoint.get_data", side_effect=_echo)
+def test_shared_client_keeps_requests_isolated_across_threads(_mock):
+    client = _EchoClient()
+    guids = [f"guid-{i}" for i in range(200)]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as pool:
+        results = list(pool.map(lambda g: client.entityRead({"--guid": g}), guids))
+
+    for guid, result in zip(guids, results):
+        assert result["endpoint"] == f"/entity/guid/{guid}"
+        assert result["params"] == {"guid": guid}
+
+
+@patch("purviewcli.client.endpoint.get_data", side_effect=_echo)
+def test_nested_calls_do_not_clobber_outer_request(_mock):
+    result = _EchoClient().entityUpdate({"--guid": "abc"})
+
+    assert result["method"] == "PUT"
+    assert result["payload"] == {"previous": "/entity/guid/abc"}
+    assert result["params"] is None
+
+
+@patch("purviewcli.client.endpoint.get_data", side_effect=_echo)
+def test_state_does_not_leak_between_calls(_mock):
+    client = _EchoClient()
+    client.entityUpdate({"--guid": "abc"})
+    result = client.entityRead({"--guid": "def"})
+
+    assert result["payload"] is None
+    assert client.entityRead.__doc__ == "Read one entity."
+
+
+def test_build_request_returns_frozen_spec():
+    client = _EchoClient()
+    spec = client._build_request(_EchoClient.entityRead.__wrapped__, {"--guid": "x"})
+
+    assert isinstance(spec, RequestSpec)
+    assert spec.app == "catalog"
+    assert spec.to_http_dict()["endpoint"] == "/entity/guid/x"
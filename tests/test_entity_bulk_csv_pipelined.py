@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for pipelined (--max-parallel) entity bulk-create-csv / bulk-update-csv."""
+
+import os
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from purviewcli.cli.cli import main
+from purviewcli.client.bulk_executor import run_batches
+
+
+RUNNER = CliRunner()
+
+
+def invoke(*args):
+    return RUNNER.invoke(main, list(args), catch_exceptions=False)
+
+
+def write_create_csv(path, count):
+    rows = [f"DataSet,qn://asset/{i},Asset {i}" for i in range(count)]
+    path.write_text("typeName,qualifiedName,displayName\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+
+def test_run_batches_bounds_in_flight_and_preserves_order():
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def work(n):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.01 * (n % 3))
+        with lock:
+            state["running"] -= 1
+        if n == 4:
+            raise ValueError("boom")
+        return n * 10
+
+    outcomes = list(run_batches(work, range(12), max_parallel=3))
+
+    assert [o.item for o in outcomes] == list(range(12))
+    assert outcomes[4].error is not None and outcomes[4].result is None
+    assert outcomes[5].result == 50
+    assert 1 < state["peak"] <= 3
+
+
+@patch("purviewcli.client._entity.Entity")
+def test_bulk_create_csv_pipelined_reports_failures_in_order(mock_entity_cls, tmp_path):
+    mock_client = MagicMock()
+    mock_entity_cls.return_value = mock_client
+
+    def create_bulk(args):
+        payload = args["--payloadFile"]
+        first_qn = payload["entities"][0]["attributes"]["qualifiedName"]
+        if first_qn in ("qn://asset/2", "qn://asset/6"):
+            return {"status": "error", "message": f"rejected {first_qn}"}
+        return {"mutatedEntities": {"CREATE": []}}
+
+    mock_client.entityCreateBulk.side_effect = create_bulk
+
+    csv_file = tmp_path / "entities.csv"
+    error_csv = tmp_path / "errors.csv"
+    write_create_csv(csv_file, 10)
+
+    result = invoke(
+        "entity", "bulk-create-csv",
+        "--csv-file", str(csv_file),
+        "--batch-size", "2",
+        "--max-parallel", "4",
+        "--max-retries", "0",
+        "--error-csv", str(error_csv),
+    )
+
+    assert result.exit_code == 0, result.output
+    assert mock_client.entityCreateBulk.call_count == 5
+    assert "Success: 6, Failed: 4" in result.output
+    assert result.output.index("Batch 2: ") < result.output.index("Batch 4: ")
+    failed_qns = [line.split(",")[1] for line in error_csv.read_text().splitlines()[1:]]
+    assert failed_qns == ["qn://asset/2", "qn://asset/3", "qn://asset/6", "qn://asset/7"]
+
+
+@patch("purviewcli.client._entity.Entity")
+def test_bulk_update_csv_pipelined_keeps_row_level_failures(mock_entity_cls, tmp_path):
+    mock_client = MagicMock()
+    mock_entity_cls.return_value = mock_client
+    mock_client.entityCreateBulk.return_value = {"mutatedEntities": {"UPDATE": []}}
+
+    csv_file = tmp_path / "updates.csv"
+    csv_file.write_text(
+        "typeName,guid,description\n"
+        "DataSet,g-1,one\n"
+        "DataSet,,missing guid\n"
+        "DataSet,g-3,three\n"
+        "DataSet,g-4,four\n",
+        encoding="utf-8",
+    )
+
+    result = invoke(
+        "entity", "bulk-update-csv",
+        "--csv-file", str(csv_file),
+        "--batch-size", "2",
+        "--max-parallel", "2",
+    )
+
+    assert result.exit_code == 0, result.output
+    assert mock_client.entityCreateBulk.call_count == 2
+    assert "Success: 3, Failed: 1" in result.output
+    assert "Row missing required guid" in result.output
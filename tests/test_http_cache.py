@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for the persistent HTTP response cache."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+import pytest
+import requests_mock
+
+from purviewcli.client.http_cache import HttpResponseCache, get_http_cache
+
+TYPEDEFS_URL = "https://aid-api.purview-service.microsoft.com/datamap/api/atlas/v2/types/typedefs"
+TYPEDEFS = "/datamap/api/atlas/v2/types/typedefs"
+
+
+@pytest.fixture
+def client(sync_client, monkeypatch):
+    monkeypatch.setenv("PURVIEW_HTTP_CACHE", "true")
+    yield sync_client
+    get_http_cache().clear()
+
+
+def test_etag_entries_are_revalidated_with_if_none_match(client):
+    with requests_mock.Mocker() as m:
+        m.get(TYPEDEFS_URL, [
+            {"json": {"entityDefs": [1]}, "headers": {"ETag": '"v1"'}},
+            {"status_code": 304},
+        ])
+        first = client.make_request("GET", TYPEDEFS)
+        second = client.make_request("GET", TYPEDEFS)
+
+        assert m.call_count == 2
+        assert "If-None-Match" not in m.request_history[0].headers
+        assert m.request_history[1].headers["If-None-Match"] == '"v1"'
+    assert first["data"] == second["data"] == {"entityDefs": [1]}
+    assert second["status"] == "success"
+
+
+def test_entries_without_etag_are_served_until_ttl(client):
+    with requests_mock.Mocker() as m:
+        m.get(TYPEDEFS_URL, json={"entityDefs": []})
+        client.make_request("GET", TYPEDEFS)
+        result = client.make_request("GET", TYPEDEFS)
+
+        assert m.call_count == 1
+    assert result["data"] == {"entityDefs": []}
+
+
+def test_write_invalidates_persisted_entries(client):
+    with requests_mock.Mocker() as m:
+        m.get(TYPEDEFS_URL, json={"entityDefs": []})
+        m.post(TYPEDEFS_URL, json={})
+        client.make_request("GET", TYPEDEFS)
+        client.make_request("POST", TYPEDEFS, json={"entityDefs": []})
+        client.make_request("GET", TYPEDEFS)
+
+        assert [r.method for r in m.request_history] == ["GET", "POST", "GET"]
+
+
+def test_cache_is_opt_in(client, monkeypatch):
+    monkeypatch.setenv("PURVIEW_HTTP_CACHE", "false")
+    with requests_mock.Mocker() as m:
+        m.get(TYPEDEFS_URL, json={"entityDefs": []})
+        client.make_request("GET", TYPEDEFS)
+        client.make_request("GET", TYPEDEFS)
+
+        assert m.call_count == 2
+
+
+def test_stale_entries_without_etag_expire(tmp_path):
+    cache = HttpResponseCache(cache_dir=tmp_path, ttl_seconds=0, enabled=True)
+    cache.store("k", TYPEDEFS, {"a": 1})
+    time.sleep(0.01)
+
+    assert cache.lookup("k") is None
+    assert cache.is_cacheable("GET", "/account/collections/finance")
+    assert not cache.is_cacheable("GET", "/datamap/api/atlas/v2/entity/guid/x")
@@ -0,0 +1,224 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the indexed LineageGraph and the analyses built on it."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+from unittest.mock import MagicMock
+
+from purviewcli.client.lineage_visualization import (
+    AdvancedLineageAnalyzer,
+    LineageDepth,
+    LineageDirection,
+    LineageEdge,
+    LineageGraph,
+    LineageNode,
+)
+
+
+def _graph(edges, root="a"):
+    names = sorted({guid for edge in edges for guid in edge[:2]} | {root})
+    graph = LineageGraph(
+        nodes={guid: LineageNode(guid, f"table_{guid}", "azure_sql_table", f"qn://{guid}", {}, []) for guid in names},
+        root_guid=root,
+    )
+    for source, target, *process in edges:
+        graph.add_edge(LineageEdge(source, target, "lineage", process_guid=process[0] if process else None))
+    return graph
+
+
+def test_add_edge_dedups_on_source_target_process():
+    graph = _graph([])
+
+    assert graph.add_edge(LineageEdge("a", "b", "lineage", process_guid="p1"))
+    assert not graph.add_edge(LineageEdge("a", "b", "lineage", process_guid="p1"))
+    assert graph.add_edge(LineageEdge("a", "b", "lineage", process_guid="p2"))
+
+    assert len(graph.edges) == 2
+    assert graph.out_degree("a") == 2 and graph.in_degree("b") == 2
+    assert graph.successors("a") == ["b"] and graph.predecessors("b") == ["a"]
+    assert graph.has_edge("a", "b") and not graph.has_edge("b", "a")
+
+
+def test_edges_added_to_the_list_directly_are_indexed():
+    graph = LineageGraph(edges=[LineageEdge("a", "b", "lineage"), LineageEdge("a", "b", "lineage")])
+    graph.edges.append(LineageEdge("b", "c", "lineage"))
+
+    assert len(graph.edges) == 2
+    assert graph.descendants("a") == {"b", "c"}
+    assert graph.ancestors("c") == {"a", "b"}
+
+
+def test_shortest_path_and_reachability_handle_cycles():
+    graph = _graph([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("a", "d")])
+
+    assert graph.shortest_path("a", "d") == ["a", "d"]
+    assert graph.shortest_path("b", "d") == ["b", "c", "d"]
+    assert graph.shortest_path("d", "a") is None
+    assert graph.descendants("a") == {"b", "c", "d"}
+
+
+def test_impact_analysis_uses_the_index():
+    graph = _graph([("a", "b"), ("b", "c"), ("c", "d"), ("c", "e"), ("x", "c"), ("z", "a")])
+    analyzer = AdvancedLineageAnalyzer(MagicMock())
+
+    impact = analyzer.analyze_lineage_impact(graph, "a")
+
+    assert set(impact.affected_entities) == {"b", "c", "d", "e", "z"}
+    assert impact.downstream_count == 4 and impact.upstream_count == 1
+    assert impact.critical_paths == [["a", "b", "c"]]
+
+
+def test_gaps_use_degree_index():
+    graph = _graph([("a", "b")])
+    graph.nodes["lonely"] = LineageNode("lonely", "orphan", "azure_sql_table", "qn://lonely", {}, [])
+
+    gaps = asyncio.run(AdvancedLineageAnalyzer(MagicMock()).find_lineage_gaps(graph))
+
+    assert [g["entities"] for g in gaps if g["type"] == "isolated_entities"] == [["lonely"]]
+
+
+class FakeLineageClient:
+    """Serves depth-1 lineage around each node of a fixed edge list."""
+
+    def __init__(self, edges, fail=()):
+        self.edges = edges
+        self.fail = set(fail)
+        self.lineage_calls = []
+        self.bulk_reads = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get_entity(self, guid):
+        return {"guid": guid, "typeName": "azure_sql_table", "attributes": {"name": f"table_{guid}"}}
+
+    async def get_lineage(self, guid, direction="BOTH", depth=3):
+        self.lineage_calls.append((guid, direction))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if guid in self.fail:
+            raise RuntimeError("HTTP 500")
+        relations = [
+            {"fromEntityId": s, "toEntityId": t, "relationshipType": "lineage"}
+            for s, t in self.edges
+            if (t == guid and direction in ("INPUT", "BOTH")) or (s == guid and direction in ("OUTPUT", "BOTH"))
+        ]
+        headers = {g: {"guid": g, "typeName": "header", "attributes": {"name": f"hdr_{g}"}}
+                   for r in relations for g in (r["fromEntityId"], r["toEntityId"])}
+        return {"relations": relations, "guidEntityMap": headers}
+
+    async def get_entities_by_guids(self, guids, chunk_size=100, **kwargs):
+        self.bulk_reads.append(sorted(guids))
+        return [{"guid": g, "typeName": "azure_sql_table", "attributes": {"name": f"table_{g}"}}
+                for g in guids if g != "no_entity"]
+
+
+def test_crawl_expands_levels_concurrently_and_hydrates_in_bulk():
+    edges = [("u1", "root"), ("u2", "root"), ("root", "d1"), ("root", "d2"), ("root", "d3"),
+             ("d1", "d4"), ("d2", "d4"), ("d3", "no_entity"), ("d4", "d5"), ("x", "d1")]
+    client = FakeLineageClient(edges)
+    analyzer = AdvancedLineageAnalyzer(client, max_concurrency=2)
+
+    graph = asyncio.run(analyzer.get_comprehensive_lineage("root", depth=LineageDepth.EXTENDED))
+
+    assert client.bulk_reads == [["d1", "d2", "d3", "u1", "u2"], ["d4", "no_entity"], ["d5"]]
+    assert set(graph.nodes) == {"root", "u1", "u2", "d1", "d2", "d3", "d4", "d5", "no_entity"}
+    # Downstream nodes are never expanded upstream, so x stays out
+    assert ("d1", "INPUT") not in client.lineage_calls and "x" not in graph.nodes
+    assert graph.nodes["d4"].depth == 2 and graph.nodes["d4"].direction == "OUTPUT"
+    assert graph.nodes["no_entity"].name == "hdr_no_entity"
+    assert graph.has_edge("d2", "d4") and graph.in_degree("d4") == 2
+    assert client.peak == 2
+
+
+def test_crawl_respects_node_budget_and_skips_failed_nodes():
+    edges = [("root", f"d{i}") for i in range(5)] + [("d0", "e0"), ("d1", "e1")]
+    client = FakeLineageClient(edges, fail={"d1"})
+
+    graph = asyncio.run(
+        AdvancedLineageAnalyzer(client, max_nodes=20).get_comprehensive_lineage("root", direction=LineageDirection.OUTPUT)
+    )
+    assert set(graph.nodes) == {"root", "d0", "d1", "d2", "d3", "d4", "e0"}
+
+    graph = asyncio.run(
+        AdvancedLineageAnalyzer(client, max_nodes=3).get_comprehensive_lineage("root", direction=LineageDirection.OUTPUT)
+    )
+    assert len(graph.nodes) == 3
+    # Edges to nodes dropped by the budget are not kept
+    assert {guid for edge in graph.edges for guid in (edge.source_guid, edge.target_guid)} <= set(graph.nodes)
+    assert graph.descendants("root") == set(graph.nodes) - {"root"}
+
+
+def test_similar_name_pairs_match_brute_force():
+    names = ["sales_fact", "sales_fact_daily", "dim_customer", "dim_customer_scd", "dim_product",
+             "fact_sales", "stg_sales_fact", "orders", "orders_v2", "dim_customer_scd_v2"]
+    graph = LineageGraph(nodes={f"n{i}": LineageNode(f"n{i}", name, "t", "", {}, []) for i, name in enumerate(names)})
+    graph.add_edge(LineageEdge("n1", "n0", "lineage"))
+    analyzer = AdvancedLineageAnalyzer(MagicMock())
+
+    for threshold in (0.3, 0.5, 0.7):
+        expected = {
+            tuple(sorted((a, b)))
+            for a in graph.nodes for b in graph.nodes
+            if a < b and not graph.has_edge(a, b) and not graph.has_edge(b, a)
+            and analyzer._calculate_name_similarity(graph.nodes[a].name, graph.nodes[b].name) > threshold
+        }
+        found = {(a, b) for a, b, _ in analyzer._find_similar_name_pairs(graph, threshold, top_k=len(names))}
+        assert found == expected
+
+    # "sales_fact" and "fact_sales" share every word; the connected pair n0/n1 is skipped
+    top = analyzer._find_similar_name_pairs(graph, 0.3, top_k=1)
+    assert top[0] == ("n0", "n5", 1.0)
+    assert all(score > 0.3 for _, _, score in top)
+    assert ("n0", "n1") not in {(a, b) for a, b, _ in top}
+
+
+def test_shortest_paths_to_many_targets_from_one_search():
+    graph = _graph([("a", "b"), ("b", "c"), ("a", "c"), ("c", "d"), ("x", "y")])
+
+    assert graph.shortest_paths("a", ["d", "c", "y"]) == {"c": ["a", "c"], "d": ["a", "c", "d"]}
+    assert set(graph.shortest_paths("a")) == {"a", "b", "c", "d"}
+
+
+def test_topological_depths_use_longest_path_and_tolerate_cycles():
+    graph = _graph([("a", "b"), ("b", "c"), ("a", "c"), ("c", "d"), ("d", "e"), ("e", "d")])
+
+    depths = graph.topological_depths()
+
+    assert depths["a"] == 0 and depths["b"] == 1 and depths["c"] == 2
+    assert depths["d"] == 3 and depths["e"] == 4
+    assert _graph([("p", "q"), ("q", "p")], root="p").topological_depths() == {"p": 0, "q": 1}
+
+
+def test_networkx_is_only_needed_for_networkx_export(monkeypatch):
+    from purviewcli.client import lineage_visualization
+
+    monkeypatch.setattr(lineage_visualization, "nx", None)
+    graph = _graph([("a", "b"), ("b", "c"), ("c", "d"), ("c", "e")])
+
+    impact = AdvancedLineageAnalyzer(MagicMock()).analyze_lineage_impact(graph, "a")
+    assert impact.downstream_count == 4
+    try:
+        graph.to_networkx()
+    except RuntimeError as e:
+        assert "networkx" in str(e)
+    else:
+        raise AssertionError("expected RuntimeError")
+
+
+def test_graphml_export_without_networkx_gives_install_hint(monkeypatch, tmp_path):
+    from purviewcli.client import lineage_visualization
+
+    monkeypatch.setattr(lineage_visualization, "nx", None)
+    analyzer = AdvancedLineageAnalyzer(MagicMock())
+
+    try:
+        asyncio.run(analyzer.export_lineage_graph(_graph([("a", "b")]), str(tmp_path / "g.graphml"), "graphml"))
+    except RuntimeError as e:
+        assert "pip install networkx" in str(e)
+    else:
+        raise AssertionError("expected RuntimeError")
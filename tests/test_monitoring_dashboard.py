@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for concurrent metric collection in the monitoring dashboard."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+
+from purviewcli.client.monitoring_dashboard import MonitoringDashboard
+
+
+class FakeClient:
+    """Answers the dashboard's requests after a short delay, tracking concurrency."""
+
+    def __init__(self, slow=()):
+        # Requests whose last path segment is in slow never answer in time
+        self.slow = set(slow)
+        self.in_flight = 0
+        self.peak = 0
+        self.lineage_in_flight = 0
+        self.lineage_peak = 0
+
+    async def _make_request(self, method, endpoint, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        is_lineage = endpoint.startswith('/lineage/')
+        self.lineage_in_flight += is_lineage
+        self.lineage_peak = max(self.lineage_peak, self.lineage_in_flight)
+        try:
+            guid = endpoint.rsplit('/', 1)[-1]
+            await asyncio.sleep(10 if guid in self.slow else 0.01)
+            if endpoint == '/scan/datasources':
+                return {"value": [{"name": f"ds{i}"} for i in range(3)]}
+            if endpoint.endswith('/scans'):
+                return {"value": [{"name": "s1"}, {"name": "s2"}]}
+            if endpoint.endswith('/runs'):
+                return {"value": [{"status": "Succeeded"}, {"status": "Failed"}]}
+            if endpoint == '/search/query':
+                if kwargs["json"].get("filter", {}).get("entityType") == "DataSet":
+                    return {"value": [{"id": f"e{i}"} for i in range(6)]}
+                return {"@search.count": 10}
+            if endpoint.startswith('/lineage/'):
+                return {"relations": [{}]} if guid in ("e0", "e1", "e2") else {}
+            return {}
+        finally:
+            self.in_flight -= 1
+            self.lineage_in_flight -= is_lineage
+
+
+def _values(metrics):
+    return {m.name: m.value for m in metrics}
+
+
+def test_collectors_run_concurrently_with_bounded_fan_out():
+    client = FakeClient()
+    dashboard = MonitoringDashboard(client, max_concurrency=2)
+
+    values = _values(asyncio.run(dashboard.collect_metrics()))
+
+    assert values["completed_scans"] == 6 and values["failed_scans"] == 6
+    assert values["entities_with_lineage"] == 3 and values["lineage_completeness"] == 50
+    assert values["total_entities"] == 10
+    # Five collectors run at once, each fanning out at most two requests at a time
+    assert 5 <= client.peak <= 5 * 2
+    assert client.lineage_peak == 2
+
+
+def test_slow_collector_reports_partial_results():
+    dashboard = MonitoringDashboard(FakeClient(slow={"e5"}), collector_timeout=0.5)
+
+    metrics = asyncio.run(dashboard.collect_metrics())
+    values = _values(metrics)
+
+    assert values["completed_scans"] == 6
+    assert values["entities_with_lineage"] == 3
+    assert values["lineage_completeness"] == 60  # 3 of the 5 entities checked
+    partial = {m.name for m in metrics if m.tags.get("partial") == "true"}
+    assert partial == {"entities_with_lineage", "lineage_completeness"}
+
+
+def test_scan_timeout_before_any_run_listing_reports_nothing():
+    dashboard = MonitoringDashboard(FakeClient(slow={"runs"}), collector_timeout=0.5)
+
+    values = _values(asyncio.run(dashboard.collect_metrics()))
+
+    assert not {"running_scans", "failed_scans", "completed_scans"} & set(values)
+    assert values["total_entities"] == 10
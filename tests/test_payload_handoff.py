@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for handing bulk payloads to the client in memory instead of via temp files."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unittest.mock import MagicMock, patch
+
+import requests_mock
+from click.testing import CliRunner
+
+from purviewcli.cli.cli import main
+
+BULK_URL = "https://aid-api.purview-service.microsoft.com/datamap/api/atlas/v2/entity/bulk"
+
+
+def test_payload_is_encoded_once_and_resent_on_throttle(sync_client):
+    with requests_mock.Mocker() as m:
+        m.post(BULK_URL, [
+            {"status_code": 429, "headers": {"Retry-After": "0"}, "json": {}},
+            {"status_code": 200, "json": {}},
+        ])
+        sync_client.make_request("POST", "/datamap/api/atlas/v2/entity/bulk", json={"entities": [{"guid": "g"}]})
+
+    bodies = [r.body for r in m.request_history]
+    assert bodies[0] == bodies[1] == b'{"entities": [{"guid": "g"}]}'
+    assert m.request_history[0].headers["Content-Type"] == "application/json"
+
+
+def test_pre_encoded_bytes_are_sent_verbatim(sync_client):
+    with requests_mock.Mocker() as m:
+        m.post(BULK_URL, json={})
+        sync_client.make_request("POST", "/datamap/api/atlas/v2/entity/bulk", json=b'{"entities":[]}')
+
+    assert m.request_history[0].body == b'{"entities":[]}'
+
+
+@patch("purviewcli.client._entity.Entity")
+def test_bulk_classify_csv_passes_payload_in_memory(mock_entity_cls, tmp_path):
+    mock_client = MagicMock()
+    mock_entity_cls.return_value = mock_client
+    mock_client.entityBulkClassification.return_value = {"guidAssignments": {}}
+
+    csv_file = tmp_path / "classify.csv"
+    csv_file.write_text("guid,classificationName\ng1,PII\ng2,PHI\n", encoding="utf-8")
+
+    result = CliRunner().invoke(main, ["entity", "bulk-classify-csv", "--csv-file", str(csv_file)])
+
+    assert result.exit_code == 0, result.output
+    payload = mock_client.entityBulkClassification.call_args[0][0]["--payloadFile"]
+    assert payload == {
+        "entities": [
+            {"guid": "g1", "classifications": [{"typeName": "PII"}]},
+            {"guid": "g2", "classifications": [{"typeName": "PHI"}]},
+        ]
+    }
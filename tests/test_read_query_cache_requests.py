@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for read-query caching in the shared request executor."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from purviewcli.client import endpoint
+from purviewcli.client.query_cache import get_read_query_cache
+
+TYPEDEFS = "/datamap/api/atlas/v2/types/typedefs"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.delenv("PURVIEW_READ_CACHE", raising=False)
+    get_read_query_cache().clear()
+    mock_client = MagicMock()
+    mock_client.make_request.return_value = {"status": "success", "data": {"entityDefs": [{"name": "t"}]}}
+    with patch.object(endpoint, "get_sync_client", return_value=mock_client):
+        yield mock_client
+    get_read_query_cache().clear()
+
+
+def _request(method, path, params=None):
+    return endpoint.get_data({"method": method, "endpoint": path, "params": params, "headers": {}})
+
+
+def test_repeated_typedef_reads_hit_cache(client):
+    first = _request("GET", TYPEDEFS)
+    first["entityDefs"].append({"name": "mutated by caller"})
+    second = _request("GET", TYPEDEFS)
+
+    assert client.make_request.call_count == 1
+    assert second == {"entityDefs": [{"name": "t"}]}
+
+
+def test_params_are_part_of_the_key(client):
+    _request("GET", TYPEDEFS, {"type": "entity"})
+    _request("GET", TYPEDEFS, {"type": "classification"})
+
+    assert client.make_request.call_count == 2
+
+
+def test_write_invalidates_overlapping_family(client):
+    _request("GET", TYPEDEFS)
+    _request("GET", "/account/collections")
+    _request("POST", TYPEDEFS)
+    _request("GET", TYPEDEFS)
+    _request("GET", "/account/collections")
+
+    # typedef GET x2, POST, collections GET served from cache the second time
+    assert client.make_request.call_count == 4
+
+
+def test_entity_write_invalidates_headers(client):
+    header = "/datamap/api/atlas/v2/entity/guid/abc/header"
+    _request("GET", header)
+    _request("POST", "/datamap/api/atlas/v2/entity/bulk/classification")
+    _request("GET", header)
+
+    assert client.make_request.call_count == 3
+
+
+def test_uncached_reads_and_errors_go_to_api(client):
+    _request("GET", "/datamap/api/atlas/v2/entity/guid/abc")
+    _request("GET", "/datamap/api/atlas/v2/entity/guid/abc")
+    assert client.make_request.call_count == 2
+
+    client.make_request.return_value = {"status": "error", "message": "boom"}
+    _request("GET", "/account/collections")
+    _request("GET", "/account/collections")
+    assert client.make_request.call_count == 4
+
+
+def test_family_ttl_zero_disables_caching(client, monkeypatch):
+    monkeypatch.setenv("PURVIEW_READ_CACHE_TTL_TYPEDEFS", "0")
+    _request("GET", TYPEDEFS)
+    _request("GET", TYPEDEFS)
+
+    assert client.make_request.call_count == 2
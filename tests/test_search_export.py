@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for the facet-partitioned search export engine."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import csv
+import json
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from purviewcli.cli.cli import main
+from purviewcli.client.search_export import SearchExporter, plan_partitions
+
+ASSETS = {
+    "azure_sql_table": [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}],
+    "azure_blob_path": [{"id": "3", "name": "c", "assetType": ["Blob"]}],
+}
+
+
+class FakeSearch:
+    """Search stand-in returning facet buckets and per-partition results"""
+
+    def __init__(self, fail_once=None):
+        self.fail_once = set(fail_once or ())
+        self.streamed = []
+
+    def searchQuery(self, args):
+        return {
+            "@search.facets": {
+                "entityType": [{"value": k, "count": len(v)} for k, v in ASSETS.items()]
+            }
+        }
+
+    def iter_search(self, filter=None, page_size=1000, keywords="*"):
+        value = filter.get("entityType") if isinstance(filter, dict) else None
+        self.streamed.append(value)
+        if value in self.fail_once:
+            self.fail_once.discard(value)
+            raise RuntimeError("HTTP 500")
+        return iter(ASSETS.get(value, []))
+
+
+def test_plan_partitions_adds_remainder_and_combines_base_filter():
+    partitions = plan_partitions(FakeSearch(), "entityType", base_filter={"collectionId": "c"})
+
+    assert [p["key"] for p in partitions] == [
+        "entityType=azure_sql_table",
+        "entityType=azure_blob_path",
+        "entityType=<other>",
+    ]
+    assert partitions[0]["filter"] == {"and": [{"collectionId": "c"}, {"entityType": "azure_sql_table"}]}
+    assert partitions[-1]["filter"]["and"][1] == {
+        "not": {"or": [{"entityType": "azure_sql_table"}, {"entityType": "azure_blob_path"}]}
+    }
+
+
+def test_export_merges_partitions_to_ndjson(tmp_path):
+    output = tmp_path / "catalog.ndjson"
+    summary = SearchExporter(FakeSearch(), output, max_parallel=3).run()
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [r["id"] for r in records] == ["1", "2", "3"]
+    assert summary["records"] == 3 and summary["failed"] == []
+    assert not (tmp_path / "catalog.ndjson.parts").exists()
+    assert not (tmp_path / "catalog.ndjson.manifest.json").exists()
+
+
+def test_csv_export_uses_column_union(tmp_path):
+    output = tmp_path / "catalog.csv"
+    SearchExporter(FakeSearch(), output, fmt="csv").run()
+
+    with open(output, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0].keys()) == ["id", "name", "assetType"]
+    assert rows[2]["assetType"] == '["Blob"]'
+
+
+def test_resume_only_reruns_failed_partitions(tmp_path):
+    output = tmp_path / "catalog.ndjson"
+    search = FakeSearch(fail_once={"azure_blob_path"})
+
+    first = SearchExporter(search, output).run()
+    assert first["failed"] == ["entityType=azure_blob_path"]
+    assert not output.exists()
+    manifest = json.loads((tmp_path / "catalog.ndjson.manifest.json").read_text())
+    assert [p["status"] for p in manifest["partitions"]] == ["done", "failed", "done"]
+
+    search.streamed.clear()
+    second = SearchExporter(search, output).run(resume=True)
+    assert search.streamed == ["azure_blob_path"]
+    assert second["records"] == 3
+
+
+def test_cli_export_writes_output(tmp_path):
+    output = tmp_path / "out.ndjson"
+    with patch("purviewcli.cli.search.Search", FakeSearch):
+        result = CliRunner().invoke(main, ["search", "export", "--output", str(output)])
+
+    assert result.exit_code == 0, result.output
+    assert len(output.read_text().splitlines()) == 3
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for continuation-token search streaming."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from purviewcli.cli.cli import main
+from purviewcli.client._search import Search
+
+PAGES = [
+    {"value": [{"id": "1"}, {"id": "2"}], "continuationToken": "t1"},
+    {"value": [{"id": "3"}], "continuationToken": "t2"},
+    {"value": []},
+]
+
+
+def _fake_pages():
+    sent = []
+
+    def fake_execute(request):
+        sent.append(request.payload)
+        return PAGES[len(sent) - 1]
+
+    return sent, fake_execute
+
+
+def test_iter_search_follows_continuation_tokens():
+    sent, fake_execute = _fake_pages()
+    with patch("purviewcli.client.endpoint.execute_request", side_effect=fake_execute):
+        ids = [r["id"] for r in Search().iter_search({"collectionId": "c"}, page_size=2)]
+
+    assert ids == ["1", "2", "3"]
+    assert [p.get("continuationToken") for p in sent] == [None, "t1", "t2"]
+    assert all("offset" not in p for p in sent)
+    assert sent[0]["filter"] == {"collectionId": "c"} and sent[0]["limit"] == 2
+
+
+def test_iter_search_is_lazy():
+    sent, fake_execute = _fake_pages()
+    with patch("purviewcli.client.endpoint.execute_request", side_effect=fake_execute):
+        results = Search().iter_search()
+        next(results)
+
+    assert len(sent) == 1
+
+
+def test_iter_search_raises_on_error_page():
+    with patch(
+        "purviewcli.client.endpoint.execute_request",
+        return_value={"status": "error", "message": "HTTP 400"},
+    ):
+        with pytest.raises(RuntimeError, match="HTTP 400"):
+            list(Search().iter_search())
+
+
+def test_query_stream_emits_ndjson(tmp_path):
+    filter_file = tmp_path / "filter.json"
+    filter_file.write_text(json.dumps({"entityType": "azure_sql_table"}))
+    sent, fake_execute = _fake_pages()
+
+    with patch("purviewcli.client.endpoint.execute_request", side_effect=fake_execute):
+        result = CliRunner().invoke(
+            main, ["search", "query", "--all", "--stream", "--filterFile", str(filter_file)]
+        )
+
+    assert result.exit_code == 0, result.output
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert lines == [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+    assert sent[0]["filter"] == {"entityType": "azure_sql_table"}
+
+
+def test_query_stream_keeps_errors_off_stdout():
+    pages = [PAGES[0], {"status": "error", "message": "HTTP 429"}]
+    with patch("purviewcli.client.endpoint.execute_request", side_effect=pages):
+        result = CliRunner().invoke(main, ["search", "query", "--stream"])
+
+    assert result.exit_code == 0, result.output
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert lines == [{"id": "1"}, {"id": "2"}]
+    assert "HTTP 429" in result.stderr
@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for coalescing identical concurrent requests."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import threading
+import time
+
+from purviewcli.client.singleflight import AsyncSingleFlight, SingleFlight, request_key
+
+
+def _run_concurrently(count, target):
+    results = [None] * count
+    errors = [None] * count
+
+    def worker(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    return threads, results, errors
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return {"guid": "g1", "attributes": {}}
+
+    threads, results, errors = _run_concurrently(4, lambda: flight.do("k", fetch))
+    while flight.shared < 3:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert calls == [1]
+    assert errors == [None] * 4
+    assert all(r == {"guid": "g1", "attributes": {}} for r in results)
+    # Every caller owns its copy
+    assert len({id(r) for r in results}) == 4
+    # Nothing is kept once the flight lands
+    flight.do("k", fetch)
+    assert calls == [1, 1]
+
+
+def test_followers_receive_the_leaders_exception():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fetch():
+        release.wait(5)
+        raise RuntimeError("HTTP 500")
+
+    threads, _, errors = _run_concurrently(3, lambda: flight.do("k", fetch))
+    while flight.shared < 2:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert all(isinstance(e, RuntimeError) for e in errors)
+
+
+def test_request_key_only_covers_reads_and_includes_params():
+    assert request_key("POST", "/entity") is None
+    assert request_key("get", "/entity/guid/g1", {"a": 1, "b": 2}) == request_key(
+        "GET", "/entity/guid/g1", {"b": 2, "a": 1}
+    )
+    assert request_key("GET", "/entity/guid/g1", {"minExtInfo": "true"}) != request_key("GET", "/entity/guid/g1")
+
+
+def test_async_singleflight_shares_one_task():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"guid": "g1"}
+
+    async def run():
+        return await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)), flight.do(None, fetch))
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 2
+    assert results == [{"guid": "g1"}] * 6
+    assert flight.shared == 4
+
+
+def test_sync_client_coalesces_gets_but_not_writes(sync_client, monkeypatch):
+    client = sync_client
+    release = threading.Event()
+    sent = []
+
+    def slow_request(method, endpoint, **kwargs):
+        sent.append(method)
+        release.wait(5)
+        return {"status": "success", "data": {"guid": "g1"}, "status_code": 200}
+
+    monkeypatch.setattr(client, "_make_request", slow_request)
+    endpoint = "/datamap/api/atlas/v2/entity/guid/g1"
+
+    threads, results, _ = _run_concurrently(3, lambda: client.make_request("GET", endpoint, params={}))
+    while client._inflight.shared < 2:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+    client.make_request("PUT", endpoint, json={"entity": {}})
+    client.make_request("PUT", endpoint, json={"entity": {}})
+
+    assert sent == ["GET", "PUT", "PUT"]
+    assert [r["data"] for r in results] == [{"guid": "g1"}] * 3
+
+
+def test_coalescing_can_be_disabled(sync_client, monkeypatch):
+    client = sync_client
+    monkeypatch.setenv("PURVIEW_DISABLE_REQUEST_COALESCING", "true")
+    monkeypatch.setattr(client._inflight, "do", lambda key, fn: (key, fn())[0])
+    monkeypatch.setattr(client, "_make_request", lambda *a, **k: {})
+
+    assert client.make_request("GET", "/datamap/api/atlas/v2/entity/guid/g1") is None
+
+
+def test_leader_mutating_its_result_does_not_reach_followers():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fetch():
+        release.wait(5)
+        return {"entity": {"attrs": [1, 2]}}
+
+    def leader():
+        result = flight.do("k", fetch)
+        result["entity"]["attrs"].clear()
+        result["mutated"] = True
+        return result
+
+    threads, results, _ = _run_concurrently(1, leader)
+    while "k" not in flight._calls:
+        time.sleep(0.001)
+    follower_threads, follower_results, _ = _run_concurrently(3, lambda: flight.do("k", fetch))
+    while flight.shared < 3:
+        time.sleep(0.001)
+    release.set()
+    for t in threads + follower_threads:
+        t.join()
+
+    assert results[0] == {"entity": {"attrs": []}, "mutated": True}
+    assert follower_results == [{"entity": {"attrs": [1, 2]}}] * 3
+
+
+def test_async_leader_mutating_its_result_does_not_reach_followers():
+    flight = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return {"attrs": [1, 2]}
+
+    async def leader():
+        result = await flight.do("k", fetch)
+        result["attrs"].clear()
+        return result
+
+    async def follower():
+        await asyncio.sleep(0)
+        result = await flight.do("k", fetch)
+        await asyncio.sleep(0.01)
+        return result
+
+    async def run():
+        return await asyncio.gather(leader(), follower(), follower())
+
+    leader_result, *follower_results = asyncio.run(run())
+
+    assert leader_result == {"attrs": []}
+    assert follower_results == [{"attrs": [1, 2]}] * 2
+    assert flight.shared == 2 and not flight._calls
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for the process-wide SyncPurviewClient pool used by endpoint.get_data."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from purviewcli.client import client_cache
+from purviewcli.client.endpoint import get_data
+
+
+@pytest.fixture(autouse=True)
+def _empty_pool():
+    client_cache.clear_sync_client_pool()
+    yield
+    client_cache.clear_sync_client_pool()
+
+
+@patch("purviewcli.client.client_cache.SyncPurviewClient")
+def test_same_account_reuses_one_client(mock_client_cls):
+    first = client_cache.get_sync_client("acct", "public", "id-1")
+    second = client_cache.get_sync_client("acct", "public", "id-1")
+
+    assert first is second
+    assert mock_client_cls.call_count == 1
+
+
+@patch("purviewcli.client.client_cache.SyncPurviewClient")
+def test_distinct_keys_get_distinct_clients(mock_client_cls):
+    mock_client_cls.side_effect = lambda config: MagicMock(config=config)
+
+    public = client_cache.get_sync_client("acct", "public", "id-1")
+    china = client_cache.get_sync_client("acct", "china", "id-1")
+    other_id = client_cache.get_sync_client("acct", "public", "id-2")
+
+    assert len({id(public), id(china), id(other_id)}) == 3
+    assert china.config.azure_region == "china"
+    assert client_cache.cache_stats()["pooled_http_clients"] == 3
+
+
+@patch("purviewcli.client.client_cache.SyncPurviewClient")
+def test_get_data_reuses_pooled_client(mock_client_cls, monkeypatch):
+    monkeypatch.setenv("PURVIEW_ACCOUNT_NAME", "acct")
+    monkeypatch.setenv("PURVIEW_ACCOUNT_ID", "id-1")
+    instance = mock_client_cls.return_value
+    instance.make_request.return_value = {"status": "success", "data": {"ok": True}}
+
+    for _ in range(5):
+        assert get_data({"method": "GET", "endpoint": "/types/typedefs"}) == {"ok": True}
+
+    assert mock_client_cls.call_count == 1
+    assert instance.make_request.call_count == 5
+
+
+@patch("purviewcli.client.client_cache.SyncPurviewClient")
+def test_clear_client_cache_drops_pool(mock_client_cls):
+    client_cache.get_sync_client("acct", "public", "id-1")
+    client_cache.clear_client_cache()
+
+    client_cache.get_sync_client("acct", "public", "id-1")
+    assert mock_client_cls.call_count == 2
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for the expiry-aware, persisted access token cache."""
+
+import sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import base64
+import json
+import time
+from unittest.mock import MagicMock
+
+from azure.core.credentials import AccessToken
+
+from purviewcli.client.token_cache import (
+    TOKEN_CACHE_FILE,
+    TOKEN_CACHE_KEY_FILE,
+    TokenCache,
+    identity_cache_key,
+    token_cache_key,
+)
+
+DM_KEY = token_cache_key("https://purview.azure.net/.default", "tenant", None)
+UC_KEY = token_cache_key("73c2949e-da2d-457a-9607-fcc665198967/.default", "tenant", None)
+
+
+def _token(value, lifetime=3600):
+    return AccessToken(token=value, expires_on=int(time.time()) + lifetime)
+
+
+def test_data_map_and_unified_catalog_tokens_are_kept_separately(tmp_path):
+    cache = TokenCache(cache_dir=tmp_path, persist=False)
+    cache.put(DM_KEY, _token("dm"))
+    cache.put(UC_KEY, _token("uc"))
+
+    assert cache.get(DM_KEY).token == "dm"
+    assert cache.get(UC_KEY).token == "uc"
+
+
+def test_token_inside_refresh_margin_is_refetched(tmp_path):
+    cache = TokenCache(cache_dir=tmp_path, refresh_margin_seconds=300, persist=False)
+    cache.put(DM_KEY, _token("about-to-expire", lifetime=60))
+    fetch = MagicMock(return_value=_token("fresh"))
+
+    assert cache.get_or_fetch(DM_KEY, fetch).token == "fresh"
+    assert cache.get_or_fetch(DM_KEY, fetch).token == "fresh"
+    assert fetch.call_count == 1
+
+
+def test_tokens_persist_encrypted_across_instances(tmp_path):
+    TokenCache(cache_dir=tmp_path, persist=True).put(DM_KEY, _token("secret-token"))
+
+    raw = (tmp_path / TOKEN_CACHE_FILE).read_bytes()
+    assert b"secret-token" not in raw
+
+    fetch = MagicMock()
+    reloaded = TokenCache(cache_dir=tmp_path, persist=True)
+    assert reloaded.get_or_fetch(DM_KEY, fetch).token == "secret-token"
+    fetch.assert_not_called()
+
+
+def test_invalidate_and_corrupt_file_are_handled(tmp_path):
+    cache = TokenCache(cache_dir=tmp_path, persist=True)
+    cache.put(DM_KEY, _token("dm"))
+    cache.invalidate(DM_KEY)
+    assert TokenCache(cache_dir=tmp_path, persist=True).get(DM_KEY) is None
+
+    (tmp_path / TOKEN_CACHE_FILE).write_bytes(b"not-a-fernet-payload")
+    assert TokenCache(cache_dir=tmp_path, persist=True).get(DM_KEY) is None
+
+
+def _jwt(**claims):
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+def _login(tmp_path, user, tenant):
+    profile = {"subscriptions": [{"isDefault": True, "tenantId": tenant, "user": {"name": user, "type": "user"}}]}
+    (tmp_path / "azureProfile.json").write_text(json.dumps(profile), encoding="utf-8-sig")
+    # Distinct mtimes so the profile is re-read after every login
+    os.utime(tmp_path / "azureProfile.json", ns=(time.time_ns(), time.time_ns() + len(user) + len(tenant)))
+
+
+def test_cli_tokens_are_keyed_and_checked_by_signed_in_account(monkeypatch, tmp_path):
+    monkeypatch.setenv("AZURE_CONFIG_DIR", str(tmp_path))
+    for name in ("AZURE_CLIENT_SECRET", "AZURE_TENANT_ID"):
+        monkeypatch.delenv(name, raising=False)
+    scope = "https://purview.azure.net/.default"
+    cache_dir = tmp_path / "cache"
+
+    _login(tmp_path, "alice@contoso.com", "t1")
+    alice_key, persist_if = identity_cache_key(scope)
+    alice_token = AccessToken(_jwt(tid="t1", upn="Alice@contoso.com"), int(time.time()) + 3600)
+    assert persist_if(alice_token)
+    assert not persist_if(AccessToken(_jwt(tid="t2", upn="alice@contoso.com"), 0))
+    TokenCache(cache_dir=cache_dir, persist=True).get_or_fetch(alice_key, lambda: alice_token, persist_if)
+
+    _login(tmp_path, "bob@fabrikam.com", "t2")
+    bob_key, _ = identity_cache_key(scope)
+    assert bob_key != alice_key
+    assert TokenCache(cache_dir=cache_dir, persist=True).get(bob_key) is None
+    assert TokenCache(cache_dir=cache_dir, persist=True).get(alice_key).token == alice_token.token
+
+
+def test_tokens_without_a_verifiable_principal_stay_in_memory(monkeypatch, tmp_path):
+    monkeypatch.setenv("AZURE_CONFIG_DIR", str(tmp_path / "no-az"))
+    monkeypatch.delenv("AZURE_CLIENT_SECRET", raising=False)
+    key, persist_if = identity_cache_key("https://purview.azure.net/.default")
+    cache = TokenCache(cache_dir=tmp_path, persist=True)
+
+    assert cache.get_or_fetch(key, lambda: _token("managed-identity"), persist_if).token == "managed-identity"
+    assert cache.get(key).token == "managed-identity"
+    assert TokenCache(cache_dir=tmp_path, persist=True).get(key) is None
+
+
+def test_encryption_key_is_created_once(tmp_path):
+    first = TokenCache(cache_dir=tmp_path, persist=True)
+    second = TokenCache(cache_dir=tmp_path, persist=True)
+    key = first._fernet()._signing_key
+
+    assert second._fernet()._signing_key == key
+    assert [p.name for p in tmp_path.iterdir()] == [TOKEN_CACHE_KEY_FILE]
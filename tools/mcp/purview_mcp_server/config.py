@@ -26,6 +26,8 @@ class PurviewMCPConfig:
     max_retries: int
     timeout: int
     batch_size: int
+    # Worker threads for tools backed by the synchronous clients
+    sync_workers: int
 
     # --- MCP server / transport settings ---
     transport: Transport
@@ -55,6 +57,7 @@ class PurviewMCPConfig:
             max_retries=_as_int(os.getenv("PURVIEW_MAX_RETRIES"), 3, "PURVIEW_MAX_RETRIES"),
             timeout=_as_int(os.getenv("PURVIEW_TIMEOUT"), 30, "PURVIEW_TIMEOUT"),
             batch_size=_as_int(os.getenv("PURVIEW_BATCH_SIZE"), 100, "PURVIEW_BATCH_SIZE"),
+            sync_workers=max(1, _as_int(os.getenv("PURVIEW_MCP_SYNC_WORKERS"), 16, "PURVIEW_MCP_SYNC_WORKERS")),
             transport=typed_transport,
             host=os.getenv("PURVIEW_MCP_HOST", "127.0.0.1").strip(),
             port=_as_int(os.getenv("PURVIEW_MCP_PORT"), 8000, "PURVIEW_MCP_PORT"),
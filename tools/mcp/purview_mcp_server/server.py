@@ -8,11 +8,17 @@ but with cleaner code, automatic validation, and better developer experience.
 
 """
 
+import asyncio
+import functools
+import hashlib
 import inspect
+import json
 import logging
 import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
@@ -20,6 +26,7 @@ from fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
 from .config import PurviewMCPConfig
+from .__version__ import __version__
 from purviewcli.client.api_client import PurviewClient, PurviewConfig
 from purviewcli.client import (
     Entity,
@@ -40,6 +47,7 @@ from purviewcli.client._policystore import Policystore
 from purviewcli.client._workflow import Workflow
 from purviewcli.client._share import Share
 from purviewcli.client._health import Health
+from purviewcli.client.config import get_config_dir
 
 def _load_instructions() -> str:
     """Load MCP server instructions from PROMPT_INSTRUCTIONS.md."""
@@ -59,6 +67,14 @@ mcp = FastMCP(
 
 # Global client instance
 _purview_client: Optional[PurviewClient] = None
+_purview_client_lock: Optional[asyncio.Lock] = None
+
+# Synchronous (requests-based) clients are shared across tool calls, one per
+# client class, and run on a bounded thread pool so a slow Purview call never
+# blocks the event loop that serves concurrent tool invocations.
+_sync_clients: Dict[type, Any] = {}
+_sync_clients_lock = threading.Lock()
+_sync_executor: Optional[ThreadPoolExecutor] = None
 
 
 # Pydantic Models for Request Validation
@@ -120,14 +136,58 @@ def get_prompt_instructions() -> str:
 
 async def get_client() -> PurviewClient:
     """Get or initialize Purview client"""
-    global _purview_client
+    global _purview_client, _purview_client_lock
     if _purview_client is None:
-        config = get_config()
-        _purview_client = PurviewClient(config)
-        await _purview_client.__aenter__()
+        if _purview_client_lock is None:
+            _purview_client_lock = asyncio.Lock()
+        async with _purview_client_lock:
+            if _purview_client is None:
+                client = PurviewClient(get_config())
+                await client.__aenter__()
+                _purview_client = client
     return _purview_client
 
 
+def _get_sync_client(factory: Any) -> Any:
+    """Get the shared instance of a synchronous client class."""
+    client = _sync_clients.get(factory)
+    if client is None:
+        with _sync_clients_lock:
+            client = _sync_clients.get(factory)
+            if client is None:
+                client = _sync_clients[factory] = factory()
+    return client
+
+
+def _get_sync_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs synchronous client calls."""
+    global _sync_executor
+    if _sync_executor is None:
+        with _sync_clients_lock:
+            if _sync_executor is None:
+                _sync_executor = ThreadPoolExecutor(
+                    max_workers=PurviewMCPConfig.from_env().sync_workers,
+                    thread_name_prefix="purview-mcp",
+                )
+    return _sync_executor
+
+
+async def _run_sync(func: Any, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call on the sync thread pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_sync_executor(), functools.partial(func, *args, **kwargs))
+
+
+def _offload_sync(func: Any) -> Any:
+    """Expose a blocking tool implementation as a coroutine run on the thread pool."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return await _run_sync(func, *args, **kwargs)
+
+    return wrapper
+
+
 # ============================================================================
 # ENTITY OPERATIONS
 # ============================================================================
@@ -454,7 +514,7 @@ def _mcp_extract_error_message(response: Any) -> str:
 
 def _mcp_resolve_business_metadata_definition_name(name: str) -> Dict[str, Any]:
     """Resolve a user-provided name to a business metadata definition name."""
-    uc_client = UnifiedCatalogClient()
+    uc_client = _get_sync_client(UnifiedCatalogClient)
     response = uc_client.list_custom_metadata({})
 
     groups = []
@@ -523,16 +583,18 @@ def _mcp_delete_business_metadata_definition(types_client: Types, name: str) ->
 
 
 @mcp.tool()
+@_offload_sync
 def uc_list_custom_metadata_defs() -> Dict[str, Any]:
     """List business metadata definitions and attributes."""
-    uc_client = UnifiedCatalogClient()
+    uc_client = _get_sync_client(UnifiedCatalogClient)
     return uc_client.list_custom_metadata({})
 
 
 @mcp.tool()
+@_offload_sync
 def uc_delete_metadata_from_asset(asset_id: str, group: str) -> Dict[str, Any]:
     """Remove a business metadata group assignment from a specific asset."""
-    uc_client = UnifiedCatalogClient()
+    uc_client = _get_sync_client(UnifiedCatalogClient)
     args = {
         "--asset-id": [asset_id],
         "--group": [group],
@@ -547,6 +609,7 @@ def uc_delete_metadata_from_asset(asset_id: str, group: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
+@_offload_sync
 def uc_delete_metadata_definition(
     name: str,
     dry_run: bool = False,
@@ -573,7 +636,7 @@ def uc_delete_metadata_definition(
             "message": "Would delete business metadata definition",
         }
 
-    types_client = Types()
+    types_client = _get_sync_client(Types)
     response = _mcp_delete_business_metadata_definition(types_client, resolved_name)
 
     if isinstance(response, dict) and response.get("status") == "error":
@@ -596,6 +659,7 @@ def uc_delete_metadata_definition(
 
 
 @mcp.tool()
+@_offload_sync
 def uc_cleanup_metadata_definition(
     name: str,
     check_only: bool = False,
@@ -616,7 +680,7 @@ def uc_cleanup_metadata_definition(
         resolved_name = resolution["resolved_name"]
         resolution_note = resolution.get("note")
 
-    types_client = Types()
+    types_client = _get_sync_client(Types)
 
     read_args = {"--name": resolved_name}
     definition = types_client.typesReadBusinessMetadataDefByName(read_args)
@@ -675,6 +739,7 @@ def uc_cleanup_metadata_definition(
     }
 
 @mcp.tool()
+@_offload_sync
 def uc_list_domains() -> Dict[str, Any]:
     """
     List all governance domains in the Unified Catalog.
@@ -684,11 +749,12 @@ def uc_list_domains() -> Dict[str, Any]:
     Returns:
         List of governance domains
     """
-    uc_client = UnifiedCatalogClient()
+    uc_client = _get_sync_client(UnifiedCatalogClient)
     return uc_client.get_governance_domains({})
 
 
 @mcp.tool()
+@_offload_sync
 def uc_get_domain(domain_id: str) -> Dict[str, Any]:
     """
     Get detailed information about a specific governance domain by ID.
@@ -699,11 +765,12 @@ def uc_get_domain(domain_id: str) -> Dict[str, Any]:
     Returns:
         Governance domain details
     """
-    uc_client = UnifiedCatalogClient()
+    uc_client = _get_sync_client(UnifiedCatalogClient)
     return uc_client.get_governance_domain_by_id({"--domain-id": domain_id})
 
 
 @mcp.tool()
+@_offload_sync
 def uc_create_domain(
     name: str,
     description: Optional[str] = None,
@@ -722,7 +789,7 @@ def uc_create_domain(
     Returns:
         Created governance domain
     """
-    uc_client = UnifiedCatalogClient()
+    uc_client = _get_sync_client(UnifiedCatalogClient)
     args = {
         "--name": name,
         "--description": description,
@@ -732,6 +799,7 @@ def uc_create_domain(
 
 
 @mcp.tool()
+@_offload_sync
 def uc_list_terms(domain_id: str) -> Dict[str, Any]:
     """
     List all business metadata terms in a governance domain.
@@ -744,11 +812,12 @@ def uc_list_terms(domain_id: str) -> Dict[str, Any]:
     Returns:
         List of business metadata terms
     """
-    uc_client = UnifiedCatalogClient()
+    uc_client = _get_sync_client(UnifiedCatalogClient)
     return uc_client.get_terms({"--governance-domain-id": [domain_id]})
 
 
 @mcp.tool()
+@_offload_sync
 def uc_get_term(domain_id: str, term_id: str) -> Dict[str, Any]:
     """
     Get detailed information about a specific business metadata term.
@@ -760,7 +829,7 @@ def uc_get_term(domain_id: str, term_id: str) -> Dict[str, Any]:
     Returns:
         Business metadata term details
     """
-    uc_client = UnifiedCatalogClient()
+    uc_client = _get_sync_client(UnifiedCatalogClient)
     args = {
         "--governance-domain-id": domain_id,
         "--term-id": term_id,
@@ -769,6 +838,7 @@ def uc_get_term(domain_id: str, term_id: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
+@_offload_sync
 def uc_create_term(
     domain_id: str,
     name: str,
@@ -791,7 +861,7 @@ def uc_create_term(
     Returns:
         Created business metadata term
     """
-    uc_client = UnifiedCatalogClient()
+    uc_client = _get_sync_client(UnifiedCatalogClient)
     args = {
         "--governance-domain-id": domain_id,
         "--name": name,
@@ -806,6 +876,7 @@ def uc_create_term(
 
 
 @mcp.tool()
+@_offload_sync
 def uc_search_terms(search_query: str, limit: int = 50) -> Dict[str, Any]:
     """
     Search for business metadata terms across all domains.
@@ -820,7 +891,7 @@ def uc_search_terms(search_query: str, limit: int = 50) -> Dict[str, Any]:
         Search results with matching terms
     """
     # Use general search for now - UC doesn't have dedicated term search yet
-    uc_client = UnifiedCatalogClient()
+    uc_client = _get_sync_client(UnifiedCatalogClient)
     # Get all terms and filter locally
     all_terms = uc_client.get_terms({"--governance-domain-id": [""]})
     
@@ -842,6 +913,7 @@ def uc_search_terms(search_query: str, limit: int = 50) -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_offload_sync
 def search_suggest(keywords: str, limit: int = 5) -> Dict[str, Any]:
     """
     Get search suggestions/autocomplete for a query string.
@@ -855,7 +927,7 @@ def search_suggest(keywords: str, limit: int = 5) -> Dict[str, Any]:
     Returns:
         Search suggestions
     """
-    search_client = Search()
+    search_client = _get_sync_client(Search)
     args = {
         "--keywords": keywords,
         "--limit": limit,
@@ -864,6 +936,7 @@ def search_suggest(keywords: str, limit: int = 5) -> Dict[str, Any]:
 
 
 @mcp.tool()
+@_offload_sync
 def search_browse(
     entity_type: str,
     path: Optional[str] = None,
@@ -882,7 +955,7 @@ def search_browse(
     Returns:
         Browse results with aggregations
     """
-    search_client = Search()
+    search_client = _get_sync_client(Search)
     args = {
         "--entityType": entity_type,
         "--path": path,
@@ -896,6 +969,7 @@ def search_browse(
 # ============================================================================
 
 @mcp.tool()
+@_offload_sync
 def get_typedef(type_name: str) -> Dict[str, Any]:
     """
     Get type definition by name.
@@ -908,12 +982,13 @@ def get_typedef(type_name: str) -> Dict[str, Any]:
     Returns:
         Type definition schema
     """
-    types_client = Types()
+    types_client = _get_sync_client(Types)
     args = {"--name": type_name}
     return types_client.typesRead(args)
 
 
 @mcp.tool()
+@_offload_sync
 def list_typedefs(type_category: Optional[str] = None) -> Dict[str, Any]:
     """
     List all type definitions in Purview.
@@ -926,7 +1001,7 @@ def list_typedefs(type_category: Optional[str] = None) -> Dict[str, Any]:
     Returns:
         List of type definitions
     """
-    types_client = Types()
+    types_client = _get_sync_client(Types)
     args = {"--type": type_category}
     return types_client.typesList(args)
 
@@ -936,6 +1011,7 @@ def list_typedefs(type_category: Optional[str] = None) -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_offload_sync
 def create_relationship(relationship_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a relationship between two entities.
@@ -948,7 +1024,7 @@ def create_relationship(relationship_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Created relationship
     """
-    relationship_client = Relationship()
+    relationship_client = _get_sync_client(Relationship)
     args = {
         "--typeName": relationship_data.get("typeName"),
         "--end1": relationship_data.get("end1"),
@@ -958,6 +1034,7 @@ def create_relationship(relationship_data: Dict[str, Any]) -> Dict[str, Any]:
 
 
 @mcp.tool()
+@_offload_sync
 def get_relationship(relationship_guid: str) -> Dict[str, Any]:
     """
     Get relationship details by GUID.
@@ -968,12 +1045,13 @@ def get_relationship(relationship_guid: str) -> Dict[str, Any]:
     Returns:
         Relationship details
     """
-    relationship_client = Relationship()
+    relationship_client = _get_sync_client(Relationship)
     args = {"--guid": relationship_guid}
     return relationship_client.relationshipRead(args)
 
 
 @mcp.tool()
+@_offload_sync
 def delete_relationship(relationship_guid: str) -> Dict[str, Any]:
     """
     Delete a relationship between entities.
@@ -984,7 +1062,7 @@ def delete_relationship(relationship_guid: str) -> Dict[str, Any]:
     Returns:
         Deletion confirmation
     """
-    relationship_client = Relationship()
+    relationship_client = _get_sync_client(Relationship)
     args = {"--guid": relationship_guid}
     return relationship_client.relationshipDelete(args)
 
@@ -1211,6 +1289,109 @@ def _build_operation_catalog() -> Dict[str, Any]:
     return catalog
 
 
+# The catalog only changes with the client code, so it is built once per process
+# and persisted next to the CLI config, keyed by package version and a
+# fingerprint of the client modules (which also covers editable installs).
+_OPERATION_CATALOG_FILE = "mcp_operation_catalog.json"
+_operation_catalog: Optional[Dict[str, Any]] = None
+_operation_index: Dict[str, Dict[str, str]] = {}
+_operation_catalog_lock = threading.Lock()
+
+
+def _operation_catalog_fingerprint() -> str:
+    """
+    Fingerprint the package version, this module (which builds and filters the
+    catalog) and every module defining a client class or one of its bases.
+    """
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    sources = {PurviewClient} | {
+        info["factory"] for info in _CLIENT_OPERATION_NAMESPACES.values() if info["factory"]
+    }
+    classes = {base for cls in sources for base in inspect.getmro(cls) if base is not object}
+    module_files = {getattr(sys.modules.get(cls.__module__), "__file__", "") or "" for cls in classes}
+    module_files.add(os.path.abspath(__file__))
+    for module_file in sorted(module_files):
+        try:
+            stat = os.stat(module_file)
+            digest.update(f"{module_file}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+        except OSError:
+            digest.update(module_file.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _load_persisted_operation_catalog(path: Path, fingerprint: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return None
+    catalog = data.get("catalog")
+    return catalog if isinstance(catalog, dict) else None
+
+
+def _persist_operation_catalog(path: Path, fingerprint: str, catalog: Dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": __version__, "fingerprint": fingerprint, "catalog": catalog}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.debug(f"Could not persist MCP operation catalog: {e}")
+
+
+def _index_operation_catalog(catalog: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Map method names, tool names and snake_case names to method names per namespace."""
+    index: Dict[str, Dict[str, str]] = {}
+    for namespace, entry in catalog.items():
+        names = index[namespace] = {}
+        for operation in entry["operations"]:
+            method_name = operation["method_name"]
+            names.setdefault(operation["tool_name"], method_name)
+            names.setdefault(_to_snake_case(method_name), method_name)
+        # Exact method names take precedence over derived aliases
+        for operation in entry["operations"]:
+            names[operation["method_name"]] = operation["method_name"]
+    return index
+
+
+def _get_operation_catalog() -> Dict[str, Any]:
+    """Get the operation catalog, building (or loading) it on first use."""
+    global _operation_catalog, _operation_index
+    if _operation_catalog is None:
+        with _operation_catalog_lock:
+            if _operation_catalog is None:
+                persist = os.getenv("PURVIEW_MCP_CATALOG_CACHE", "true").lower() != "false"
+                fingerprint = _operation_catalog_fingerprint()
+                path = Path(get_config_dir()) / _OPERATION_CATALOG_FILE
+                catalog = _load_persisted_operation_catalog(path, fingerprint) if persist else None
+                if catalog is None:
+                    catalog = _build_operation_catalog()
+                    if persist:
+                        _persist_operation_catalog(path, fingerprint, catalog)
+                _operation_index = _index_operation_catalog(catalog)
+                _operation_catalog = catalog
+    return _operation_catalog
+
+
+def _resolve_operation_name(namespace: str, name: str) -> str:
+    """Resolve a method name, tool name or snake_case alias to the client method name."""
+    _get_operation_catalog()
+    if namespace not in _operation_index:
+        raise ValueError(
+            f"Unknown namespace '{namespace}'. Available namespaces: {', '.join(sorted(_operation_index))}"
+        )
+    method_name = _operation_index[namespace].get(name)
+    if method_name is None:
+        raise ValueError(
+            f"Namespace '{namespace}' does not expose method '{name}'. "
+            f"Use list_available_operations() to inspect the current surface."
+        )
+    return method_name
+
+
 def _invoke_method(method: Any, arguments: Any) -> Any:
     """Invoke a client method using the argument style it expects."""
     if arguments is None:
@@ -1242,7 +1423,7 @@ async def _resolve_namespace_client(namespace: str) -> Any:
         return await get_client()
 
     factory = _CLIENT_OPERATION_NAMESPACES[namespace]["factory"]
-    return factory()
+    return _get_sync_client(factory)
 
 
 @mcp.tool()
@@ -1252,7 +1433,7 @@ def list_available_operations(namespace: Optional[str] = None) -> Dict[str, Any]
 
     Use this when you need the full operation surface instead of the curated MCP tools.
     """
-    catalog = _build_operation_catalog()
+    catalog = _get_operation_catalog()
     if namespace:
         if namespace not in catalog:
             raise ValueError(
@@ -1271,18 +1452,16 @@ async def invoke_operation(
     """
     Invoke any public Purview client method by namespace and method name.
 
+    `method_name` may also be the `tool_name` reported by list_available_operations.
     The `arguments` payload can be an object, a list, or a single scalar value depending on the method.
     """
+    resolved_name = _resolve_operation_name(namespace, method_name)
     client = await _resolve_namespace_client(namespace)
-
-    if not hasattr(client, method_name):
-        raise ValueError(
-            f"Namespace '{namespace}' does not expose method '{method_name}'. "
-            f"Use list_available_operations() to inspect the current surface."
-        )
-
-    method = getattr(client, method_name)
-    result = _invoke_method(method, arguments)
+    method = getattr(client, resolved_name)
+    if _CLIENT_OPERATION_NAMESPACES[namespace]["use_async_client"]:
+        result = _invoke_method(method, arguments)
+    else:
+        result = await _run_sync(_invoke_method, method, arguments)
     if inspect.isawaitable(result):
         result = await result
     return result
@@ -1293,22 +1472,25 @@ async def invoke_operation(
 # ============================================================================
 
 @mcp.tool()
+@_offload_sync
 def list_data_sources() -> Dict[str, Any]:
     """List all registered data sources in Purview."""
-    return ScanClient().scanDataSourcesRead({})
+    return _get_sync_client(ScanClient).scanDataSourcesRead({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_data_source(data_source_name: str) -> Dict[str, Any]:
     """Get details of a specific registered data source.
 
     Args:
         data_source_name: The name of the data source
     """
-    return ScanClient().scanDataSourceRead({"--dataSourceName": data_source_name})
+    return _get_sync_client(ScanClient).scanDataSourceRead({"--dataSourceName": data_source_name})
 
 
 @mcp.tool()
+@_offload_sync
 def create_data_source(data_source_name: str, data_source_data: Dict[str, Any]) -> Dict[str, Any]:
     """Register a new data source for scanning.
 
@@ -1316,31 +1498,33 @@ def create_data_source(data_source_name: str, data_source_data: Dict[str, Any])
         data_source_name: Unique name for the data source
         data_source_data: Data source definition (kind, properties, collection)
     """
-    return ScanClient().scanDataSourceCreate({"--dataSourceName": data_source_name, "--payload": data_source_data})
+    return _get_sync_client(ScanClient).scanDataSourceCreate({"--dataSourceName": data_source_name, "--payload": data_source_data})
 
 
 @mcp.tool()
+@_offload_sync
 def delete_data_source(data_source_name: str) -> Dict[str, Any]:
     """Delete a registered data source.
 
     Args:
         data_source_name: Name of the data source to delete
     """
-    return ScanClient().scanDataSourceDelete({"--dataSourceName": data_source_name})
+    return _get_sync_client(ScanClient).scanDataSourceDelete({"--dataSourceName": data_source_name})
 
 
 @mcp.tool()
+@_offload_sync
 def list_scans(data_source_name: str) -> Dict[str, Any]:
     """List all scans configured for a data source.
 
     Args:
         data_source_name: The name of the data source
     """
-    from purviewcli.client._scan import Scan as _Scan
-    return _Scan().scanRead({"--dataSourceName": data_source_name})
+    return _get_sync_client(ScanClient).scanRead({"--dataSourceName": data_source_name})
 
 
 @mcp.tool()
+@_offload_sync
 def run_scan(data_source_name: str, scan_name: str, scan_level: str = "Full") -> Dict[str, Any]:
     """Trigger a scan run for a data source.
 
@@ -1349,10 +1533,11 @@ def run_scan(data_source_name: str, scan_name: str, scan_level: str = "Full") ->
         scan_name: The name of the scan to run
         scan_level: Scan level: Full or Incremental (default: Full)
     """
-    return ScanClient().scanRun({"--dataSourceName": data_source_name, "--scanName": scan_name, "--scanLevel": scan_level})
+    return _get_sync_client(ScanClient).scanRun({"--dataSourceName": data_source_name, "--scanName": scan_name, "--scanLevel": scan_level})
 
 
 @mcp.tool()
+@_offload_sync
 def get_scan_history(data_source_name: str, scan_name: str) -> Dict[str, Any]:
     """Get the run history of a scan.
 
@@ -1360,13 +1545,14 @@ def get_scan_history(data_source_name: str, scan_name: str) -> Dict[str, Any]:
         data_source_name: The name of the data source
         scan_name: The name of the scan
     """
-    return ScanClient().scanReadHistory({"--dataSourceName": data_source_name, "--scanName": scan_name})
+    return _get_sync_client(ScanClient).scanReadHistory({"--dataSourceName": data_source_name, "--scanName": scan_name})
 
 
 @mcp.tool()
+@_offload_sync
 def list_scan_rulesets() -> Dict[str, Any]:
     """List all custom scan rulesets defined in the account."""
-    return ScanClient().scanReadRuleset({})
+    return _get_sync_client(ScanClient).scanReadRuleset({})
 
 
 # ============================================================================
@@ -1374,51 +1560,59 @@ def list_scan_rulesets() -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_offload_sync
 def get_asset_distribution() -> Dict[str, Any]:
     """Get asset counts distributed by type, classification, and collection."""
-    return Insight().insightAssetDistribution({})
+    return _get_sync_client(Insight).insightAssetDistribution({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_asset_distribution_by_type() -> Dict[str, Any]:
     """Get asset counts grouped by entity type."""
-    return Insight().insightAssetDistributionByType({})
+    return _get_sync_client(Insight).insightAssetDistributionByType({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_asset_distribution_by_classification() -> Dict[str, Any]:
     """Get asset counts grouped by classification label."""
-    return Insight().insightAssetDistributionByClassification({})
+    return _get_sync_client(Insight).insightAssetDistributionByClassification({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_scan_status_summary() -> Dict[str, Any]:
     """Get a summary of recent scan statuses across all data sources."""
-    return Insight().insightScanStatusSummary({})
+    return _get_sync_client(Insight).insightScanStatusSummary({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_tags_summary() -> Dict[str, Any]:
     """Get a summary of classification/tag usage across the catalog."""
-    return Insight().insightTags({})
+    return _get_sync_client(Insight).insightTags({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_data_quality_overview() -> Dict[str, Any]:
     """Get a high-level overview of data quality scores across the account."""
-    return Insight().insightDataQualityOverview({})
+    return _get_sync_client(Insight).insightDataQualityOverview({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_lineage_coverage() -> Dict[str, Any]:
     """Get lineage coverage statistics showing how many assets have tracked lineage."""
-    return Insight().insightLineageCoverage({})
+    return _get_sync_client(Insight).insightLineageCoverage({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_glossary_usage() -> Dict[str, Any]:
     """Get statistics on glossary term assignment coverage across assets."""
-    return Insight().insightGlossaryUsage({})
+    return _get_sync_client(Insight).insightGlossaryUsage({})
 
 
 # ============================================================================
@@ -1426,27 +1620,31 @@ def get_glossary_usage() -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_offload_sync
 def get_account_details() -> Dict[str, Any]:
     """Get full details of the Purview account including configuration and status."""
-    return Account().accountRead({})
+    return _get_sync_client(Account).accountRead({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_account_usage() -> Dict[str, Any]:
     """Get current resource usage statistics for the Purview account."""
-    return Account().accountReadUsage({})
+    return _get_sync_client(Account).accountReadUsage({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_account_limits() -> Dict[str, Any]:
     """Get resource limits and quotas for the Purview account."""
-    return Account().accountReadLimits({})
+    return _get_sync_client(Account).accountReadLimits({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_account_access_keys() -> Dict[str, Any]:
     """Get the access keys for the Purview account (Atlas API authentication)."""
-    return Account().accountReadAccessKeys({})
+    return _get_sync_client(Account).accountReadAccessKeys({})
 
 
 # ============================================================================
@@ -1454,38 +1652,43 @@ def get_account_access_keys() -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_offload_sync
 def list_workflows() -> Dict[str, Any]:
     """List all approval workflows defined in the Purview account."""
-    return Workflow().workflowListWorkflows({})
+    return _get_sync_client(Workflow).workflowListWorkflows({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_workflow(workflow_id: str) -> Dict[str, Any]:
     """Get details of a specific workflow.
 
     Args:
         workflow_id: The workflow ID
     """
-    return Workflow().workflowGetWorkflow({"--workflow-id": workflow_id})
+    return _get_sync_client(Workflow).workflowGetWorkflow({"--workflow-id": workflow_id})
 
 
 @mcp.tool()
+@_offload_sync
 def list_workflow_runs(workflow_id: str) -> Dict[str, Any]:
     """List all execution runs for a workflow.
 
     Args:
         workflow_id: The workflow ID
     """
-    return Workflow().workflowGetWorkflowRuns({"--workflow-id": workflow_id})
+    return _get_sync_client(Workflow).workflowGetWorkflowRuns({"--workflow-id": workflow_id})
 
 
 @mcp.tool()
+@_offload_sync
 def get_approval_requests() -> Dict[str, Any]:
     """List all pending approval requests requiring action."""
-    return Workflow().workflowGetApprovalRequests({})
+    return _get_sync_client(Workflow).workflowGetApprovalRequests({})
 
 
 @mcp.tool()
+@_offload_sync
 def approve_workflow_request(request_id: str, comment: Optional[str] = None) -> Dict[str, Any]:
     """Approve a pending workflow approval request.
 
@@ -1496,10 +1699,11 @@ def approve_workflow_request(request_id: str, comment: Optional[str] = None) ->
     args: Dict[str, Any] = {"--request-id": request_id}
     if comment:
         args["--comment"] = comment
-    return Workflow().workflowApproveRequest(args)
+    return _get_sync_client(Workflow).workflowApproveRequest(args)
 
 
 @mcp.tool()
+@_offload_sync
 def reject_workflow_request(request_id: str, comment: Optional[str] = None) -> Dict[str, Any]:
     """Reject a pending workflow approval request.
 
@@ -1510,13 +1714,14 @@ def reject_workflow_request(request_id: str, comment: Optional[str] = None) -> D
     args: Dict[str, Any] = {"--request-id": request_id}
     if comment:
         args["--comment"] = comment
-    return Workflow().workflowRejectRequest(args)
+    return _get_sync_client(Workflow).workflowRejectRequest(args)
 
 
 @mcp.tool()
+@_offload_sync
 def list_workflow_templates() -> Dict[str, Any]:
     """List all available workflow templates for creating new workflows."""
-    return Workflow().workflowListWorkflowTemplates({})
+    return _get_sync_client(Workflow).workflowListWorkflowTemplates({})
 
 
 # ============================================================================
@@ -1524,37 +1729,42 @@ def list_workflow_templates() -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_offload_sync
 def list_data_access_policies() -> Dict[str, Any]:
     """List all data access policies defined in the Purview policy store."""
-    return Policystore().policystoreListDataAccessPolicies({})
+    return _get_sync_client(Policystore).policystoreListDataAccessPolicies({})
 
 
 @mcp.tool()
+@_offload_sync
 def list_metadata_policies() -> Dict[str, Any]:
     """List all metadata policies (collection-level role assignments)."""
-    return Policystore().policystoreReadMetadataPolicies({})
+    return _get_sync_client(Policystore).policystoreReadMetadataPolicies({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_metadata_policy(policy_id: str) -> Dict[str, Any]:
     """Get a specific metadata policy by ID.
 
     Args:
         policy_id: The metadata policy ID
     """
-    return Policystore().policystoreReadMetadataPolicy({"--policy-id": policy_id})
+    return _get_sync_client(Policystore).policystoreReadMetadataPolicy({"--policy-id": policy_id})
 
 
 @mcp.tool()
+@_offload_sync
 def list_metadata_roles() -> Dict[str, Any]:
     """List all available metadata roles that can be assigned in policies."""
-    return Policystore().policystoreReadMetadataRoles({})
+    return _get_sync_client(Policystore).policystoreReadMetadataRoles({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_user_permissions() -> Dict[str, Any]:
     """Get the effective permissions for the currently authenticated user."""
-    return Policystore().policystoreGetUserPermissions({})
+    return _get_sync_client(Policystore).policystoreGetUserPermissions({})
 
 
 # ============================================================================
@@ -1562,12 +1772,14 @@ def get_user_permissions() -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_offload_sync
 def get_health_summary() -> Dict[str, Any]:
     """Get a summary of Purview account health and service status."""
-    return Health().get_health_summary({})
+    return _get_sync_client(Health).get_health_summary({})
 
 
 @mcp.tool()
+@_offload_sync
 def query_health_actions(
     filter_status: Optional[str] = None,
     filter_type: Optional[str] = None
@@ -1583,7 +1795,7 @@ def query_health_actions(
         args["--status"] = filter_status
     if filter_type:
         args["--type"] = filter_type
-    return Health().query_health_actions(args)
+    return _get_sync_client(Health).query_health_actions(args)
 
 
 # ============================================================================
@@ -1591,51 +1803,57 @@ def query_health_actions(
 # ============================================================================
 
 @mcp.tool()
+@_offload_sync
 def list_sent_shares() -> Dict[str, Any]:
     """List all data shares you have sent to other recipients."""
-    return Share().shareListSentShares({})
+    return _get_sync_client(Share).shareListSentShares({})
 
 
 @mcp.tool()
+@_offload_sync
 def list_received_shares() -> Dict[str, Any]:
     """List all data shares you have received from other senders."""
-    return Share().shareListReceivedShares({})
+    return _get_sync_client(Share).shareListReceivedShares({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_sent_share(sent_share_id: str) -> Dict[str, Any]:
     """Get details of a specific sent share.
 
     Args:
         sent_share_id: The sent share ID
     """
-    return Share().shareGetSentShare({"--sent-share-id": sent_share_id})
+    return _get_sync_client(Share).shareGetSentShare({"--sent-share-id": sent_share_id})
 
 
 @mcp.tool()
+@_offload_sync
 def get_received_share(received_share_id: str) -> Dict[str, Any]:
     """Get details of a specific received share.
 
     Args:
         received_share_id: The received share ID
     """
-    return Share().shareGetReceivedShare({"--received-share-id": received_share_id})
+    return _get_sync_client(Share).shareGetReceivedShare({"--received-share-id": received_share_id})
 
 
 @mcp.tool()
+@_offload_sync
 def list_sent_invitations(sent_share_id: str) -> Dict[str, Any]:
     """List invitations sent for a specific data share.
 
     Args:
         sent_share_id: The sent share ID
     """
-    return Share().shareListSentInvitations({"--sent-share-id": sent_share_id})
+    return _get_sync_client(Share).shareListSentInvitations({"--sent-share-id": sent_share_id})
 
 
 @mcp.tool()
+@_offload_sync
 def list_received_invitations() -> Dict[str, Any]:
     """List all pending data share invitations you have received."""
-    return Share().shareListReceivedInvitations({})
+    return _get_sync_client(Share).shareListReceivedInvitations({})
 
 
 # ============================================================================
@@ -1643,52 +1861,58 @@ def list_received_invitations() -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_offload_sync
 def list_quality_domains() -> Dict[str, Any]:
     """List all data quality domains configured in the account."""
-    return DataQuality().list_domains({})
+    return _get_sync_client(DataQuality).list_domains({})
 
 
 @mcp.tool()
+@_offload_sync
 def get_quality_domain_report(domain_id: str) -> Dict[str, Any]:
     """Get a quality report for a specific data quality domain.
 
     Args:
         domain_id: The data quality domain ID
     """
-    return DataQuality().get_domain_report({"--domain-id": domain_id})
+    return _get_sync_client(DataQuality).get_domain_report({"--domain-id": domain_id})
 
 
 @mcp.tool()
+@_offload_sync
 def list_quality_connections(domain_id: str) -> Dict[str, Any]:
     """List all data source connections in a quality domain.
 
     Args:
         domain_id: The data quality domain ID
     """
-    return DataQuality().list_connections({"--domain-id": domain_id})
+    return _get_sync_client(DataQuality).list_connections({"--domain-id": domain_id})
 
 
 @mcp.tool()
+@_offload_sync
 def list_quality_rules(domain_id: str) -> Dict[str, Any]:
     """List all data quality rules defined in a domain.
 
     Args:
         domain_id: The data quality domain ID
     """
-    return DataQuality().list_rules({"--domain-id": domain_id})
+    return _get_sync_client(DataQuality).list_rules({"--domain-id": domain_id})
 
 
 @mcp.tool()
+@_offload_sync
 def get_quality_score(domain_id: str) -> Dict[str, Any]:
     """Get the overall data quality score for a domain.
 
     Args:
         domain_id: The data quality domain ID
     """
-    return DataQuality().get_quality_score({"--domain-id": domain_id})
+    return _get_sync_client(DataQuality).get_quality_score({"--domain-id": domain_id})
 
 
 @mcp.tool()
+@_offload_sync
 def run_quality_scan(domain_id: str, scan_id: str) -> Dict[str, Any]:
     """Trigger a data quality scan run.
 
@@ -1696,21 +1920,23 @@ def run_quality_scan(domain_id: str, scan_id: str) -> Dict[str, Any]:
         domain_id: The data quality domain ID
         scan_id: The scan configuration ID to run
     """
-    return DataQuality().run_scan({"--domain-id": domain_id, "--scan-id": scan_id})
+    return _get_sync_client(DataQuality).run_scan({"--domain-id": domain_id, "--scan-id": scan_id})
 
 
 @mcp.tool()
+@_offload_sync
 def list_quality_scans(domain_id: str) -> Dict[str, Any]:
     """List all data quality scan configurations in a domain.
 
     Args:
         domain_id: The data quality domain ID
     """
-    return DataQuality().list_scans({"--domain-id": domain_id})
+    return _get_sync_client(DataQuality).list_scans({"--domain-id": domain_id})
 
 
 def main() -> None:
     cfg = PurviewMCPConfig.from_env()
+    _get_operation_catalog()
 
     if cfg.transport == "stdio":
         logging.info("Starting Purview MCP Server (transport=stdio)")